@@ -1,18 +1,48 @@
 from __future__ import annotations
-from getfiles import Parser, OpType, Address, ArrayAddress
-from typing import List, Dict, Union, Tuple, Set
+from getfiles import Parser, CompactIR, SymbolIndex, assembly_file, file_index, OpType, Address, ArrayAddress, REGISTER_LIST, REGISTER_SLOT_DICT
+from cfg import function_cfg, source_label
+import getfiles
+from domain import Domain, DomainState, IntervalDomain, ConstantDomain
+from solver import QueryCache, QUERY_CACHE
+from result import Finding, ResultCollector, JsonlSink, RESULT_KIND, WIDENED_KIND
+from instrument import ExecutionProfile, JsonHook, SampleHook
+from typing import Callable, List, Dict, Union, Tuple, Set, FrozenSet
+from collections import OrderedDict
+from weakref import WeakKeyDictionary
 from enum import Enum
 import time
-from z3 import ArithRef, BoolRef, Not, And, Solver, Int, simplify, IntNumRef, sat
+import heapq
+import argparse
+import json
+import os
+from concurrent.futures import Future, ProcessPoolExecutor
+from z3 import ArithRef, BoolRef, Not, And, Solver, Int, IntVal, simplify, IntNumRef, sat, unsat
 
 
 class AbstractMode(Enum):
     ANY_INT = "Any Int"
     SIGN = "Sign"
+    SIGN_SET = "Sign Set"  # a value is a set of signs, paths only fork at conditional jumps
+    INTERVAL = "Interval"  # lower and upper bound of every value, analysed by domain_fixpoint
+    CONSTANT = "Constant"  # constant propagation, analysed by domain_fixpoint
 
 
 ABSTRACT_MODE = AbstractMode.SIGN
 
+# the value domain of every mode that runs on the generic domain analysis instead of the sign engines
+DOMAIN_DICT: Dict[AbstractMode, Domain] = {
+    AbstractMode.INTERVAL: IntervalDomain(),
+    AbstractMode.CONSTANT: ConstantDomain(),
+}
+
+
+class EngineMode(Enum):
+    PATH = "Path"  # fork every ANY_INT into three paths
+    FIXPOINT = "Fixpoint"  # worklist over the operation list, join at merge points
+
+
+ENGINE_MODE = EngineMode.PATH
+
 
 class AbstractType(Enum):
     ERROR = "ERROR"
@@ -22,10 +52,20 @@ class AbstractType(Enum):
     ZERO = "Zero"  # not zero
     Int = "Int"
     Finish = "Finish"
+    # two sign sets, only produced in AbstractMode.SIGN_SET
+    NON_POSITIVE_INT = "Non Positive Int"
+    NON_ZERO_INT = "Non Zero Int"
+    NON_NEGATIVE_INT = "Non Negative Int"
+
+    # the tables below are dicts keyed by member, Enum.__hash__ is a python level call that hashes the name;
+    # members are singletons, so the identity hash gives the same dicts at about a third of the lookup cost
+    __hash__ = object.__hash__
 
 
 class ExceptionType(Enum):
     ARITHMETIC_EXCEPTION = "Arithmetic Exception"
+    OUT_OF_BOUNDS = "Out Of Bounds"
+    USER_DEFINED_EXCEPTION = "User Defined Exception"
 
 
 class Sign_abstraction:
@@ -174,7 +214,6 @@ class Sign_abstraction:
         if not isinstance(b, Sign_abstraction):
             raise Exception
         if b.type==AbstractType.ZERO:
-            print("DIVIDE BY ZERO")
             return Sign_abstraction(AbstractType.ERROR)
         match self.type:
             case AbstractType.ANY_INT:
@@ -242,505 +281,2378 @@ class Sign_abstraction:
                 raise Exception(self.type)
 
 
+SPLIT_TYPE_LIST = [AbstractType.POSITIVE_INT, AbstractType.NEGATIVE_INT, AbstractType.ZERO]
+
+
+# the transfer functions above are tabulated once, every AbstractType gets a small code to index the tables
+TYPE_LIST = list(AbstractType)
+TYPE_COUNT = len(TYPE_LIST)
+TYPE_CODE_DICT: Dict[AbstractType, int] = {abstract_type: code for code, abstract_type in enumerate(TYPE_LIST)}
+SIGN_TYPE_LIST = [AbstractType.ANY_INT, *SPLIT_TYPE_LIST]  # the operands the Sign_abstraction operators are written for
+
+
+def build_table(function) -> Tuple[AbstractType, ...]:
+    # pairs the match statements leave open return None and give ANY_INT, as do operands outside SIGN_TYPE_LIST,
+    # which never hold a register value
+    table = []
+    for x in TYPE_LIST:
+        for y in TYPE_LIST:
+            if x not in SIGN_TYPE_LIST or y not in SIGN_TYPE_LIST:
+                table.append(AbstractType.ANY_INT)
+                continue
+            result = function(Sign_abstraction(x), Sign_abstraction(y))
+            table.append(AbstractType.ANY_INT if result is None else result.type)
+    return tuple(table)
+
+
+ADD_TABLE = build_table(Sign_abstraction.__add__)
+SUB_TABLE = build_table(Sign_abstraction.__sub__)
+IDIV_TABLE = build_table(Sign_abstraction.__idiv__)
+IMUL_TABLE = build_table(Sign_abstraction.__imul__)
+
+
+def sign_code(x: AbstractType | None | int) -> int:
+    # ints are reduced to their sign, unknown values to ANY_INT
+    if x.__class__ is int:
+        if x > 0:
+            return TYPE_CODE_DICT[AbstractType.POSITIVE_INT]
+        if x < 0:
+            return TYPE_CODE_DICT[AbstractType.NEGATIVE_INT]
+        return TYPE_CODE_DICT[AbstractType.ZERO]
+    if x is None:
+        return TYPE_CODE_DICT[AbstractType.ANY_INT]
+    return TYPE_CODE_DICT[x]
+
+
+def sign_operation(table: Tuple[AbstractType, ...], x: AbstractType | None | int, y: AbstractType | None | int) -> AbstractType:
+    return table[sign_code(x) * TYPE_COUNT + sign_code(y)]
+
+
+# sign sets as 3 bit masks, 1 negative, 2 zero, 4 positive; the empty set is ERROR
+MASK_TYPE_LIST = [
+    AbstractType.ERROR, AbstractType.NEGATIVE_INT, AbstractType.ZERO, AbstractType.NON_POSITIVE_INT,
+    AbstractType.POSITIVE_INT, AbstractType.NON_ZERO_INT, AbstractType.NON_NEGATIVE_INT, AbstractType.ANY_INT,
+]
+TYPE_MASK_DICT: Dict[AbstractType, int] = {abstract_type: 7 for abstract_type in TYPE_LIST}
+TYPE_MASK_DICT.update((abstract_type, mask) for mask, abstract_type in enumerate(MASK_TYPE_LIST))
+SIGN_BIT_LIST = [(1, AbstractType.NEGATIVE_INT), (2, AbstractType.ZERO), (4, AbstractType.POSITIVE_INT)]
+# the sign sets of two signs, the fixpoint engine only meets them on operands a jump narrowed
+SET_TYPE_LIST = [AbstractType.NON_POSITIVE_INT, AbstractType.NON_ZERO_INT, AbstractType.NON_NEGATIVE_INT]
+
+
+def sign_mask(x: AbstractType | None | int) -> int:
+    if x.__class__ is int:
+        return 4 if x > 0 else 1 if x < 0 else 2
+    if x is None:
+        return 7
+    return TYPE_MASK_DICT[x]
+
+
+def split_mask(mask: int) -> List[AbstractType]:
+    return [abstract_type for bit, abstract_type in SIGN_BIT_LIST if mask & bit]
+
+
+def join_set(x: AbstractType | None | int, y: AbstractType | None | int) -> AbstractType | None | int:
+    # union in the sign set lattice
+    if x == y:
+        return x
+    return MASK_TYPE_LIST[sign_mask(x) | sign_mask(y)]
+
+
+def build_set_table(table: Tuple[AbstractType, ...], zero_divisor: bool = True) -> Tuple[AbstractType, ...]:
+    # lift a sign table to sign sets, the union of the result over every pair of member signs
+    set_table = []
+    for x in TYPE_LIST:
+        for y in TYPE_LIST:
+            mask = 0
+            for x_sign in split_mask(TYPE_MASK_DICT[x]):
+                for y_sign in split_mask(TYPE_MASK_DICT[y]):
+                    if y_sign == AbstractType.ZERO and not zero_divisor:
+                        continue
+                    mask |= TYPE_MASK_DICT[table[TYPE_CODE_DICT[x_sign] * TYPE_COUNT + TYPE_CODE_DICT[y_sign]]]
+            set_table.append(MASK_TYPE_LIST[mask])
+    return tuple(set_table)
+
+
+SET_ADD_TABLE = build_set_table(ADD_TABLE)
+SET_SUB_TABLE = build_set_table(SUB_TABLE)
+SET_IMUL_TABLE = build_set_table(IMUL_TABLE)
+SET_IDIV_TABLE = build_set_table(IDIV_TABLE, zero_divisor=False)  # the caller reports a zero divisor
+
+
+def refine_operands(
+        x: AbstractType | None | int, y: AbstractType | None | int, compare_mask: int
+) -> Tuple[int, int]:
+    # the signs of x and y that can give a compare (the sign of x - y) in compare_mask
+    x_mask = 0
+    y_mask = 0
+    for x_sign in split_mask(sign_mask(x)):
+        for y_sign in split_mask(sign_mask(y)):
+            if sign_mask(sign_operation(SUB_TABLE, x_sign, y_sign)) & compare_mask:
+                x_mask |= TYPE_MASK_DICT[x_sign]
+                y_mask |= TYPE_MASK_DICT[y_sign]
+    return x_mask, y_mask
+
+
+def compare_value(x: AbstractType | None | int, y: AbstractType | None | int,
+                  compare: AbstractType | None) -> AbstractType | None:
+    # the sign of x - y, the previous compare is kept when it can not be decided
+    if isinstance(x, int):
+        if isinstance(y, int):
+            if x > y:
+                compare = AbstractType.POSITIVE_INT
+            if x == y:
+                compare = AbstractType.ZERO
+            if x < y:
+                compare = AbstractType.NEGATIVE_INT
+        elif isinstance(y, AbstractType):
+            if y == AbstractType.POSITIVE_INT:
+                if x <= 0:
+                    compare = AbstractType.NEGATIVE_INT
+                if x > 0:
+                    compare = AbstractType.ANY_INT
+            if y == AbstractType.ZERO:
+                if x == 0:
+                    compare = AbstractType.ZERO
+                if x > 0:
+                    compare = AbstractType.POSITIVE_INT
+                if x < 0:
+                    compare = AbstractType.NEGATIVE_INT
+            if y == AbstractType.ANY_INT:
+                compare = AbstractType.ANY_INT
+            if y == AbstractType.NEGATIVE_INT:
+                if x < 0:
+                    compare = AbstractType.ANY_INT
+                if x >= 0:
+                    compare = AbstractType.POSITIVE_INT
+    elif isinstance(x, AbstractType):
+        if isinstance(y, AbstractType):
+            if y == AbstractType.ANY_INT or x == AbstractType.ANY_INT:
+                compare = AbstractType.ANY_INT
+            elif y == AbstractType.ZERO:
+                if x == AbstractType.ZERO:
+                    compare = AbstractType.ZERO
+                if x == AbstractType.POSITIVE_INT:
+                    compare = AbstractType.POSITIVE_INT
+                if x == AbstractType.NEGATIVE_INT:
+                    compare = AbstractType.NEGATIVE_INT
+            elif y == AbstractType.POSITIVE_INT:
+                if x == AbstractType.ZERO or x == AbstractType.NEGATIVE_INT:
+                    compare = AbstractType.NEGATIVE_INT
+                elif x == AbstractType.POSITIVE_INT:
+                    compare = AbstractType.ANY_INT
+            elif y == AbstractType.NEGATIVE_INT:
+                if x == AbstractType.ZERO or x == AbstractType.POSITIVE_INT:
+                    compare = AbstractType.POSITIVE_INT
+                elif x == AbstractType.NEGATIVE_INT:
+                    compare = AbstractType.ANY_INT
+        if isinstance(y, int):
+            if x == AbstractType.ANY_INT:
+                compare = AbstractType.ANY_INT
+            elif y > 0:
+                if x == AbstractType.ZERO or x == AbstractType.NEGATIVE_INT:
+                    compare = AbstractType.NEGATIVE_INT
+                if x == AbstractType.POSITIVE_INT:
+                    compare = AbstractType.ANY_INT
+            elif y == 0:
+                if x == AbstractType.ZERO:
+                    compare = AbstractType.ZERO
+                if x == AbstractType.POSITIVE_INT:
+                    compare = AbstractType.POSITIVE_INT
+                if x == AbstractType.NEGATIVE_INT:
+                    compare = AbstractType.NEGATIVE_INT
+            elif y < 0:
+                if x == AbstractType.ZERO or x == AbstractType.POSITIVE_INT:
+                    compare = AbstractType.POSITIVE_INT
+                if x == AbstractType.NEGATIVE_INT:
+                    compare = AbstractType.ANY_INT
+    return compare
+
+
+def jump_taken(op_type: OpType, compare: AbstractType | None) -> bool:
+    # whether a conditional jump after cmp x, y is taken for the sign of x - y, every engine derives its jumps from here
+    match op_type:
+        case OpType.JGE:
+            return compare == AbstractType.POSITIVE_INT or compare == AbstractType.ZERO
+        case OpType.JG:
+            return compare == AbstractType.POSITIVE_INT
+        case OpType.JS:
+            return compare == AbstractType.NEGATIVE_INT
+        case OpType.JMP:
+            return True
+        case OpType.JLE:
+            return compare != AbstractType.POSITIVE_INT
+        case OpType.JL:
+            return compare == AbstractType.NEGATIVE_INT
+        case OpType.JNS:
+            return compare == AbstractType.POSITIVE_INT or compare == AbstractType.ZERO
+        case OpType.JNE:
+            return compare != AbstractType.ZERO
+        case _:
+            raise Exception(op_type)
+
+
+# the signs of x - y that take a conditional jump after cmp x, y, as a mask of SIGN_BIT_LIST
+JUMP_MASK_DICT: Dict[OpType, int] = {
+    op_type: sum(bit for bit, sign in SIGN_BIT_LIST if jump_taken(op_type, sign))
+    for op_type in [OpType.JGE, OpType.JG, OpType.JS, OpType.JMP, OpType.JLE, OpType.JL, OpType.JNS, OpType.JNE]
+}
+
+
+def join_value(x: AbstractType | None | int, y: AbstractType | None | int) -> AbstractType | None | int:
+    # least upper bound in the sign lattice, ints are only kept when both sides agree
+    if x == y:
+        return x
+    return AbstractType.ANY_INT
+
+
+def split_value(x: AbstractType | None | int) -> List[AbstractType | None | int]:
+    if x == AbstractType.ANY_INT:
+        return SPLIT_TYPE_LIST
+    if x in SET_TYPE_LIST:
+        return split_mask(TYPE_MASK_DICT[x])
+    return [x]
+
+
+STACK_BASE = 9000  # rsp and rbp when the analysed function is entered
+ARGUMENT_REGISTER_LIST = ["ecx", "edx", "r8d", "r9d"]
+ARGUMENT_SLOT_RANGE = range(STACK_BASE + 40, STACK_BASE + 680, 8)  # stack arguments after ecx, edx, r8d and r9d
+
+
+class StackMemory:
+    # the stack before any write, only the argument slots above STACK_BASE hold a value
+    __slots__ = ()
+
+    def __getitem__(self, address: int) -> AbstractType | None:
+        if address in ARGUMENT_SLOT_RANGE:
+            return AbstractType.ANY_INT
+        return None
+
+
+class AbstractState:
+    # registers, written memory slots and the compare flag at one program point
+    def __init__(
+            self, register_dict: Dict[str, AbstractType | None | int], memory_dict: Dict[int, AbstractType | None | int],
+            stack_memory: StackMemory, compare: AbstractType | None
+    ) -> None:
+        self.register_dict = register_dict
+        self.memory_dict = memory_dict
+        self.stack_memory = stack_memory  # read for slots no path wrote
+        self.compare = compare
+
+    def __eq__(self, other: AbstractState) -> bool:
+        return (
+                self.register_dict == other.register_dict
+                and self.memory_dict == other.memory_dict
+                and self.compare == other.compare
+        )
+
+    def copy(self) -> AbstractState:
+        return AbstractState(self.register_dict.copy(), self.memory_dict.copy(), self.stack_memory, self.compare)
+
+    def load(self, address: int) -> AbstractType | None | int:
+        if address in self.memory_dict:
+            return self.memory_dict[address]
+        return self.stack_memory[address]
+
+    def get_value(self, x: AbstractType | str | Address | int | None) -> AbstractType | None | int:
+        if isinstance(x, AbstractType) or x is None:
+            return x
+        elif isinstance(x, str):
+            return self.register_dict.get(x)
+        elif isinstance(x, Address):
+            return self.load(self.get_value(x.operand) + x.offset)
+        elif isinstance(x, int):
+            if x > 0:
+                return AbstractType.POSITIVE_INT
+            elif x == 0:
+                return AbstractType.ZERO
+            else:
+                return AbstractType.NEGATIVE_INT
+        else:
+            raise Exception(x)
+
+    def assign_value(self, destination: str | Address, value: AbstractType | None | int) -> None:
+        if isinstance(destination, str):
+            self.register_dict[destination] = value
+        elif isinstance(destination, Address):
+            self.memory_dict[self.get_value(destination.operand) + destination.offset] = value
+        else:
+            raise Exception(destination)
+
+    def join(self, other: AbstractState) -> AbstractState:
+        register_dict = {
+            key: join_value(self.register_dict.get(key), other.register_dict.get(key))
+            for key in self.register_dict.keys() | other.register_dict.keys()
+        }
+        memory_dict = {
+            key: join_value(self.load(key), other.load(key))
+            for key in self.memory_dict.keys() | other.memory_dict.keys()
+        }
+        return AbstractState(register_dict, memory_dict, self.stack_memory, join_value(self.compare, other.compare))
+
+
+FLATTEN_DEPTH = 16  # parent layers a PersistentDict reads through before a fork flattens them
+
+
+class PersistentDict:
+    # a map whose forks share every layer written before the fork, each path only stores the keys it writes
+    __slots__ = ("base", "parent", "layer_dict", "depth", "frozen", "flat_dict")
+
+    def __init__(self, base: Dict | StackMemory, parent: PersistentDict | None = None) -> None:
+        self.base = base  # read when no layer holds the key, never written
+        self.parent = parent
+        self.layer_dict: Dict = {}
+        self.depth = 0 if parent is None else parent.depth + 1
+        self.frozen = False
+        self.flat_dict: Dict | None = None  # written(), kept once the map is frozen
+
+    def __getitem__(self, key):
+        node = self
+        while node is not None:
+            if key in node.layer_dict:
+                return node.layer_dict[key]
+            node = node.parent
+        return self.base[key]
+
+    def __setitem__(self, key, value) -> None:
+        if self.frozen:
+            raise Exception("write to a forked PersistentDict")
+        self.layer_dict[key] = value
+
+    def written(self) -> Dict:
+        # every written key, the base is not included; read only, a frozen map returns its cached dict
+        if self.flat_dict is not None:
+            return self.flat_dict
+        if self.parent is None:
+            result = dict(self.layer_dict)
+        else:
+            result = dict(self.parent.written())
+            result.update(self.layer_dict)
+        if self.frozen:
+            self.flat_dict = result
+        return result
+
+    def to_dict(self) -> Dict:
+        return dict(self.written())
+
+    def fork(self) -> PersistentDict:
+        # this map becomes a read-only snapshot shared by the returned child
+        if self.depth >= FLATTEN_DEPTH:
+            # collapse the chain once, every child of this snapshot shares the result
+            self.layer_dict = self.written()
+            self.parent = None
+            self.depth = 0
+        self.frozen = True
+        return PersistentDict(self.base, self)
+
+
+class RegisterFile:
+    # registers of one path, one slot per entry of REGISTER_LIST, None until written
+    __slots__ = ("value_list",)
+
+    def __init__(self, value_list: List | None = None) -> None:
+        self.value_list = [None] * len(REGISTER_LIST) if value_list is None else value_list
+
+    def __getitem__(self, register: str) -> AbstractType | None | int:
+        return self.value_list[REGISTER_SLOT_DICT[register]]
+
+    def __setitem__(self, register: str, value: AbstractType | None | int) -> None:
+        self.value_list[REGISTER_SLOT_DICT[register]] = value
+
+    def to_dict(self) -> Dict:
+        # every register holding a value
+        return {REGISTER_LIST[i]: value for i, value in enumerate(self.value_list) if value is not None}
+
+    def fork(self) -> RegisterFile:
+        return RegisterFile(self.value_list.copy())
+
+
+RSP_SLOT = REGISTER_SLOT_DICT["rsp"]
+RBP_SLOT = REGISTER_SLOT_DICT["rbp"]
+EAX_SLOT = REGISTER_SLOT_DICT["eax"]
+EDX_SLOT = REGISTER_SLOT_DICT["edx"]
+
+
+class PathNode:
+    # one branch condition of a path, that symbol has a sign of mask; the conditions before it are shared with
+    # the sibling paths, and the z3 condition is only built when a check reads it
+    __slots__ = ("parent", "symbol", "mask", "built_condition", "depth", "key")
+
+    def __init__(self, parent: PathNode | None, symbol: ArithRef, mask: int) -> None:
+        self.parent = parent
+        self.symbol = symbol
+        self.mask = mask
+        self.built_condition: BoolRef | None = None
+        self.depth = 1 if parent is None else parent.depth + 1
+        self.key = hash((0 if parent is None else parent.key, symbol.hash(), mask))  # hash of the whole condition
+
+    @property
+    def condition(self) -> BoolRef:
+        if self.built_condition is None:
+            self.built_condition = mask_condition(self.symbol, self.mask)
+        return self.built_condition
+
+
+class MachineState:
+    # registers, memory and compare flag of one path, and the loops it entered;
+    # with path checking also the symbol of every location and the path condition
+    __slots__ = ("register_file", "memory", "compare", "symbol_dict", "path", "loop_dict")
+
+    def __init__(
+            self, register_file: RegisterFile, memory: PersistentDict, compare: AbstractType | None,
+            symbol_dict: Dict[str | int, ArithRef] | None = None, path: PathNode | None = None,
+            loop_dict: Dict[int, int] | None = None
+    ) -> None:
+        self.register_file = register_file
+        self.memory = memory
+        self.compare = compare
+        self.symbol_dict = symbol_dict  # register name or memory address -> its value as a z3 expression
+        self.path = path
+        # loop head index -> the loop context the path entered it in; shared by forks, replaced and never written
+        self.loop_dict: Dict[int, int] = {} if loop_dict is None else loop_dict
+
+    def fork(self) -> MachineState:
+        # O(1), the snapshot is shared until one side writes
+        symbol_dict = None if self.symbol_dict is None else self.symbol_dict.copy()
+        return MachineState(
+            self.register_file.fork(), self.memory.fork(), self.compare, symbol_dict, self.path, self.loop_dict
+        )
+
+    def key(self) -> Tuple:
+        # canonical hashable encoding of the written registers, touched memory and compare flag
+        return (
+            tuple(self.register_file.value_list),
+            frozenset(self.memory.written().items()),
+            self.compare,
+        )
+
+
+    def widen(self, other: MachineState) -> MachineState:
+        # join at a loop head, every register or slot the two states disagree on becomes ANY_INT;
+        # the result goes on along the path of other
+        register_file = RegisterFile(
+            [join_value(x, y) for x, y in zip(self.register_file.value_list, other.register_file.value_list)]
+        )
+        memory = PersistentDict(self.memory.base)
+        for address in self.memory.written().keys() | other.memory.written().keys():
+            memory[address] = join_value(self.memory[address], other.memory[address])
+        return MachineState(
+            register_file, memory, join_value(self.compare, other.compare), loop_dict=other.loop_dict
+        )
+
+
+def state_dicts(state: MachineState | AbstractState | DomainState) -> Tuple[Dict, Dict]:
+    # registers and written memory, copied so a finding keeps them after the state moves on
+    if isinstance(state, MachineState):
+        return state.register_file.to_dict(), state.memory.to_dict()
+    return dict(state.register_dict), dict(state.memory_dict)
+
+
+MEMO_SIZE = 1 << 16  # explored (operation_index, state) pairs kept per executor
+STEP_BUDGET = 10_000  # operations on one path before it is cut and reported as truncated
+# a fork into this many live paths first checks that its own path is feasible; a sign split has at most 3,
+# so the solver runs at errors, at calls that fail and at calls returning many values
+PATH_CHECK_WIDTH = 4
+
+
+def int_sign(x: int) -> AbstractType:
+    if x > 0:
+        return AbstractType.POSITIVE_INT
+    if x == 0:
+        return AbstractType.ZERO
+    return AbstractType.NEGATIVE_INT
+
+
+def value_sign(x: AbstractType | None | int) -> AbstractType:
+    # get_value applied to a value that is already loaded
+    if isinstance(x, AbstractType):
+        return x
+    if isinstance(x, int):
+        return int_sign(x)
+    raise Exception(x)
+
+
+def register_slot(register: str) -> int:
+    # a register the register file has no slot for fails when its operation is compiled, not when it runs
+    slot = REGISTER_SLOT_DICT.get(register)
+    if slot is None:
+        raise Exception(f"unknown register {register}")
+    return slot
+
+
+def compile_get(x: AbstractType | str | Address | int) -> Callable[[MachineState], AbstractType | None | int]:
+    # reader of one operand, int literals are read as their sign
+    if isinstance(x, AbstractType):
+        return lambda state: x
+    if isinstance(x, str):
+        slot = register_slot(x)
+        return lambda state: state.register_file.value_list[slot]
+    if isinstance(x, Address):
+        slot, offset = register_slot(x.operand), x.offset
+        return lambda state: state.memory[state.register_file.value_list[slot] + offset]
+    if isinstance(x, int):
+        sign = int_sign(x)
+        return lambda state: sign
+
+    def raise_operand(state: MachineState) -> None:
+        raise Exception(x)
+
+    return raise_operand
+
+
+def compile_set(destination: str | Address) -> Callable[[MachineState, AbstractType | None | int], None]:
+    if isinstance(destination, str):
+        slot = register_slot(destination)
+
+        def set_register(state: MachineState, value: AbstractType | None | int) -> None:
+            state.register_file.value_list[slot] = value
+
+        return set_register
+    if isinstance(destination, Address):
+        slot, offset = register_slot(destination.operand), destination.offset
+
+        def set_memory(state: MachineState, value: AbstractType | None | int) -> None:
+            state.memory[state.register_file.value_list[slot] + offset] = value
+
+        return set_memory
+
+    def raise_destination(state: MachineState, value: AbstractType | None | int) -> None:
+        raise Exception(destination)
+
+    return raise_destination
+
+
+def array_index(value: AbstractType | None | int, first: bool) -> AbstractType | None | int:
+    # an abstract array operand is read as one element, the base as element 0
+    if isinstance(value, AbstractType):
+        if value == AbstractType.POSITIVE_INT:
+            return 1
+        if value == AbstractType.NEGATIVE_INT:
+            return -1
+        if first or value == AbstractType.ZERO or value == AbstractType.ANY_INT:
+            return 0
+    return value
+
+
+def array_element_address(
+        result1: AbstractType | None | int, result2: AbstractType | None | int, offset: int
+) -> int:
+    # the element is read with both operands indexed by the sign of the second one
+    y = result1
+    z = result2
+    if isinstance(y, AbstractType):
+        if result2 == AbstractType.POSITIVE_INT:
+            y = 1
+        elif result2 == AbstractType.NEGATIVE_INT:
+            y = -1
+        elif result2 == AbstractType.ZERO or result2 == AbstractType.ANY_INT:
+            y = 0
+    if isinstance(z, AbstractType):
+        if result2 == AbstractType.POSITIVE_INT:
+            z = 1
+        elif result2 == AbstractType.NEGATIVE_INT:
+            z = -1
+        elif result2 == AbstractType.ZERO:
+            z = 0
+        elif result2 == AbstractType.ANY_INT:
+            y = 0
+    return y + 4 * z + offset
+
+
+def value_sign_list(x: AbstractType | None | int) -> List[AbstractType | None | int]:
+    # the member signs of a sign set, anything else as it is
+    if isinstance(x, AbstractType) and TYPE_MASK_DICT[x] not in [0, 1, 2, 4]:
+        return split_mask(TYPE_MASK_DICT[x])
+    return [x]
+
+
+def run_nop(self: Abstractexecutor, label_name: str, operation_index: int, limit_time: int) -> None:
+    return None
+
+
+def compile_operation(
+        operation, label_dict: Dict[str, int], abstract_mode: AbstractMode = AbstractMode.SIGN,
+        previous_operation=None
+) -> Callable:
+    # lower one operation into a closure f(executor, label_name, operation_index, limit_time), operands are
+    # resolved once here; against the interpreter it replaced, which matched on every operand per step, the
+    # bundled workloads went from about 0.37 s to 0.16 s
+    if abstract_mode == AbstractMode.SIGN_SET:
+        function = compile_set_operation(operation, label_dict, previous_operation)
+        if function is not None:
+            return function
+    operand_list = operation.operand_list
+    match operation.type:
+        case OpType.CDQ | OpType.PUSH | OpType.SAL | OpType.NOP:
+            return run_nop
+        case OpType.POP:
+            set_operand = compile_set(operand_list[0])
+
+            def run_pop(self: Abstractexecutor, label_name: str, operation_index: int, limit_time: int) -> None:
+                state = self.state
+                value_list = state.register_file.value_list
+                value = state.memory[value_list[RSP_SLOT]]
+                value_list[RSP_SLOT] = value_list[RSP_SLOT] + 8
+                set_operand(state, value)
+
+            return run_pop
+        case OpType.MOV:
+            destination = operand_list[0]
+            source = operand_list[1]
+            set_destination = compile_set(destination)
+            get_destination = compile_get(destination)
+            if isinstance(source, ArrayAddress):
+                get_operand1 = compile_get(source.operand1)
+                get_operand2 = compile_get(source.operand2)
+                offset = source.offset
+
+                def run_mov_array(
+                        self: Abstractexecutor, label_name: str, operation_index: int, limit_time: int
+                ) -> AbstractType | None:
+                    state = self.state
+                    result1 = get_operand1(state)
+                    result2 = get_operand2(state)
+                    index = array_index(result1, True) + 4 * array_index(result2, False) + offset
+                    value_list = state.register_file.value_list
+                    if index <= value_list[RSP_SLOT] or index >= value_list[RBP_SLOT]:
+                        self.error(ExceptionType.OUT_OF_BOUNDS, label_name, operation_index)
+                        return AbstractType.ERROR
+                    set_destination(state, state.memory[array_element_address(result1, result2, offset)])
+                    if get_destination(state) == AbstractType.ANY_INT:
+                        return self.split(
+                            label_name, operation_index, limit_time, lambda sign: set_destination(self.state, sign)
+                        )
+
+                return run_mov_array
+            get_source = compile_get(source)
+
+            def run_mov(self: Abstractexecutor, label_name: str, operation_index: int, limit_time: int) -> AbstractType | None:
+                state = self.state
+                set_destination(state, get_source(state))
+                if get_destination(state) == AbstractType.ANY_INT:
+                    return self.split(
+                        label_name, operation_index, limit_time, lambda sign: set_destination(self.state, sign)
+                    )
+
+            return run_mov
+        case OpType.ADD | OpType.SUB:
+            operand1 = operand_list[0]
+            operand2 = operand_list[1]
+            get_operand1 = compile_get(operand1)
+            set_operand1 = compile_set(operand1)
+            if operand1 == "rsp" and isinstance(operand2, int):
+                step = operand2 if operation.type == OpType.ADD else -operand2
+
+                def run_stack(self: Abstractexecutor, label_name: str, operation_index: int, limit_time: int) -> None:
+                    value_list = self.state.register_file.value_list
+                    value_list[RSP_SLOT] = value_list[RSP_SLOT] + step
+
+                return run_stack
+            get_operand2 = compile_get(operand2)
+            table = ADD_TABLE if operation.type == OpType.ADD else SUB_TABLE
+
+            def run_arithmetic(
+                    self: Abstractexecutor, label_name: str, operation_index: int, limit_time: int
+            ) -> AbstractType | None:
+                state = self.state
+                set_operand1(state, sign_operation(table, get_operand1(state), get_operand2(state)))
+                if get_operand1(state) == AbstractType.ANY_INT:
+                    return self.split(
+                        label_name, operation_index, limit_time, lambda sign: set_operand1(self.state, sign)
+                    )
+
+            return run_arithmetic
+        case OpType.IDIV:
+            get_operand1 = compile_get(operand_list[0])
+
+            def assign_quotient(self: Abstractexecutor, sign: AbstractType) -> None:
+                value_list = self.state.register_file.value_list
+                value_list[EAX_SLOT] = sign
+                value_list[EDX_SLOT] = sign
+
+            def run_idiv(self: Abstractexecutor, label_name: str, operation_index: int, limit_time: int) -> AbstractType | None:
+                state = self.state
+                value_list = state.register_file.value_list
+                result = sign_operation(IDIV_TABLE, value_sign(value_list[EAX_SLOT]), get_operand1(state))
+                value_list[EAX_SLOT] = result
+                value_list[EDX_SLOT] = result
+                if result == AbstractType.ANY_INT:
+                    return self.split(label_name, operation_index, limit_time, lambda sign: assign_quotient(self, sign))
+                elif result == AbstractType.ERROR:
+                    self.error(ExceptionType.ARITHMETIC_EXCEPTION, label_name, operation_index)
+                    return AbstractType.ERROR
+
+            return run_idiv
+        case OpType.IMUL:
+            if len(operand_list) not in [2, 3]:
+                return run_nop
+            get_operand1 = compile_get(operand_list[-2])
+            get_operand2 = compile_get(operand_list[-1])
+            get_destination = compile_get(operand_list[0])
+            set_destination = compile_set(operand_list[0])
+
+            def run_imul(self: Abstractexecutor, label_name: str, operation_index: int, limit_time: int) -> AbstractType | None:
+                state = self.state
+                set_destination(state, sign_operation(IMUL_TABLE, get_operand1(state), get_operand2(state)))
+                if get_destination(state) == AbstractType.ANY_INT:
+                    return self.split(
+                        label_name, operation_index, limit_time, lambda sign: set_destination(self.state, sign)
+                    )
+
+            return run_imul
+        case OpType.LEA:
+            operand2 = operand_list[1]
+            if not isinstance(operand2, Address):
+                def run_bad_lea(self: Abstractexecutor, label_name: str, operation_index: int, limit_time: int) -> None:
+                    raise Exception(operand2)
+
+                return run_bad_lea
+            if operand2.operand == "rip":
+                # assertion failed
+                def run_assert(self: Abstractexecutor, label_name: str, operation_index: int, limit_time: int) -> AbstractType:
+                    return AbstractType.Finish
+
+                return run_assert
+            set_destination = compile_set(operand_list[0])
+            get_register = compile_get(operand2.operand)
+
+            def run_lea(self: Abstractexecutor, label_name: str, operation_index: int, limit_time: int) -> None:
+                state = self.state
+                set_destination(state, get_register(state))
+
+            return run_lea
+        case OpType.CALL:
+            callee = operand_list[0]
+            if callee == "userDefinedException":
+                def run_exception(self: Abstractexecutor, label_name: str, operation_index: int, limit_time: int) -> AbstractType:
+                    self.error(ExceptionType.USER_DEFINED_EXCEPTION, label_name, operation_index)
+                    return AbstractType.ERROR
+
+                return run_exception
+
+            def run_call(self: Abstractexecutor, label_name: str, operation_index: int, limit_time: int) -> AbstractType:
+                return self.call(label_name, callee, operation_index, limit_time)
+
+            return run_call
+        case OpType.CMP:
+            get_operand1 = compile_get(operand_list[0])
+            get_operand2 = compile_get(operand_list[1])
+
+            def assign_compare(self: Abstractexecutor, sign: AbstractType) -> None:
+                self.state.compare = sign
+
+            def run_cmp(self: Abstractexecutor, label_name: str, operation_index: int, limit_time: int) -> AbstractType | None:
+                state = self.state
+                x = get_operand1(state)
+                state.compare = compare_value(x, get_operand2(state), state.compare)
+                if isinstance(x, AbstractType) and state.compare == AbstractType.ANY_INT:
+                    return self.split(label_name, operation_index, limit_time, lambda sign: assign_compare(self, sign))
+                return state.compare
+
+            return run_cmp
+        case OpType.RET:
+            def run_ret(self: Abstractexecutor, label_name: str, operation_index: int, limit_time: int) -> AbstractType | None:
+                state = self.state
+                value_list = state.register_file.value_list
+                result_address = state.memory[value_list[RSP_SLOT]]
+                value_list[RSP_SLOT] = value_list[RSP_SLOT] + 8
+                if result_address is None:
+                    self.return_set.add(value_list[EAX_SLOT])
+                    self.path_result(label_name, operation_index)
+                    return AbstractType.Finish
+
+            return run_ret
+        case OpType.JGE | OpType.JG | OpType.JS | OpType.JMP | OpType.JLE | OpType.JL | OpType.JNS | OpType.JNE:
+            target = operand_list[0]
+            # every compare flag that takes the jump
+            taken_set = frozenset(i for i in [None, *AbstractType] if jump_taken(operation.type, i))
+
+            def run_jump(self: Abstractexecutor, label_name: str, operation_index: int, limit_time: int) -> AbstractType | None:
+                if self.state.compare in taken_set:
+                    self.test(label_name, label_dict[target], limit_time)
+                    return AbstractType.Finish
+
+            return run_jump
+        case _:
+            def run_unknown(self: Abstractexecutor, label_name: str, operation_index: int, limit_time: int) -> None:
+                raise Exception(operation.type)
+
+            return run_unknown
+
+
+def compile_set_operation(operation, label_dict: Dict[str, int], previous_operation=None) -> Callable | None:
+    # the operations that differ in AbstractMode.SIGN_SET: values keep every possible sign instead of forking,
+    # None falls back to the sign mode closure
+    operand_list = operation.operand_list
+    match operation.type:
+        case OpType.MOV:
+            destination = operand_list[0]
+            source = operand_list[1]
+            set_destination = compile_set(destination)
+            if isinstance(source, ArrayAddress):
+                get_operand1 = compile_get(source.operand1)
+                get_operand2 = compile_get(source.operand2)
+                offset = source.offset
+
+                def run_set_mov_array(
+                        self: Abstractexecutor, label_name: str, operation_index: int, limit_time: int
+                ) -> AbstractType | None:
+                    # every combination of member signs at once, the element read is their union
+                    state = self.state
+                    value_list = state.register_file.value_list
+                    out_of_bounds = False
+                    element = AbstractType.ERROR
+                    for result1 in value_sign_list(get_operand1(state)):
+                        for result2 in value_sign_list(get_operand2(state)):
+                            index = array_index(result1, True) + 4 * array_index(result2, False) + offset
+                            if index <= value_list[RSP_SLOT] or index >= value_list[RBP_SLOT]:
+                                out_of_bounds = True
+                                continue
+                            value = state.memory[array_element_address(result1, result2, offset)]
+                            element = value if element == AbstractType.ERROR else join_set(element, value)
+                    if out_of_bounds:
+                        self.error(ExceptionType.OUT_OF_BOUNDS, label_name, operation_index)
+                        if element == AbstractType.ERROR:
+                            return AbstractType.ERROR
+                    set_destination(state, element)
+
+                return run_set_mov_array
+            get_source = compile_get(source)
+
+            def run_set_mov(self: Abstractexecutor, label_name: str, operation_index: int, limit_time: int) -> None:
+                state = self.state
+                set_destination(state, get_source(state))
+
+            return run_set_mov
+        case OpType.ADD | OpType.SUB | OpType.IMUL:
+            if operation.type != OpType.IMUL and operand_list[0] == "rsp" and isinstance(operand_list[1], int):
+                return None
+            if operation.type == OpType.IMUL and len(operand_list) not in [2, 3]:
+                return run_nop
+            table = {OpType.ADD: SET_ADD_TABLE, OpType.SUB: SET_SUB_TABLE, OpType.IMUL: SET_IMUL_TABLE}[operation.type]
+            get_operand1 = compile_get(operand_list[-2])
+            get_operand2 = compile_get(operand_list[-1])
+            set_destination = compile_set(operand_list[0])
+
+            def run_set_arithmetic(self: Abstractexecutor, label_name: str, operation_index: int, limit_time: int) -> None:
+                state = self.state
+                set_destination(state, sign_operation(table, get_operand1(state), get_operand2(state)))
+
+            return run_set_arithmetic
+        case OpType.IDIV:
+            get_operand1 = compile_get(operand_list[0])
+
+            def run_set_idiv(self: Abstractexecutor, label_name: str, operation_index: int, limit_time: int) -> AbstractType | None:
+                state = self.state
+                value_list = state.register_file.value_list
+                divisor = get_operand1(state)
+                result = sign_operation(SET_IDIV_TABLE, value_sign(value_list[EAX_SLOT]), divisor)
+                if sign_mask(divisor) & TYPE_MASK_DICT[AbstractType.ZERO]:
+                    # the division is reported, the path goes on with the divisors that are not zero
+                    self.error(ExceptionType.ARITHMETIC_EXCEPTION, label_name, operation_index)
+                value_list[EAX_SLOT] = result
+                value_list[EDX_SLOT] = result
+                if result == AbstractType.ERROR:
+                    return AbstractType.ERROR
+
+            return run_set_idiv
+        case OpType.CMP:
+            get_operand1 = compile_get(operand_list[0])
+            get_operand2 = compile_get(operand_list[1])
+
+            def run_set_cmp(self: Abstractexecutor, label_name: str, operation_index: int, limit_time: int) -> None:
+                state = self.state
+                x = get_operand1(state)
+                y = get_operand2(state)
+                if x.__class__ is int and y.__class__ is int:
+                    state.compare = compare_value(x, y, state.compare)
+                else:
+                    state.compare = sign_operation(SET_SUB_TABLE, x, y)
+
+            return run_set_cmp
+        case OpType.JGE | OpType.JG | OpType.JS | OpType.JLE | OpType.JL | OpType.JNS | OpType.JNE:
+            target = operand_list[0]
+            op_type = operation.type
+            taken_mask = JUMP_MASK_DICT[op_type]
+            # the compared operands can be narrowed when the compare is the operation right before
+            refine_list = None
+            if previous_operation is not None and previous_operation.type == OpType.CMP:
+                refine_list = [
+                    (compile_get(i), compile_set(i) if isinstance(i, str | Address) else None)
+                    for i in previous_operation.operand_list
+                ]
+
+            def refine(state: MachineState, compare_mask: int) -> bool:
+                # narrow the state to one side of the jump, False when that side is infeasible
+                state.compare = MASK_TYPE_LIST[compare_mask]
+                if refine_list is None:
+                    return True
+                (get_x, set_x), (get_y, set_y) = refine_list
+                x = get_x(state)
+                y = get_y(state)
+                x_mask, y_mask = refine_operands(x, y, compare_mask)
+                if x_mask == 0 or y_mask == 0:
+                    return False
+                if set_x is not None and x.__class__ is not int and x_mask != sign_mask(x):
+                    set_x(state, MASK_TYPE_LIST[x_mask])
+                if set_y is not None and y.__class__ is not int and y_mask != sign_mask(y):
+                    set_y(state, MASK_TYPE_LIST[y_mask])
+                return True
+
+            def run_set_jump(self: Abstractexecutor, label_name: str, operation_index: int, limit_time: int) -> AbstractType | None:
+                compare = self.state.compare
+                if compare is None:
+                    if jump_taken(op_type, compare):
+                        self.test(label_name, label_dict[target], limit_time)
+                        return AbstractType.Finish
+                    return None
+                compare_mask = TYPE_MASK_DICT[compare]
+                taken = compare_mask & taken_mask
+                fall_through = compare_mask & ~taken_mask
+                if taken:
+                    if fall_through and self.profile is not None:
+                        self.count_fork(label_name, operation_index, 2)
+                    original_state = self.state
+                    self.state = original_state.fork()
+                    if refine(self.state, taken):
+                        self.test(label_name, label_dict[target], limit_time)
+                    if not fall_through:
+                        return AbstractType.Finish
+                    self.state = original_state.fork()
+                if not fall_through or not refine(self.state, fall_through):
+                    return AbstractType.Finish
+                return None
+
+            return run_set_jump
+    return None
+
+
+def mask_condition(symbol: ArithRef, mask: int) -> BoolRef | None:
+    # the condition that symbol has one of the signs of a SIGN_BIT_LIST mask, None when every sign does
+    match mask:
+        case 1:
+            return symbol < 0
+        case 2:
+            return symbol == 0
+        case 3:
+            return symbol <= 0
+        case 4:
+            return symbol > 0
+        case 5:
+            return symbol != 0
+        case 6:
+            return symbol >= 0
+        case 7:
+            return None
+        case _:
+            raise Exception(mask)
+
+
+def compile_symbol_get(x: str | Address | int) -> Callable[[Abstractexecutor, MachineState], ArithRef]:
+    # reader of the symbol of one operand, a location nobody wrote gets a fresh symbol
+    if isinstance(x, int):
+        constant = IntVal(x)
+        return lambda self, state: constant
+    if isinstance(x, str):
+        return lambda self, state: self.read_symbol(state, x)
+    if isinstance(x, Address):
+        offset = x.offset
+
+        def get_address(self: Abstractexecutor, state: MachineState) -> ArithRef:
+            base = state.register_file[x.operand]
+            if not isinstance(base, int):
+                return self.fresh_symbol()
+            return self.read_symbol(state, base + offset)
+
+        return get_address
+    return lambda self, state: self.fresh_symbol()
+
+
+def compile_symbol_set(destination: str | Address) -> Callable[[Abstractexecutor, MachineState, ArithRef], None]:
+    if isinstance(destination, str):
+        def set_register(self: Abstractexecutor, state: MachineState, symbol: ArithRef) -> None:
+            state.symbol_dict[destination] = symbol
+
+        return set_register
+    if isinstance(destination, Address):
+        offset = destination.offset
+
+        def set_address(self: Abstractexecutor, state: MachineState, symbol: ArithRef) -> None:
+            base = state.register_file[destination.operand]
+            if isinstance(base, int):
+                state.symbol_dict[base + offset] = symbol
+
+        return set_address
+    return lambda self, state, symbol: None
+
+
+def symbol_nop(self: Abstractexecutor, state: MachineState) -> None:
+    return None
+
+
+def compile_symbol(operation) -> Callable[[Abstractexecutor, MachineState], None]:
+    # lower one operation into a closure f(executor, state) that updates the symbols of the state before the
+    # sign closure runs, it leaves what a fork would choose the sign of in executor.split_symbol
+    # and what makes the operation fail in executor.error_condition
+    operand_list = operation.operand_list
+    match operation.type:
+        case OpType.PUSH | OpType.NOP | OpType.RET | OpType.JMP:
+            return symbol_nop
+        case OpType.CDQ:
+            def symbol_cdq(self: Abstractexecutor, state: MachineState) -> None:
+                state.symbol_dict["edx"] = self.fresh_symbol()
+
+            return symbol_cdq
+        case OpType.SAL:
+            get_operand1 = compile_symbol_get(operand_list[0])
+            set_operand1 = compile_symbol_set(operand_list[0])
+            factor = IntVal(2 ** operand_list[1])
+
+            def symbol_sal(self: Abstractexecutor, state: MachineState) -> None:
+                set_operand1(self, state, get_operand1(self, state) * factor)
+
+            return symbol_sal
+        case OpType.POP:
+            set_operand = compile_symbol_set(operand_list[0])
+
+            def symbol_pop(self: Abstractexecutor, state: MachineState) -> None:
+                set_operand(self, state, self.read_symbol(state, state.register_file.value_list[RSP_SLOT]))
+
+            return symbol_pop
+        case OpType.MOV:
+            set_destination = compile_symbol_set(operand_list[0])
+            # an array element is read through sign representatives of the index, its symbol is unknown
+            get_source = (
+                compile_symbol_get(None) if isinstance(operand_list[1], ArrayAddress)
+                else compile_symbol_get(operand_list[1])
+            )
+
+            def symbol_mov(self: Abstractexecutor, state: MachineState) -> None:
+                symbol = get_source(self, state)
+                set_destination(self, state, symbol)
+                self.split_symbol = symbol
+
+            return symbol_mov
+        case OpType.ADD | OpType.SUB:
+            if operand_list[0] == "rsp" and isinstance(operand_list[1], int):
+                return symbol_nop
+            get_operand1 = compile_symbol_get(operand_list[0])
+            get_operand2 = compile_symbol_get(operand_list[1])
+            set_operand1 = compile_symbol_set(operand_list[0])
+            add = operation.type == OpType.ADD
+
+            def symbol_arithmetic(self: Abstractexecutor, state: MachineState) -> None:
+                x = get_operand1(self, state)
+                y = get_operand2(self, state)
+                symbol = x + y if add else x - y
+                set_operand1(self, state, symbol)
+                self.split_symbol = symbol
+
+            return symbol_arithmetic
+        case OpType.IDIV:
+            get_divisor = compile_symbol_get(operand_list[0])
+
+            def symbol_idiv(self: Abstractexecutor, state: MachineState) -> None:
+                # z3 division does not round towards zero, the quotient is only constrained by its sign
+                self.error_condition = get_divisor(self, state) == 0
+                quotient = self.fresh_symbol()
+                state.symbol_dict["eax"] = quotient
+                state.symbol_dict["edx"] = self.fresh_symbol()
+                self.split_symbol = quotient
+
+            return symbol_idiv
+        case OpType.IMUL:
+            if len(operand_list) not in [2, 3]:
+                return symbol_nop
+            get_operand1 = compile_symbol_get(operand_list[-2])
+            get_operand2 = compile_symbol_get(operand_list[-1])
+            set_destination = compile_symbol_set(operand_list[0])
+
+            def symbol_imul(self: Abstractexecutor, state: MachineState) -> None:
+                symbol = get_operand1(self, state) * get_operand2(self, state)
+                set_destination(self, state, symbol)
+                self.split_symbol = symbol
+
+            return symbol_imul
+        case OpType.LEA:
+            operand2 = operand_list[1]
+            if not isinstance(operand2, Address) or operand2.operand == "rip":
+                return symbol_nop
+            get_register = compile_symbol_get(operand2.operand)
+            set_destination = compile_symbol_set(operand_list[0])
+            offset = operand2.offset
+
+            def symbol_lea(self: Abstractexecutor, state: MachineState) -> None:
+                set_destination(self, state, get_register(self, state) + offset)
+
+            return symbol_lea
+        case OpType.CALL:
+            if operand_list[0] == "userDefinedException":
+                return symbol_nop
+
+            def symbol_call(self: Abstractexecutor, state: MachineState) -> None:
+                for register in ARGUMENT_REGISTER_LIST:
+                    state.symbol_dict[register] = self.fresh_symbol()
+                symbol = self.fresh_symbol()
+                state.symbol_dict["eax"] = symbol
+                self.split_symbol = symbol
+
+            return symbol_call
+        case OpType.CMP:
+            get_operand1 = compile_symbol_get(operand_list[0])
+            get_operand2 = compile_symbol_get(operand_list[1])
+
+            def symbol_cmp(self: Abstractexecutor, state: MachineState) -> None:
+                difference = get_operand1(self, state) - get_operand2(self, state)
+                state.symbol_dict["compare"] = difference
+                self.split_symbol = difference
+
+            return symbol_cmp
+        case OpType.JGE | OpType.JG | OpType.JS | OpType.JLE | OpType.JL | OpType.JNS | OpType.JNE:
+            op_type = operation.type
+            taken_mask = JUMP_MASK_DICT[op_type]
+
+            def symbol_jump(self: Abstractexecutor, state: MachineState) -> None:
+                # the sign closure decides the edge from the compare flag, the path records why it is taken:
+                # difference = x - y of the cmp has a sign of the same JUMP_MASK_DICT the sign closures follow
+                difference = state.symbol_dict.get("compare")
+                if difference is None:
+                    return
+                mask = taken_mask if jump_taken(op_type, state.compare) else 7 & ~taken_mask
+                state.path = PathNode(state.path, difference, mask)
+
+            return symbol_jump
+        case _:
+            return symbol_nop
+
+
+# symbol closures of every parsed file, aligned with its operation_list
+SYMBOL_CACHE: WeakKeyDictionary = WeakKeyDictionary()
+
+
+def symbol_operations(parser: Parser | CompactIR) -> List[Callable]:
+    function_list = SYMBOL_CACHE.get(parser)
+    if function_list is None:
+        function_list = [compile_symbol(code.operation) for code in parser.operation_list]
+        SYMBOL_CACHE[parser] = function_list
+    return function_list
+
+
+# closures of every parsed file and abstract mode, aligned with its operation_list
+COMPILED_CACHE: WeakKeyDictionary = WeakKeyDictionary()
+
+
+def compiled_operations(parser: Parser | CompactIR, abstract_mode: AbstractMode = AbstractMode.SIGN) -> List[Callable]:
+    mode_dict: Dict[AbstractMode, List[Callable]] = COMPILED_CACHE.setdefault(parser, {})
+    function_list = mode_dict.get(abstract_mode)
+    if function_list is None:
+        leader_set = set(parser.label_dict.values())
+        function_list = []
+        for operation_index, code in enumerate(parser.operation_list):
+            # a labelled operation can be reached from elsewhere, the one before it says nothing
+            previous_operation = None
+            if operation_index > 0 and operation_index not in leader_set:
+                previous_operation = parser.operation_list[operation_index - 1].operation
+            function_list.append(
+                compile_operation(code.operation, parser.label_dict, abstract_mode, previous_operation)
+            )
+        mode_dict[abstract_mode] = function_list
+    return function_list
+
+
+def instrument_operation(function: Callable, op_type: OpType, label: str | None, index: int) -> Callable:
+    # index is the one of the operation in a full parse of its file
+    def run_instrumented(
+            self: Abstractexecutor, label_name: str, operation_index: int, limit_time: int
+    ) -> AbstractType | int | None:
+        self.profile.step(op_type, label, index)
+        return function(self, label_name, operation_index, limit_time)
+
+    return run_instrumented
+
+
+# closures of compiled_operations that count what they execute, per parsed file
+INSTRUMENTED_CACHE: WeakKeyDictionary = WeakKeyDictionary()
+
+
+def instrumented_operations(parser: Parser | CompactIR, abstract_mode: AbstractMode) -> List[Callable]:
+    mode_dict: Dict[AbstractMode, List[Callable]] = INSTRUMENTED_CACHE.setdefault(parser, {})
+    function_list = mode_dict.get(abstract_mode)
+    if function_list is None:
+        function_list = [
+            instrument_operation(
+                function, code.operation.type, source_label(parser, operation_index), file_index(parser, operation_index)
+            )
+            for operation_index, (function, code) in enumerate(
+                zip(compiled_operations(parser, abstract_mode), parser.operation_list)
+            )
+        ]
+        mode_dict[abstract_mode] = function_list
+    return function_list
+
+
+
+
 class Abstractexecutor:
-    def __init__(self, parser: Parser) -> None:
+    def __init__(
+            self, parser: Parser | CompactIR, engine_mode: EngineMode | None = None,
+            branch_jobs: int = 1, fan_out_depth: int = 0, step_budget: int | None = None,
+            abstract_mode: AbstractMode | None = None, path_check: bool = False
+    ) -> None:
         self.parser = parser
-        self.register_dict: Dict[str, AbstractType | None | int] = {}
-        self.memory_array: List[None | Sign_abstraction] = [None] * 10_000
-        self.register_dict["ret"] = None
-        self.register_dict["rsp"] = 9000
-        self.register_dict["rbp"] = 9000
-        self.register_dict["eax"] = None
-        self.register_dict["ebx"] = None
-        self.register_dict["ecx"] = AbstractType.ANY_INT
-        self.register_dict["edx"] = AbstractType.ANY_INT
-        self.register_dict["r8d"] = AbstractType.ANY_INT
-        self.register_dict["r9d"] = AbstractType.ANY_INT
-        self.compare = None
-        for i in range(4, 84):
-            self.memory_array[
-                self.register_dict["rsp"] + 8 * (i + 1)
-                ] = AbstractType.ANY_INT
-
-    def run(self, label_name: str, operation, operation_index,limit_time) -> AbstractType | int | None:
-        '''
-        parameter_list: List[Sign_abstraction] = []
-        for i in range(len(para_list)):
-            parameter_list.append(Sign_abstraction(para_list[i]))
-        para_len = len(parameter_list)
-        if para_len >= 1:
-            self.register_dict["ecx"] = AbstractType.ANY_INT
-        if para_len >= 2:
-            self.register_dict["edx"] = AbstractType.ANY_INT
-        if para_len >= 3:
-            self.register_dict["r8d"] = AbstractType.ANY_INT
-        if para_len >= 4:
-            self.register_dict["r9d"] = AbstractType.ANY_INT
-        if para_len > 4:
-            for i in range(4, para_len):
-                self.memory_array[
-                    self.register_dict["rsp"] + 8 * (i + 1)
-                    ] = AbstractType.ANY_INT
-        '''
-
-        def get_value(x: AbstractType | str | Address | ArrayAddress | int) -> AbstractType | None | int:
-            if isinstance(x, AbstractType):
-                return x
-            elif isinstance(x, str):
-                if isinstance(self.register_dict[x], AbstractType):
-                    return self.register_dict[x]
-                else:
-                    return self.register_dict[x]
-            elif isinstance(x, Address):
-                if isinstance(self.memory_array[get_value(x.operand) + x.offset], AbstractType):
-                    return self.memory_array[get_value(x.operand) + x.offset]
-                else:
-                    return self.memory_array[get_value(x.operand) + x.offset]
-            elif isinstance(x, ArrayAddress):
-                y = get_value(x.operand1)
-                z = get_value(x.operand2)
-                if isinstance(y, AbstractType):
-                    if result2 == AbstractType.POSITIVE_INT:
-                        y = 1
-                    elif result2 == AbstractType.NEGATIVE_INT:
-                        y = -1
-                    elif result2 == AbstractType.ZERO:
-                        y = 0
-                    elif result2 == AbstractType.ANY_INT:
-                        y = 0
-                if isinstance(z, AbstractType):
-                    if result2 == AbstractType.POSITIVE_INT:
-                        z = 1
-                    elif result2 == AbstractType.NEGATIVE_INT:
-                        z = -1
-                    elif result2 == AbstractType.ZERO:
-                        z = 0
-                    elif result2 == AbstractType.ANY_INT:
-                        y = 0
-                return self.memory_array[y + 4 * z + x.offset]
-            elif isinstance(x, int):
-                if x > 0:
-                    return AbstractType.POSITIVE_INT
-                elif x == 0:
-                    return AbstractType.ZERO
-                elif x < 0:
-                    return AbstractType.NEGATIVE_INT
+        self.engine_mode = ENGINE_MODE if engine_mode is None else engine_mode
+        self.step_budget = STEP_BUDGET if step_budget is None else step_budget
+        self.abstract_mode = ABSTRACT_MODE if abstract_mode is None else abstract_mode
+        self.truncated_count = 0  # paths cut by the step budget
+        # a loop context is one loop head entered from one state, the paths forked inside the loop share it;
+        # (loop head index, state key when entered) -> context, context -> its widened state
+        self.loop_context_dict: Dict[Tuple[int, Tuple], int] = {}
+        self.loop_state_dict: Dict[int, MachineState] = {}
+        # branches of the first fan_out_depth split levels go to a pool of branch_jobs processes
+        self.branch_jobs = branch_jobs
+        self.fan_out_depth = fan_out_depth
+        self.split_depth = 0  # splits on the current path
+        self.pool: ProcessPoolExecutor | None = None
+        self.future_list: List[Future] = []
+        # (callee, argument signs) -> (eax values at its exit, exceptions, complete), shared with the callee
+        # executors; complete is False when a path of the callee was cut by the step budget;
+        # the domain modes key it by domain values and keep the join of eax as the only return value
+        self.call_summary_dict: Dict[Tuple[str, Tuple[AbstractType, ...]], Tuple[FrozenSet, FrozenSet, bool]] = {}
+        self.call_progress_set: Set[Tuple[str, Tuple[AbstractType, ...]]] = set()  # summaries being computed
+        self.call_recursion_set: Set[Tuple[str, Tuple[AbstractType, ...]]] = set()  # read while in progress
+        self.return_set: Set[AbstractType | None | int] = set()  # eax at every exit of this function
+        # (operation_index, state key, memo_version) -> smallest limit_time it was explored with, least recently
+        # used first; the loop states and call summaries a suffix reads are not in the state key, every change
+        # to them bumps memo_version so a suffix is only skipped when it would read the same ones
+        self.memo_dict: OrderedDict[Tuple, int] = OrderedDict()
+        self.memo_version = 0
+        self.memo_skip_count = 0  # explorations skipped because the memo had them
+        self.exception_set: Set[ExceptionType] = set()
+        self.summary_dict: Dict[str, AbstractState | None] = {}  # exit state of every analysed callee
+        self.fixpoint_set: Set[str] = set()  # functions whose fixpoint is in progress
+        # errors and forks are only kept when z3 finds an input for the path condition;
+        # only the sign path engine tracks the symbols a path condition is built from
+        self.path_check = path_check and self.abstract_mode == AbstractMode.SIGN
+        self.query_cache: QueryCache = QUERY_CACHE  # slices path conditions and caches their clusters
+        self.solver: Solver | None = None  # one scope per condition of the path solved last
+        self.solver_node_list: List[PathNode] = []
+        self.path_cache: Dict[Tuple, bool] = {}  # (path key, condition hash) -> feasible, shared with callees
+        self.symbol_count = 0
+        self.split_symbol: ArithRef | None = None  # symbol whose sign a fork of the current operation chooses
+        self.error_condition: BoolRef | None = None  # what has to hold for the current operation to fail
+        self.pruned_count = 0  # errors and forks dropped as infeasible
+        self.collector = ResultCollector()  # findings of every path, nothing is printed unless it echoes
+        self.error_finding: Finding | None = None  # error of the current operation waiting for the path check
+        self.site_set: Set[Tuple[str, int, ExceptionType]] = set()  # error sites a fixpoint already reported
+        self.profile: ExecutionProfile | None = None  # counters and hooks, None runs the plain closures
+        register_file = RegisterFile()
+        register_file["ret"] = None
+        register_file["rsp"] = STACK_BASE
+        register_file["rbp"] = STACK_BASE
+        register_file["eax"] = None
+        register_file["ebx"] = None
+        register_file["ecx"] = AbstractType.ANY_INT
+        register_file["edx"] = AbstractType.ANY_INT
+        register_file["r8d"] = AbstractType.ANY_INT
+        register_file["r9d"] = AbstractType.ANY_INT
+        self.state = MachineState(
+            register_file, PersistentDict(StackMemory()), None, {} if self.path_check else None
+        )
 
+    def split(self, label_name: str, operation_index: int, limit_time: int, assign) -> AbstractType:
+        # explore the rest of the path once per sign, each branch works on its own snapshot
+        original_state = self.state
+        # the deepest fanned out level hands its branches to the pool, the levels above stay local; a worker
+        # starts without the loop states of this process, so a branch that can reach a loop head stays local too
+        hand_off = (
+                self.pool is not None and self.split_depth == self.fan_out_depth - 1
+                and not function_cfg(self.parser, label_name).reaches_loop(operation_index)
+        )
+        branch_list = self.fork_branches(SPLIT_TYPE_LIST)
+        if self.path_check and len(branch_list) >= PATH_CHECK_WIDTH and not self.feasible(original_state.path):
+            self.pruned_count += 1
+            return AbstractType.Finish
+        if self.profile is not None:
+            self.count_fork(label_name, operation_index, len(branch_list))
+        self.split_depth += 1
+        for sign, path in branch_list:
+            self.state = original_state.fork()
+            assign(sign)
+            self.state.path = path
+            if hand_off:
+                self.future_list.append(
+                    self.pool.submit(
+                        explore_branch,
+                        (label_name, operation_index + 1, limit_time, self.step_budget, self.abstract_mode, self.state)
+                    )
+                )
             else:
-                raise Exception(x)
-
-        def push(x):
-            # push x on the stack
-            self.register_dict["rsp"] = self.register_dict["rsp"] - 8
-            self.memory_array[self.register_dict["rsp"]] = x
-
-        def pop() -> AbstractType | None | str:
-            # pop the stack
-            value = self.memory_array[self.register_dict["rsp"]]
-            self.register_dict["rsp"] = self.register_dict["rsp"] + 8
-            return value
-
-        def assign_value(destination: str | Address, value: AbstractType | None | int | AbstractType) -> None:
-            if not isinstance(value, AbstractType | None | int | AbstractType):
-                raise Exception(value)
-
-            if isinstance(destination, str):
-                self.register_dict[destination] = value
-            elif isinstance(destination, Address):
-                self.memory_array[
-                    get_value(destination.operand) + destination.offset
-                    ] = value
+                self.test(label_name, operation_index + 1, limit_time)
+        self.split_depth -= 1
+        return AbstractType.Finish
+
+    def call(self, label_name: str, callee: str, operation_index: int, limit_time: int) -> AbstractType:
+        # continue after the call once per eax value the callee can return
+        argument_tuple = tuple(
+            TYPE_LIST[sign_code(self.state.register_file[i])] for i in ARGUMENT_REGISTER_LIST
+        )
+        return_set, exception_set, complete = self.summarise(callee, argument_tuple)
+        if not complete:
+            # the callee may return values the summary is missing, the path is as cut as the callee's
+            self.truncated_count += 1
+        original_state = self.state
+        branch_list = self.fork_branches(sorted(return_set, key=str))
+        if (
+                self.path_check and (exception_set or len(branch_list) >= PATH_CHECK_WIDTH)
+                and not self.feasible(original_state.path)
+        ):
+            # no input reaches the call, it neither fails nor returns
+            self.pruned_count += 1
+            return AbstractType.Finish
+        self.exception_set |= exception_set
+        for exception_type in sorted(exception_set, key=lambda i: i.name):
+            # the callee fails in this context, the call is where this path fails
+            self.collector.add(self.finding(REPORT_KIND_DICT[exception_type], label_name, operation_index, self.state))
+        if self.profile is not None and len(branch_list) > 1:
+            self.count_fork(label_name, operation_index, len(branch_list))
+        for value, path in branch_list:
+            self.state = original_state.fork()
+            for register in ARGUMENT_REGISTER_LIST:
+                self.state.register_file[register] = AbstractType.ANY_INT
+            self.state.register_file["eax"] = value
+            self.state.path = path
+            self.test(label_name, operation_index + 1, limit_time)
+        return AbstractType.Finish
+
+    def fork_branches(
+            self, value_list: List[AbstractType | None | int]
+    ) -> List[Tuple[AbstractType | None | int, PathNode | None]]:
+        # the values a fork on split_symbol explores, with the path condition of each; a sign the
+        # symbol can not have, such as another sign than the one of a constant, is pruned without the solver
+        symbol = self.split_symbol
+        path = self.state.path
+        if not self.path_check or symbol is None:
+            return [(value, path) for value in value_list]
+        constant = simplify(symbol)
+        branch_list = []
+        for value in value_list:
+            if value not in SPLIT_TYPE_LIST:
+                branch_list.append((value, path))
+            elif not isinstance(constant, IntNumRef):
+                branch_list.append((value, PathNode(path, symbol, TYPE_MASK_DICT[value])))
+            elif sign_code(constant.as_long()) == sign_code(value):
+                branch_list.append((value, path))
             else:
-                raise Exception(destination)
+                self.pruned_count += 1
+        return branch_list
+
+    def child(self) -> Abstractexecutor:
+        # executor of a callee path: the same analysis settings, sharing the caches and summaries of this one;
+        # the findings of a callee are reported at its calls
+        executor = Abstractexecutor(
+            self.parser, EngineMode.PATH, step_budget=self.step_budget, abstract_mode=self.abstract_mode,
+            path_check=self.path_check
+        )
+        executor.query_cache = self.query_cache
+        executor.path_cache = self.path_cache
+        executor.call_summary_dict = self.call_summary_dict
+        executor.call_progress_set = self.call_progress_set
+        executor.call_recursion_set = self.call_recursion_set
+        executor.profile = self.profile
+        executor.collector = ResultCollector(keep=False)
+        return executor
+
+    def summarise(
+            self, label_name: str, argument_tuple: Tuple[AbstractType, ...]
+    ) -> Tuple[FrozenSet, FrozenSet, bool]:
+        # summary of one call context, recursive contexts are iterated until the summary is stable
+        key = (label_name, argument_tuple)
+        if key in self.call_summary_dict:
+            if key in self.call_progress_set:
+                self.call_recursion_set.add(key)
+            return self.call_summary_dict[key]
+        summary: Tuple[FrozenSet, FrozenSet, bool] = (frozenset(), frozenset(), True)
+        self.call_summary_dict[key] = summary
+        self.call_progress_set.add(key)
+        while True:
+            known_set = set(self.call_summary_dict)
+            executor = self.child()
+            for register, value in zip(ARGUMENT_REGISTER_LIST, argument_tuple):
+                executor.state.register_file[register] = value
+            if self.profile is not None:
+                self.profile.add_path(label_name)
+            executor.test(label_name, self.parser.label_dict[label_name], 0)
+            self.pruned_count += executor.pruned_count
+            # the truncated paths are counted at every call that reads the summary
+            new_summary = (
+                summary[0] | executor.return_set, summary[1] | executor.exception_set,
+                summary[2] and executor.truncated_count == 0
+            )
+            self.call_summary_dict[key] = new_summary
+            if new_summary == summary or key not in self.call_recursion_set:
+                summary = new_summary
+                break
+            summary = new_summary
+            # summaries computed on top of the old approximation are recomputed
+            for i in set(self.call_summary_dict) - known_set:
+                del self.call_summary_dict[i]
+            self.call_recursion_set.discard(key)
+        self.call_progress_set.discard(key)
+        self.call_recursion_set.discard(key)
+        # the summaries changed, suffixes explored before may have read the ones recomputed above
+        self.memo_version += 1
+        return summary
+
+    def test(self, label_name: str, operation_index,limit_time):
+        loop_head_set = function_cfg(self.parser, label_name).loop_head_set
+        function_list = compiled_operations(self.parser, self.abstract_mode)
+        symbol_list = symbol_operations(self.parser) if self.path_check else None
+        profile = self.profile
+        if profile is not None:
+            # the same closures, wrapped to count what they execute
+            function_list = instrumented_operations(self.parser, self.abstract_mode)
+        # the same suffix from the same state with no more steps left adds nothing
+        memo_key = (operation_index, self.state.key(), self.memo_version)
+        explored_limit_time = self.memo_dict.get(memo_key)
+        if explored_limit_time is not None and explored_limit_time <= limit_time:
+            self.memo_dict.move_to_end(memo_key)
+            self.memo_skip_count += 1
+            return 0
+        self.memo_dict[memo_key] = limit_time
+        self.memo_dict.move_to_end(memo_key)
+        if len(self.memo_dict) > MEMO_SIZE:
+            self.memo_dict.popitem(last=False)
+        if profile is not None:
+            profile.enter()
+        pruned_count = self.pruned_count
+        try:
+            return self.explore(label_name, operation_index, limit_time, loop_head_set, function_list, symbol_list)
+        finally:
+            if profile is not None:
+                profile.leave()
+            if self.pruned_count != pruned_count:
+                # what the suffix found depended on the path condition, another path has to explore it again
+                self.memo_dict.pop(memo_key, None)
+
+    def explore(
+            self, label_name: str, operation_index: int, limit_time: int, loop_head_set: Set[int],
+            function_list: List[Callable], symbol_list: List[Callable] | None
+    ):
+        while operation_index < len(self.parser.operation_list):
+            limit_time=limit_time+1
+            if limit_time > self.step_budget:
+                self.truncated_count += 1
+                return 0
+            if operation_index in loop_head_set:
+                context = self.state.loop_dict.get(operation_index)
+                if context is None:
+                    # a path that reaches the loop from another state is not widened against this one
+                    context = self.loop_context_dict.setdefault(
+                        (operation_index, self.state.key()), len(self.loop_context_dict)
+                    )
+                    self.state.loop_dict = {**self.state.loop_dict, operation_index: context}
+                loop_state = self.loop_state_dict.get(context)
+                if loop_state is not None:
+                    widened_state = loop_state.widen(self.state)
+                    if widened_state.key() == loop_state.key():
+                        # nothing new reaches the loop head, the loop has converged on this path;
+                        # what the path leaves is the widened state, not a value it returns
+                        self.collector.add(self.finding(WIDENED_KIND, label_name, operation_index, loop_state))
+                        return 0
+                    if symbol_list is not None:
+                        # the widened values are no longer the expressions of this path
+                        widened_state.symbol_dict = {}
+                        widened_state.path = self.state.path
+                    self.state = widened_state
+                self.loop_state_dict[context] = self.state
+                self.memo_version += 1
+                self.state = self.state.fork()
+
+            if symbol_list is not None:
+                self.split_symbol = None
+                self.error_condition = None
+                self.error_finding = None
+                symbol_list[operation_index](self, self.state)
+                exception_set = frozenset(self.exception_set)
+            result = function_list[operation_index](self, label_name, operation_index, limit_time)
+            if result == AbstractType.Finish:
+                return 0
+            elif result == AbstractType.ERROR:
+                if symbol_list is not None:
+                    if not self.feasible(self.state.path, self.error_condition):
+                        # no input takes this path and fails here
+                        self.exception_set.intersection_update(exception_set)
+                        self.pruned_count += 1
+                        return 0
+                    if self.error_finding is not None:
+                        self.collector.add(self.error_finding)
+                return 1
+            operation_index = operation_index + 1
+
+        self.path_result(label_name, None)
+
+    def finding(
+            self, kind: str, label_name: str, operation_index: int | None,
+            state: MachineState | AbstractState | DomainState | None = None, value: object = None
+    ) -> Finding:
+        # the index is the one of a full parse, a lazy run reports the same findings
+        register_dict, memory_dict = ({}, {}) if state is None else state_dicts(state)
+        return Finding(
+            kind, label_name, source_label(self.parser, operation_index), file_index(self.parser, operation_index),
+            register_dict, memory_dict, value
+        )
+
+    def error(self, exception_type: ExceptionType, label_name: str, operation_index: int) -> None:
+        # an error on the current path, with path checking it waits until the path is found feasible
+        self.exception_set.add(exception_type)
+        finding = self.finding(REPORT_KIND_DICT[exception_type], label_name, operation_index, self.state)
+        if self.path_check:
+            self.error_finding = finding
+        else:
+            self.collector.add(finding)
+
+    def site_error(
+            self, exception_type: ExceptionType, label_name: str, operation_index: int,
+            state: AbstractState | DomainState
+    ) -> None:
+        # an error a fixpoint reaches, reported once however often the operation is visited again
+        self.exception_set.add(exception_type)
+        key = (label_name, operation_index, exception_type)
+        if key in self.site_set:
+            return
+        self.site_set.add(key)
+        self.collector.add(self.finding(REPORT_KIND_DICT[exception_type], label_name, operation_index, state))
+
+    def path_result(self, label_name: str, operation_index: int | None) -> None:
+        self.collector.add(
+            self.finding(RESULT_KIND, label_name, operation_index, self.state, self.state.register_file["eax"])
+        )
+
+    def count_fork(self, label_name: str, operation_index: int, branch_count: int) -> None:
+        # every branch after the first is one more path of the function
+        code = self.parser.operation_list[operation_index]
+        self.profile.fork(code.operation.type, file_index(self.parser, operation_index), code.raw_str, branch_count)
+        self.profile.add_path(label_name, branch_count - 1)
 
+    def fresh_symbol(self) -> ArithRef:
+        self.symbol_count += 1
+        return Int(f"s{self.symbol_count}")
+
+    def read_symbol(self, state: MachineState, key: str | int) -> ArithRef:
+        # a location read before any write holds some unknown value, later reads see the same one
+        symbol = state.symbol_dict.get(key)
+        if symbol is None:
+            symbol = self.fresh_symbol()
+            state.symbol_dict[key] = symbol
+        return symbol
+
+    def feasible(self, path: PathNode | None, condition: BoolRef | None = None) -> bool:
+        # whether some input satisfies the path condition and condition, an unknown answer counts as yes
+        if path is None and condition is None:
+            return True
+        key = (None if path is None else path.key, None if condition is None else condition.hash())
+        result = self.path_cache.get(key)
+        if result is not None:
+            return result
+        condition_list = []
+        checked_count = 0  # conditions of the longest prefix already found feasible
+        node = path
+        while node is not None:
+            if checked_count == 0:
+                prefix_result = self.path_cache.get((node.key, None))
+                if prefix_result is False:
+                    self.path_cache[key] = False
+                    return False
+                if prefix_result:
+                    checked_count = node.depth
+            condition_list.append(node.condition)
+            node = node.parent
+        condition_list.reverse()
+        if condition is not None:
+            condition_list.append(condition)
+        # only the clusters of the conditions after that prefix can make the path infeasible
+        result = self.query_cache.check(condition_list, checked_count, lambda: self.solve_path(path, condition, condition_list))
+        self.path_cache[key] = result
+        return result
+
+    def solve_path(self, path: PathNode | None, condition: BoolRef | None, condition_list: List[BoolRef]) -> bool:
+        node_list = []
+        node = path
+        while node is not None:
+            node_list.append(node)
+            node = node.parent
+        node_list.reverse()
+        if self.solver is None:
+            self.solver = Solver()
+        # paths are explored depth first, the scopes of the prefix shared with the last check stay
+        common_count = 0
+        while (
+                common_count < len(self.solver_node_list) and common_count < len(node_list)
+                and self.solver_node_list[common_count] is node_list[common_count]
+        ):
+            common_count += 1
+        if common_count < len(self.solver_node_list):
+            self.solver.pop(len(self.solver_node_list) - common_count)
+            del self.solver_node_list[common_count:]
+        for node in node_list[common_count:]:
+            self.solver.push()
+            self.solver.add(node.condition)
+            self.solver_node_list.append(node)
+        if condition is not None:
+            self.solver.push()
+            self.solver.add(condition)
+        answer = self.solver.check()
+        if answer == sat and self.query_cache.reuse_models():
+            self.query_cache.remember_model(self.solver.model(), condition_list)
+        if condition is not None:
+            self.solver.pop()
+        # an unknown answer counts as feasible, nothing is pruned on it
+        return answer != unsat
+
+    def initial_state(self) -> AbstractState:
+        return AbstractState(
+            self.state.register_file.to_dict(), self.state.memory.to_dict(), self.state.memory.base,
+            self.state.compare
+        )
+
+    def fixpoint_run(
+            self, label_name: str, state: AbstractState, operation, operation_index: int
+    ) -> List[Tuple[int | None, AbstractState]]:
+        # transfer one operation, return the successor states, None marks the function exit
+        next_index = operation_index + 1
         match operation.type:
-            case OpType.CDQ:
-                pass
-            case OpType.PUSH:
-                operand = operation.operand_list[0]
+            case OpType.CDQ | OpType.PUSH | OpType.SAL | OpType.NOP:
+                return [(next_index, state)]
             case OpType.POP:
-                operand = operation.operand_list[0]
-                value = pop()
-                assign_value(operand, value)
+                value = state.load(state.register_dict["rsp"])
+                state.register_dict["rsp"] = state.register_dict["rsp"] + 8
+                state.assign_value(operation.operand_list[0], value)
+                return [(next_index, state)]
             case OpType.MOV:
                 destination = operation.operand_list[0]
                 source = operation.operand_list[1]
-                if isinstance(source, ArrayAddress):
-                    result1 = get_value(source.operand1)
-                    result2 = get_value(source.operand2)
-                    x = result1
-                    y = result2
-                    if isinstance(result1, AbstractType):
-                        if result1 == AbstractType.POSITIVE_INT:
-                            x = 1
-                        elif result1 == AbstractType.NEGATIVE_INT:
-                            x = -1
-                        elif result1 == AbstractType.ZERO or AbstractType.ANY_INT:
-                            x = 0
-                    if isinstance(result2, AbstractType):
-                        if result2 == AbstractType.POSITIVE_INT:
-                            y = 1
-                        elif result2 == AbstractType.NEGATIVE_INT:
-                            y = -1
-                        elif result2 == AbstractType.ZERO:
-                            y = 0
-                        elif result2 == AbstractType.ANY_INT:
-                            y = 0
+                if not isinstance(source, ArrayAddress):
+                    state.assign_value(destination, state.get_value(source))
+                    return [(next_index, state)]
+                # load every possible element, an index outside the frame is an error
+                x = state.get_value(source.operand1)
+                if x == AbstractType.POSITIVE_INT:
+                    x = 1
+                elif x == AbstractType.NEGATIVE_INT:
+                    x = -1
+                elif isinstance(x, AbstractType):
+                    x = 0
+                result_state = None
+                for y in split_value(state.get_value(source.operand2)):
+                    if y == AbstractType.POSITIVE_INT:
+                        y = 1
+                    elif y == AbstractType.NEGATIVE_INT:
+                        y = -1
+                    elif isinstance(y, AbstractType):
+                        y = 0
                     index = x + 4 * y + source.offset
-                    low_bound = get_value("rsp")
-                    up_bound = get_value("rbp")
-                    if index <= low_bound or index >= up_bound:
-                        print("out of bounds")
-                        return AbstractType.ERROR
-                    else:
-                        assign_value(destination, get_value(source))
-                        if get_value(destination) == AbstractType.ANY_INT:
-                            # print("cause the destination",destination,"value=ANY_INT, it should be divide as three types")
-                            original_register_dict = self.register_dict.copy()
-                            assign_value(destination,AbstractType.POSITIVE_INT)
-                            self.test(label_name, operation_index + 1,limit_time)
-                            self.register_dict = original_register_dict.copy()
-                            assign_value(destination,AbstractType.NEGATIVE_INT,limit_time)
-                            self.test(label_name, operation_index + 1)
-                            self.register_dict = original_register_dict.copy()
-                            assign_value(destination,AbstractType.ZERO)
-                            self.test(label_name, operation_index + 1,limit_time)
-                            return AbstractType.Finish
-                else:
-                    assign_value(destination, get_value(source))
-                    if get_value(destination) == AbstractType.ANY_INT:
-                        # print("cause the Mov",destination, "value=ANY_INT, it should be divide as three types")
-                        original_register_dict = self.register_dict.copy()
-                        assign_value(destination, AbstractType.POSITIVE_INT)
-                        self.test(label_name, operation_index + 1,limit_time)
-                        self.register_dict = original_register_dict.copy()
-                        assign_value(destination, AbstractType.NEGATIVE_INT)
-                        self.test(label_name, operation_index + 1,limit_time)
-                        self.register_dict = original_register_dict.copy()
-                        assign_value(destination, AbstractType.ZERO)
-                        self.test(label_name, operation_index + 1,limit_time)
-                        return AbstractType.Finish
-            case OpType.ADD:
+                    if index <= state.get_value("rsp") or index >= state.get_value("rbp"):
+                        self.site_error(ExceptionType.OUT_OF_BOUNDS, label_name, operation_index, state)
+                        continue
+                    load_state = state.copy()
+                    load_state.assign_value(destination, state.load(index))
+                    result_state = load_state if result_state is None else result_state.join(load_state)
+                if result_state is None:
+                    return []
+                return [(next_index, result_state)]
+            case OpType.ADD | OpType.SUB:
                 operand1 = operation.operand_list[0]
                 operand2 = operation.operand_list[1]
                 if operand1 == "rsp" and isinstance(operand2, int):
-                    self.register_dict["rsp"] = self.register_dict["rsp"] + operand2
+                    if operation.type == OpType.ADD:
+                        state.register_dict["rsp"] = state.register_dict["rsp"] + operand2
+                    else:
+                        state.register_dict["rsp"] = state.register_dict["rsp"] - operand2
                 else:
-                    result = Sign_abstraction.__add__(Sign_abstraction(get_value(operand1)),
-                                                      Sign_abstraction(get_value(operand2)))
-                    assign_value(operation.operand_list[0], result.type)
-                if get_value(operand1) == AbstractType.ANY_INT:
-                    # print("cause the ADD",operand1, "value=ANY_INT, it should be divide as three types")
-                    original_register_dict = self.register_dict.copy()
-                    assign_value(operand1, AbstractType.POSITIVE_INT)
-                    self.test(label_name, operation_index + 1,limit_time)
-                    self.register_dict = original_register_dict.copy()
-                    assign_value(operand1, AbstractType.NEGATIVE_INT)
-                    self.test(label_name, operation_index + 1,limit_time)
-                    self.register_dict = original_register_dict.copy()
-                    assign_value(operand1, AbstractType.ZERO)
-                    self.test(label_name, operation_index + 1,limit_time)
-                    return AbstractType.Finish
+                    table = ADD_TABLE if operation.type == OpType.ADD else SUB_TABLE
+                    state.assign_value(
+                        operand1, sign_operation(table, state.get_value(operand1), state.get_value(operand2))
+                    )
+                return [(next_index, state)]
+            case OpType.IDIV:
+                dividend = state.get_value("eax")
+                result = None
+                for divisor in split_value(state.get_value(operation.operand_list[0])):
+                    value = sign_operation(IDIV_TABLE, dividend, divisor)
+                    if value == AbstractType.ERROR:
+                        self.site_error(ExceptionType.ARITHMETIC_EXCEPTION, label_name, operation_index, state)
+                        continue
+                    result = value if result is None else join_value(result, value)
+                if result is None:
+                    return []
+                state.assign_value("eax", result)
+                state.assign_value("edx", result)
+                return [(next_index, state)]
+            case OpType.IMUL:
+                operand_list = operation.operand_list
+                result = sign_operation(
+                    IMUL_TABLE, state.get_value(operand_list[-2]), state.get_value(operand_list[-1])
+                )
+                state.assign_value(operand_list[0], result)
+                return [(next_index, state)]
+            case OpType.LEA:
+                operand2 = operation.operand_list[1]
+                if operand2.operand == "rip":
+                    # assertion failed
+                    return []
+                state.assign_value(operation.operand_list[0], state.get_value(operand2.operand))
+                return [(next_index, state)]
+            case OpType.CALL:
+                callee = operation.operand_list[0]
+                if callee == "userDefinedException":
+                    self.site_error(ExceptionType.USER_DEFINED_EXCEPTION, label_name, operation_index, state)
+                    return []
+                if callee in self.fixpoint_set:
+                    # recursive call, nothing is known about the result yet
+                    for register in ["eax", "ecx", "edx", "r8d", "r9d"]:
+                        state.assign_value(register, AbstractType.ANY_INT)
+                    return [(next_index, state)]
+                exit_state = self.fixpoint(callee)
+                if exit_state is None:
+                    return []
+                for register in ["eax", "ecx", "edx", "r8d", "r9d"]:
+                    state.assign_value(register, exit_state.register_dict.get(register))
+                return [(next_index, state)]
+            case OpType.CMP:
+                x = state.get_value(operation.operand_list[0])
+                y = state.get_value(operation.operand_list[1])
+                if x in SET_TYPE_LIST or y in SET_TYPE_LIST:
+                    state.compare = sign_operation(SET_SUB_TABLE, x, y)
+                else:
+                    state.compare = compare_value(x, y, state.compare)
+                return [(next_index, state)]
+            case OpType.RET:
+                return [(None, state)]
+            case OpType.JGE | OpType.JG | OpType.JS | OpType.JMP | OpType.JLE | OpType.JL | OpType.JNS | OpType.JNE:
+                # follow each edge with the compare results that take it; the operands of a cmp right before
+                # the jump, in the same block, are narrowed to the signs that give those results
+                jump_index = self.parser.label_dict[operation.operand_list[0]]
+                compare_operand_list = None
+                if operation_index not in function_cfg(self.parser, label_name).block_dict:
+                    previous_operation = self.parser.operation_list[operation_index - 1].operation
+                    if previous_operation.type == OpType.CMP:
+                        compare_operand_list = previous_operation.operand_list
+                result_list = []
+                for target_index, taken in [(jump_index, True), (next_index, False)]:
+                    compare_list = [
+                        compare for compare in split_value(state.compare)
+                        if jump_taken(operation.type, compare) == taken
+                    ]
+                    if len(compare_list) == 0:
+                        continue
+                    target_state = state.copy()
+                    target_state.compare = compare_list[0]
+                    for compare in compare_list[1:]:
+                        target_state.compare = join_value(target_state.compare, compare)
+                    if compare_operand_list is not None and all(i in SPLIT_TYPE_LIST for i in compare_list):
+                        compare_mask = sum(TYPE_MASK_DICT[i] for i in compare_list)
+                        if not self.refine_compare(target_state, compare_operand_list, compare_mask):
+                            continue
+                    result_list.append((target_index, target_state))
+                return result_list
+            case _:
+                raise Exception(operation.type)
+
+    def refine_compare(self, state: AbstractState, operand_list: List, compare_mask: int) -> bool:
+        # narrow the operands of cmp x, y to the signs whose x - y is in compare_mask, False when none are
+        x = state.get_value(operand_list[0])
+        y = state.get_value(operand_list[1])
+        x_mask, y_mask = refine_operands(x, y, compare_mask)
+        if x_mask == 0 or y_mask == 0:
+            return False
+        for operand, value, mask in [(operand_list[0], x, x_mask), (operand_list[1], y, y_mask)]:
+            if isinstance(operand, str | Address) and value.__class__ is not int and mask != sign_mask(value):
+                state.assign_value(operand, MASK_TYPE_LIST[mask])
+        return True
 
-            case OpType.SUB:
+    def fixpoint(self, label_name: str) -> AbstractState | None:
+        # worklist fixpoint over the basic blocks of one function, return the join of its exit states
+        if label_name in self.summary_dict:
+            return self.summary_dict[label_name]
+        self.fixpoint_set.add(label_name)
+        if self.profile is not None:
+            self.profile.enter()
+        cfg = function_cfg(self.parser, label_name)
+        start_index = cfg.entry_index
+        state_dict: Dict[int, AbstractState] = {start_index: self.initial_state()}
+        worklist = [start_index]
+        queued_set = {start_index}
+        exit_state = None
+        while len(worklist) > 0:
+            block_index = heapq.heappop(worklist)
+            queued_set.discard(block_index)
+            if block_index not in cfg.block_dict:
+                continue
+            block = cfg.block_dict[block_index]
+            # states are only joined at block entries, inside a block only the last operation branches
+            result_list = [(block_index, state_dict[block_index].copy())]
+            for operation_index in range(block.start_index, block.end_index):
+                if len(result_list) == 0:
+                    break
+                operation = self.parser.operation_list[operation_index].operation
+                if self.profile is not None:
+                    self.profile.step(
+                        operation.type, source_label(self.parser, operation_index), file_index(self.parser, operation_index)
+                    )
+                result_list = self.fixpoint_run(label_name, result_list[0][1], operation, operation_index)
+            for next_index, next_state in result_list:
+                if next_index is None:
+                    exit_state = next_state if exit_state is None else exit_state.join(next_state)
+                    continue
+                if next_index in state_dict:
+                    joined_state = state_dict[next_index].join(next_state)
+                    if joined_state == state_dict[next_index]:
+                        continue
+                    next_state = joined_state
+                state_dict[next_index] = next_state
+                if next_index not in queued_set:
+                    queued_set.add(next_index)
+                    heapq.heappush(worklist, next_index)
+        self.fixpoint_set.discard(label_name)
+        if self.profile is not None:
+            self.profile.leave()
+        self.summary_dict[label_name] = exit_state
+        return exit_state
+
+    def domain_run(
+            self, label_name: str, state: DomainState, operation, operation_index: int
+    ) -> List[Tuple[int | None, DomainState]]:
+        # transfer one operation in the domain of self.abstract_mode, None marks the function exit
+        domain = state.domain
+        next_index = operation_index + 1
+        match operation.type:
+            case OpType.PUSH | OpType.NOP:
+                return [(next_index, state)]
+            case OpType.CDQ:
+                state.assign_value("edx", domain.top())
+                return [(next_index, state)]
+            case OpType.SAL:
+                operand1 = operation.operand_list[0]
+                state.assign_value(
+                    operand1, domain.mul(state.get_number(operand1), domain.constant(2 ** operation.operand_list[1]))
+                )
+                return [(next_index, state)]
+            case OpType.POP:
+                value = state.load(state.register_dict["rsp"])
+                state.register_dict["rsp"] = state.register_dict["rsp"] + 8
+                state.assign_value(operation.operand_list[0], value)
+                return [(next_index, state)]
+            case OpType.MOV:
+                destination = operation.operand_list[0]
+                source = operation.operand_list[1]
+                if not isinstance(source, ArrayAddress):
+                    state.assign_value(destination, state.get_value(source))
+                    return [(next_index, state)]
+                # load every element the index can reach, one outside the frame is an error
+                base = state.get_value(source.operand1)
+                index_list = domain.index_list(state.get_number(source.operand2))
+                if not isinstance(base, int) or index_list is None:
+                    self.site_error(ExceptionType.OUT_OF_BOUNDS, label_name, operation_index, state)
+                    state.assign_value(destination, domain.top())
+                    return [(next_index, state)]
+                value = None
+                for index in index_list:
+                    address = base + 4 * index + source.offset
+                    if address <= state.get_value("rsp") or address >= state.get_value("rbp"):
+                        self.site_error(ExceptionType.OUT_OF_BOUNDS, label_name, operation_index, state)
+                        continue
+                    element = state.load(address)
+                    value = element if value is None else domain.join(value, element)
+                if value is None:
+                    return []
+                state.assign_value(destination, value)
+                return [(next_index, state)]
+            case OpType.ADD | OpType.SUB:
                 operand1 = operation.operand_list[0]
                 operand2 = operation.operand_list[1]
-                if operand1 == "rsp" and isinstance(operand2, int):
-                    self.register_dict["rsp"] = self.register_dict["rsp"] - operand2
+                value = state.get_value(operand1)
+                if isinstance(value, int) and isinstance(operand2, int):
+                    # stack pointer arithmetic
+                    state.assign_value(operand1, value + operand2 if operation.type == OpType.ADD else value - operand2)
+                elif operation.type == OpType.ADD:
+                    state.assign_value(operand1, domain.add(state.get_number(operand1), state.get_number(operand2)))
                 else:
-
-                    result = Sign_abstraction.__sub__(Sign_abstraction(get_value(operand1)),
-                                                      Sign_abstraction(get_value(operand2)))
-                    assign_value(operation.operand_list[0], result.type)
-                if get_value(operand1) == AbstractType.ANY_INT:
-                    # print("cause the SUB",operand1, "value=ANY_INT, it should be divide as three types")
-                    original_register_dict = self.register_dict.copy()
-                    assign_value(operand1, AbstractType.POSITIVE_INT)
-                    self.test(label_name, operation_index + 1,limit_time)
-                    self.register_dict = original_register_dict.copy()
-                    assign_value(operand1, AbstractType.NEGATIVE_INT)
-                    self.test(label_name, operation_index + 1,limit_time)
-                    self.register_dict = original_register_dict.copy()
-                    assign_value(operand1, AbstractType.ZERO)
-                    self.test(label_name, operation_index + 1,limit_time)
-                    return AbstractType.Finish
+                    state.assign_value(operand1, domain.sub(state.get_number(operand1), state.get_number(operand2)))
+                return [(next_index, state)]
             case OpType.IDIV:
-                operand1 = operation.operand_list[0]
-                result = Sign_abstraction.__idiv__(Sign_abstraction(get_value(self.register_dict["eax"])),
-                                                   Sign_abstraction(get_value(operand1)))
-                assign_value("eax", result.type)
-                assign_value("edx", result.type)
-                if get_value("eax") == AbstractType.ANY_INT:
-                    # print("cause the idiv,eax value=ANY_INT, it should be divide as three types")
-                    original_register_dict = self.register_dict.copy()
-                    assign_value("eax", AbstractType.POSITIVE_INT)
-                    assign_value("edx", AbstractType.POSITIVE_INT)
-                    self.test(label_name, operation_index + 1,limit_time)
-                    self.register_dict = original_register_dict.copy()
-                    assign_value("eax", AbstractType.NEGATIVE_INT)
-                    assign_value("edx", AbstractType.NEGATIVE_INT)
-                    self.test(label_name, operation_index + 1,limit_time)
-                    self.register_dict = original_register_dict.copy()
-                    assign_value("eax", AbstractType.ZERO)
-                    assign_value("edx", AbstractType.ZERO)
-                    self.test(label_name, operation_index + 1,limit_time)
-                    return AbstractType.Finish
-                elif get_value("eax")==AbstractType.ERROR:
-                    return AbstractType.ERROR
+                value, zero_divisor = domain.div(state.get_number("eax"), state.get_number(operation.operand_list[0]))
+                if zero_divisor:
+                    self.site_error(ExceptionType.ARITHMETIC_EXCEPTION, label_name, operation_index, state)
+                if value is None:
+                    return []
+                state.assign_value("eax", value)
+                state.assign_value("edx", domain.top())
+                return [(next_index, state)]
             case OpType.IMUL:
-                if len(operation.operand_list) == 3:
-                    result = Sign_abstraction.__imul__(Sign_abstraction(get_value(operation.operand_list[1])), Sign_abstraction(get_value(
-                        operation.operand_list[2])))
-                    assign_value(operation.operand_list[0], result.type)
-                    if get_value(operation.operand_list[0]) == AbstractType.ANY_INT:
-                        # print("cause the imul",operation.operand_list[0], "value=ANY_INT, it should be divide as three types")
-                        original_register_dict = self.register_dict.copy()
-                        assign_value(operation.operand_list[0],AbstractType.POSITIVE_INT)
-                        self.test(label_name, operation_index+1,limit_time)
-                        self.register_dict = original_register_dict.copy()
-                        assign_value(operation.operand_list[0],AbstractType.NEGATIVE_INT)
-                        self.test(label_name, operation_index+1,limit_time)
-                        self.register_dict = original_register_dict.copy()
-                        assign_value(operation.operand_list[0],AbstractType.ZERO)
-                        self.test(label_name, operation_index+1,limit_time)
-                        return AbstractType.Finish
-                if len(operation.operand_list) ==2:
-                        result = Sign_abstraction.__imul__(Sign_abstraction(get_value(operation.operand_list[0])),Sign_abstraction(get_value(operation.operand_list[1])))
-                        assign_value(operation.operand_list[0], result.type)
-                        if get_value(operation.operand_list[0]) == AbstractType.ANY_INT:
-                            # print("cause the imul",operation.operand_list[0], "value=ANY_INT, it should be divide as three types")
-                            original_register_dict = self.register_dict.copy()
-                            assign_value(operation.operand_list[0], AbstractType.POSITIVE_INT)
-                            self.test(label_name, operation_index + 1, limit_time)
-                            self.register_dict = original_register_dict.copy()
-                            assign_value(operation.operand_list[0], AbstractType.NEGATIVE_INT)
-                            self.test(label_name, operation_index + 1, limit_time)
-                            self.register_dict = original_register_dict.copy()
-                            assign_value(operation.operand_list[0], AbstractType.ZERO)
-                            self.test(label_name, operation_index + 1, limit_time)
-                            return AbstractType.Finish
-
-            case OpType.SAL:
-                pass
+                operand_list = operation.operand_list
+                state.assign_value(
+                    operand_list[0], domain.mul(state.get_number(operand_list[-2]), state.get_number(operand_list[-1]))
+                )
+                return [(next_index, state)]
             case OpType.LEA:
-                operand1 = operation.operand_list[0]
                 operand2 = operation.operand_list[1]
                 if operand2.operand == "rip":
-                    # print(" Assertion failed!")
-                    # print(" Exiting!")
-                    return AbstractType.Finish
-                if not isinstance(operand2, Address):
-                    raise Exception
-                result = get_value(operand2.operand)
-                assign_value(operation.operand_list[0], result)
-            case OpType.NOP:
-                pass
-
+                    # assertion failed
+                    return []
+                base = state.get_value(operand2.operand)
+                if isinstance(base, int):
+                    state.assign_value(operation.operand_list[0], base + operand2.offset)
+                else:
+                    state.assign_value(operation.operand_list[0], domain.add(base, domain.constant(operand2.offset)))
+                return [(next_index, state)]
             case OpType.CALL:
-                if operation.operand_list[0] == "userDefinedException":
-                    print(" Raise userDefinedException!")
-                    print(" Exiting!")
-                    return AbstractType.ERROR
-                push(operation_index)  # push return address
-                operation_index = self.parser.label_dict[operation.operand_list[0]]
-                self.test(label_name, operation_index,limit_time)
-                return AbstractType.Finish
-
+                callee = operation.operand_list[0]
+                if callee == "userDefinedException":
+                    self.site_error(ExceptionType.USER_DEFINED_EXCEPTION, label_name, operation_index, state)
+                    return []
+                argument_tuple = tuple(state.get_number(i) for i in ARGUMENT_REGISTER_LIST)
+                if callee not in self.parser.label_dict or any(i[0] == callee for i in self.call_progress_set):
+                    # an unknown or recursive callee can return anything
+                    return_set = frozenset([domain.top()])
+                else:
+                    return_set, exception_set, _ = self.domain_fixpoint(callee, argument_tuple)
+                    self.exception_set |= exception_set
+                if len(return_set) == 0:
+                    return []
+                for register in ARGUMENT_REGISTER_LIST:
+                    state.assign_value(register, domain.top())
+                state.assign_value("eax", next(iter(return_set)))
+                return [(next_index, state)]
             case OpType.CMP:
                 operand1 = operation.operand_list[0]
                 operand2 = operation.operand_list[1]
-                x = get_value(operand1)
-                y = get_value(operand2)
-                # print(operand1,x)
-                # print(operand2,y)
-                if isinstance(x, int):
-                    if isinstance(y, int):
-                        if x > y:
-                            self.compare = AbstractType.POSITIVE_INT
-                        if x == y:
-                            self.compare = AbstractType.ZERO
-                        if x < y:
-                            self.compare = AbstractType.NEGATIVE_INT
-                    elif isinstance(y, AbstractType):
-                        if y == AbstractType.POSITIVE_INT:
-                            if x <= 0:
-                                self.compare = AbstractType.POSITIVE_INT
-                            if x > 0:
-                                self.compare = AbstractType.ANY_INT
-                        if y == AbstractType.ZERO:
-                            if x == 0:
-                                self.compare = AbstractType.ZERO
-                            if x > 0:
-                                self.compare = AbstractType.POSITIVE_INT
-                            if x < 0:
-                                self.compare = AbstractType.NEGATIVE_INT
-                        if y == AbstractType.ANY_INT:
-                            self.compare = AbstractType.ANY_INT
-                        if y == AbstractType.NEGATIVE_INT:
-                            if x < 0:
-                                self.compare = AbstractType.ANY_INT
-                            if x >= 0:
-                                self.compare = AbstractType.POSITIVE_INT
-                elif isinstance(x, AbstractType):
-                    if isinstance(y, AbstractType):
-                        if y == AbstractType.ANY_INT or x == AbstractType.ANY_INT:
-                            self.compare = AbstractType.ANY_INT
-                        elif y == AbstractType.ZERO:
-                            if x == AbstractType.ZERO:
-                                self.compare = AbstractType.ZERO
-                            if x == AbstractType.POSITIVE_INT:
-                                self.compare = AbstractType.POSITIVE_INT
-                            if x == AbstractType.NEGATIVE_INT:
-                                self.compare = AbstractType.NEGATIVE_INT
-                        elif y == AbstractType.POSITIVE_INT:
-                            if x == AbstractType.ZERO or x == AbstractType.NEGATIVE_INT:
-                                self.compare = AbstractType.NEGATIVE_INT
-                            elif x == AbstractType.POSITIVE_INT:
-                                self.compare = AbstractType.ANY_INT
-                        elif y == AbstractType.NEGATIVE_INT:
-                            if x == AbstractType.ZERO or x == AbstractType.POSITIVE_INT:
-                                self.compare = AbstractType.POSITIVE_INT
-                    if isinstance(y, int):
-                        if x == AbstractType.ANY_INT:
-                            self.compare = AbstractType.ANY_INT
-                        elif y > 0:
-                            if x == AbstractType.ZERO or x == AbstractType.NEGATIVE_INT:
-                                self.compare = AbstractType.NEGATIVE_INT
-                            if x == AbstractType.POSITIVE_INT:
-                                self.compare = AbstractType.ANY_INT
-                        elif y == 0:
-                            if x == AbstractType.ZERO:
-                                self.compare = AbstractType.ZERO
-                            if x == AbstractType.POSITIVE_INT:
-                                self.compare = AbstractType.POSITIVE_INT
-                            if x == AbstractType.NEGATIVE_INT:
-                                self.compare = AbstractType.NEGATIVE_INT
-                        elif y < 0:
-                            if x == AbstractType.ZERO or x == AbstractType.POSITIVE_INT:
-                                self.compare = AbstractType.POSITIVE_INT
-                            if x == AbstractType.NEGATIVE_INT:
-                                self.compare = AbstractType.ANY_INT
-                    if self.compare==AbstractType.ANY_INT:
-                        # print("cause the compare value=ANY_INT, it should be divide as three types")
-                        original_register_dict = self.register_dict.copy()
-                        self.compare=AbstractType.POSITIVE_INT
-                        self.test(label_name, operation_index+1,limit_time)
-                        self.register_dict = original_register_dict.copy()
-                        self.compare=AbstractType.NEGATIVE_INT
-                        self.test(label_name, operation_index+1,limit_time)
-                        self.register_dict = original_register_dict.copy()
-                        self.compare=AbstractType.ZERO
-                        self.test(label_name, operation_index+1,limit_time)
-                        return AbstractType.Finish
-
-                return self.compare
+                state.compare = (
+                    operation_index, operand1, operand2, state.get_number(operand1), state.get_number(operand2)
+                )
+                return [(next_index, state)]
             case OpType.RET:
-                result_address: str | None = pop()
-                if result_address is None:
-                    # print(" Finishing!")
-                    # print(f" Result is {get_value('eax')}")
-                    return AbstractType.Finish
-                elif isinstance(result_address, int):
-                    # print(" Returning")
-                    # print(f" result is {get_value('eax')}")
-                    operation_index = result_address
-
-            case OpType.JGE:
-                if self.compare == AbstractType.POSITIVE_INT or self.compare == AbstractType.ZERO:
-                    operation_index = self.parser.label_dict[
-                        operation.operand_list[0]
-                    ]
-                    self.test(label_name, operation_index,limit_time)
-                    return AbstractType.Finish
+                return [(None, state)]
+            case OpType.JGE | OpType.JG | OpType.JS | OpType.JMP | OpType.JLE | OpType.JL | OpType.JNS | OpType.JNE:
+                # follow each edge with the operands of the cmp right before refined to the values that take it
+                jump_index = self.parser.label_dict[operation.operand_list[0]]
+                taken_mask = JUMP_MASK_DICT[operation.type]
+                result_list = []
+                for target_index, compare_mask in [(jump_index, taken_mask), (next_index, 7 & ~taken_mask)]:
+                    if compare_mask == 0:
+                        continue
+                    if state.compare is None or state.compare[0] != operation_index - 1:
+                        result_list.append((target_index, state.copy()))
+                        continue
+                    _, operand1, operand2, x, y = state.compare
+                    refined = domain.refine(x, y, compare_mask)
+                    if refined is None:
+                        continue
+                    target_state = state.copy()
+                    for operand, value in zip([operand1, operand2], refined):
+                        if not isinstance(operand, int):
+                            target_state.assign_value(operand, value)
+                    result_list.append((target_index, target_state))
+                return result_list
+            case _:
+                raise Exception(operation.type)
 
-            case OpType.JG:
-                if self.compare == AbstractType.POSITIVE_INT:
-                    operation_index = self.parser.label_dict[
-                        operation.operand_list[0]
-                    ]
-                    self.test(label_name, operation_index,limit_time)
-                    return AbstractType.Finish
+    def domain_fixpoint(self, label_name: str, argument_tuple: Tuple) -> Tuple[FrozenSet, FrozenSet, bool]:
+        # worklist over the basic blocks of one call context, widened at loop heads;
+        # return the join of eax at the exits and the exceptions found on the way
+        key = (label_name, argument_tuple)
+        if key in self.call_summary_dict:
+            return self.call_summary_dict[key]
+        self.call_progress_set.add(key)
+        executor = self.child()
+        # a fixpoint reports the findings of its callees itself, once per site
+        executor.collector = self.collector
+        executor.site_set = self.site_set
+        if self.profile is not None:
+            self.profile.enter()
+        domain = DOMAIN_DICT[self.abstract_mode]
+        register_dict = {"rsp": STACK_BASE, "rbp": STACK_BASE}
+        register_dict.update(zip(ARGUMENT_REGISTER_LIST, argument_tuple))
+        cfg = function_cfg(self.parser, label_name)
+        start_index = cfg.entry_index
+        state_dict: Dict[int, DomainState] = {start_index: DomainState(domain, register_dict, {})}
+        worklist = [start_index]
+        queued_set = {start_index}
+        return_value = None
+        while len(worklist) > 0:
+            block_index = heapq.heappop(worklist)
+            queued_set.discard(block_index)
+            block = cfg.block_dict[block_index]
+            result_list = [(block_index, state_dict[block_index].copy())]
+            for operation_index in range(block.start_index, block.end_index):
+                if len(result_list) == 0:
+                    break
+                operation = self.parser.operation_list[operation_index].operation
+                if self.profile is not None:
+                    self.profile.step(
+                        operation.type, source_label(self.parser, operation_index), file_index(self.parser, operation_index)
+                    )
+                result_list = executor.domain_run(label_name, result_list[0][1], operation, operation_index)
+            for next_index, next_state in result_list:
+                if next_index is None:
+                    value = next_state.get_number("eax")
+                    return_value = value if return_value is None else domain.join(return_value, value)
+                    continue
+                if next_index in state_dict:
+                    joined_state = state_dict[next_index].join(next_state)
+                    if next_index in cfg.loop_head_set:
+                        joined_state = state_dict[next_index].widen(joined_state)
+                    if joined_state == state_dict[next_index]:
+                        continue
+                    next_state = joined_state
+                state_dict[next_index] = next_state
+                if next_index not in queued_set:
+                    queued_set.add(next_index)
+                    heapq.heappush(worklist, next_index)
+        self.call_progress_set.discard(key)
+        if self.profile is not None:
+            self.profile.leave()
+        # the worklist has no step budget, its summaries are always complete
+        summary = (
+            frozenset() if return_value is None else frozenset([return_value]), frozenset(executor.exception_set), True
+        )
+        self.call_summary_dict[key] = summary
+        return summary
 
-            case OpType.JS:
-                if self.compare == AbstractType.NEGATIVE_INT:
-                    operation_index = self.parser.label_dict[
-                        operation.operand_list[0]
-                    ]
-                    self.test(label_name, operation_index,limit_time)
-                    return AbstractType.Finish
+    def testfirst(self, label_name: str) -> Set[ExceptionType]:
+        if self.abstract_mode in DOMAIN_DICT:
+            # a domain analysis joins paths itself, the engine mode does not apply
+            domain = DOMAIN_DICT[self.abstract_mode]
+            return_set, exception_set, _ = self.domain_fixpoint(
+                label_name, tuple(domain.top() for _ in ARGUMENT_REGISTER_LIST)
+            )
+            self.exception_set |= exception_set
+            for value in return_set:
+                self.collector.add(self.finding(RESULT_KIND, label_name, None, value=value))
+            return self.exception_set
+        match self.engine_mode:
+            case EngineMode.PATH:
+                index = 0
+                operation_index = self.parser.label_dict[label_name]
+                if self.profile is not None:
+                    self.profile.add_path(label_name)
+                # z3 expressions can not be sent to a worker, path checking stays in this process;
+                # a profiled run stays too, the counters of the branch workers would be lost
+                if (
+                        self.branch_jobs > 1 and self.fan_out_depth > 0 and not self.path_check
+                        and self.profile is None
+                ):
+                    ir = self.parser if isinstance(self.parser, CompactIR) else self.parser.compact_ir()
+                    with ProcessPoolExecutor(self.branch_jobs, initializer=init_worker, initargs=([ir],)) as pool:
+                        self.pool = pool
+                        self.test(label_name, operation_index,index)
+                        for future in self.future_list:
+                            exception_set, skip_count, truncated_count, finding_list = future.result()
+                            self.exception_set |= exception_set
+                            for finding in finding_list:
+                                self.collector.add(finding)
+                            self.memo_skip_count += skip_count
+                            self.truncated_count += truncated_count
+                    self.pool = None
+                    self.future_list = []
+                else:
+                    self.test(label_name, operation_index,index)
+            case EngineMode.FIXPOINT:
+                self.fixpoint(label_name)
+        return self.exception_set
 
-            case OpType.JMP:
-                operation_index = self.parser.label_dict[operation.operand_list[0]]
-                self.test(label_name, operation_index,limit_time)
-                return AbstractType.Finish
 
-            case OpType.JLE:
-                if self.compare != AbstractType.POSITIVE_INT:
-                    operation_index = self.parser.label_dict[
-                        operation.operand_list[0]
-                    ]
-                    self.test(label_name, operation_index,limit_time)
-                    return AbstractType.Finish
+class FunctionReport:
+    # verdict of one function in a batch run
+    def __init__(
+            self, file_path: str, label_name: str, exception_set: Set[ExceptionType],
+            elapsed_time: float, error_message: str | None = None, skip_count: int = 0, truncated_count: int = 0,
+            pruned_count: int = 0, finding_list: List[Finding] | None = None
+    ) -> None:
+        self.file_path = file_path
+        self.label_name = label_name
+        self.exception_set = exception_set
+        self.elapsed_time = elapsed_time
+        self.error_message = error_message  # the analysis itself crashed
+        self.skip_count = skip_count  # re-explorations avoided by the memo
+        self.truncated_count = truncated_count  # paths cut by the step budget
+        self.pruned_count = pruned_count  # errors and forks the path condition ruled out
+        self.finding_list: List[Finding] = [] if finding_list is None else finding_list  # every path outcome
 
-            case OpType.JL:
-                if self.compare == AbstractType.NEGATIVE_INT:
-                    operation_index = self.parser.label_dict[
-                        operation.operand_list[0]
-                    ]
-                    self.test(label_name, operation_index,limit_time)
-                    return AbstractType.Finish
+    def status(self) -> str:
+        if self.error_message is not None:
+            return "crashed"
+        if self.exception_set:
+            return "ERROR"
+        if self.truncated_count > 0:
+            # no error found, but not every path was explored
+            return "truncated"
+        # paths the path condition ruled out were explored as far as they can run, pruned_count still says how many
+        return "finished"
 
-            case OpType.JNS:
-                if self.compare == AbstractType.POSITIVE_INT:
-                    operation_index = self.parser.label_dict[
-                        operation.operand_list[0]
-                    ]
-                    self.test(label_name, operation_index,limit_time)
-                    return AbstractType.Finish
+    def kind_list(self) -> List[str]:
+        return sorted(REPORT_KIND_DICT[i] for i in self.exception_set)
 
-            case OpType.JNE:
-                if self.compare != AbstractType.NEGATIVE_INT:
-                    operation_index = self.parser.label_dict[
-                        operation.operand_list[0]
-                    ]
-                    self.test(label_name, operation_index,limit_time)
-                    return AbstractType.Finish
+    def to_dict(self) -> Dict:
+        return {
+            "type": "function",
+            "file": self.file_path,
+            "function": self.label_name,
+            "status": self.status(),
+            "kinds": self.kind_list(),
+            "time": self.elapsed_time,
+            "error": self.error_message,
+            "skipped": self.skip_count,
+            "truncated": self.truncated_count,
+            "pruned": self.pruned_count,
+            "findings": len(self.finding_list),
+        }
 
-            case _:
-                raise Exception(OpType)
+    def __str__(self) -> str:
+        kind_str = ",".join(self.kind_list()) if self.exception_set else "-"
+        if self.error_message is not None:
+            kind_str = self.error_message
+        return (
+            f"{self.file_path}:{self.label_name} {self.status()} {kind_str} {self.elapsed_time:.4f} s"
+            f" skipped: {self.skip_count} truncated: {self.truncated_count} pruned: {self.pruned_count}"
+        )
 
-    def test(self, label_name: str, operation_index,limit_time):
-        while operation_index < len(self.parser.code_list):
-            limit_time=limit_time+1
-            code = self.parser.operation_list[operation_index]
-            operation = code.operation
-            if limit_time>100:
-                #  print("Out of loop limit.Program end")
-                return 0
 
-            result = self.run(label_name, operation, operation_index,limit_time)
-            if result == AbstractType.Finish:
-                return 0
-            elif result == AbstractType.ERROR:
-                print("ERROR")
-                return 1
-            operation_index = operation_index + 1
+REPORT_KIND_DICT: Dict[ExceptionType, str] = {
+    ExceptionType.ARITHMETIC_EXCEPTION: "divide-by-zero",
+    ExceptionType.OUT_OF_BOUNDS: "out-of-bounds",
+    ExceptionType.USER_DEFINED_EXCEPTION: "userDefinedException",
+}
+
+
+def analyse_parser(
+        parser: Parser | CompactIR, file_path: str, label_list: List[str] | None = None,
+        engine_mode: EngineMode | None = None, branch_jobs: int = 1, fan_out_depth: int = 0,
+        step_budget: int | None = None, abstract_mode: AbstractMode | None = None, path_check: bool = False,
+        sink: JsonlSink | None = None, echo: bool = False, profile: ExecutionProfile | None = None
+) -> List[FunctionReport]:
+    # every .globl function of one translation unit, sharing the parsed IR;
+    # the findings are streamed to sink as they come, the report of a function after it
+    if label_list is None:
+        label_list = [i for i in parser.function_list if i != "main"]
+    if profile is not None:
+        profile.file_path = file_path
+    report_list: List[FunctionReport] = []
+    for label_name in label_list:
+        executor = Abstractexecutor(
+            parser, engine_mode, branch_jobs, fan_out_depth, step_budget, abstract_mode, path_check
+        )
+        executor.collector = ResultCollector(file_path, sink, echo)
+        executor.profile = profile
+        error_message = None
+        start_time = time.time()
+        try:
+            executor.testfirst(label_name)
+        except Exception as e:
+            error_message = f"{type(e).__name__}: {e}"
+        elapsed_time = time.time() - start_time
+        report_list.append(
+            FunctionReport(
+                file_path, label_name, executor.exception_set, elapsed_time, error_message,
+                executor.memo_skip_count, executor.truncated_count, executor.pruned_count,
+                executor.collector.finding_list
+            )
+        )
+        if sink is not None:
+            sink.write(report_list[-1].to_dict())
+            sink.flush()
+    return report_list
+
 
-        print("result:", self.register_dict["eax"])
+# ir of every file in a parallel run, set once per worker process
+WORKER_IR_LIST: List[CompactIR] = []
 
-    def testfirst(self, label_name: str):
-        index = 0
-        operation_index = self.parser.label_dict[label_name]
-        self.test(label_name, operation_index,index)
+
+def init_worker(ir_list: List[CompactIR]) -> None:
+    global WORKER_IR_LIST
+    WORKER_IR_LIST = ir_list
+
+
+def analyse_task(
+        task: Tuple[int, str, str, EngineMode | None, int | None, AbstractMode | None, bool, bool]
+) -> Tuple[FunctionReport, ExecutionProfile | None]:
+    # the counters of a profiled task go back to the parent, which merges them
+    ir_index, file_path, label_name, engine_mode, step_budget, abstract_mode, path_check, profiled = task
+    profile = ExecutionProfile() if profiled else None
+    report = analyse_parser(
+        WORKER_IR_LIST[ir_index], file_path, [label_name], engine_mode,
+        step_budget=step_budget, abstract_mode=abstract_mode, path_check=path_check, profile=profile
+    )[0]
+    if profile is not None:
+        profile.finish()
+    return report, profile
+
+
+def explore_branch(
+        task: Tuple[str, int, int, int, AbstractMode, MachineState]
+) -> Tuple[Set[ExceptionType], int, int, List[Finding]]:
+    # one forked branch of a path run, explored locally in a worker process
+    label_name, operation_index, limit_time, step_budget, abstract_mode, state = task
+    executor = Abstractexecutor(
+        WORKER_IR_LIST[0], EngineMode.PATH, step_budget=step_budget, abstract_mode=abstract_mode
+    )
+    executor.state = state
+    executor.test(label_name, operation_index, limit_time)
+    return (
+        executor.exception_set, executor.memo_skip_count, executor.truncated_count, executor.collector.finding_list
+    )
+
+
+def load_ir(
+        file_path: str, label_list: List[str] | None = None, use_gcc: bool = True, lazy: bool = False
+) -> Parser | CompactIR:
+    # lazy parses only the functions label_list reaches, found through an index of the assembly file
+    if not lazy or label_list is None or file_path == "-":
+        return Parser(file_path, use_gcc=use_gcc)
+    index = SymbolIndex(assembly_file(file_path, use_gcc))
+    ir = index.compact_ir(label_list)
+    index.close()
+    return ir
+
+
+def analyse_files(
+        file_path_list: List[str], label_list: List[str] | None = None,
+        engine_mode: EngineMode | None = None, jobs: int = 1, branch_jobs: int = 1, fan_out_depth: int = 0,
+        step_budget: int | None = None, abstract_mode: AbstractMode | None = None, path_check: bool = False,
+        sink: JsonlSink | None = None, echo: bool = False, profile: ExecutionProfile | None = None,
+        use_gcc: bool = True, lazy: bool = False
+) -> List[FunctionReport]:
+    # jobs 0 uses every core, branch_jobs only applies to a serial run since pool workers cannot fork pools
+    if jobs == 0:
+        jobs = os.cpu_count() or 1
+    if branch_jobs == 0:
+        branch_jobs = os.cpu_count() or 1
+    if jobs == 1:
+        report_list: List[FunctionReport] = []
+        for file_path in file_path_list:
+            parser = load_ir(file_path, label_list, use_gcc, lazy)
+            report_list += analyse_parser(
+                parser, file_path, label_list, engine_mode, branch_jobs, fan_out_depth, step_budget, abstract_mode,
+                path_check, sink, echo, profile
+            )
+        return report_list
+
+    # parse in this process, the workers only get the compact ir
+    ir_list = [load_ir(i, label_list, use_gcc, lazy) for i in file_path_list]
+    ir_list = [i.compact_ir() if isinstance(i, Parser) else i for i in ir_list]
+    task_list = [
+        (ir_index, file_path, label_name, engine_mode, step_budget, abstract_mode, path_check, profile is not None)
+        for ir_index, file_path in enumerate(file_path_list)
+        for label_name in (
+            label_list if label_list is not None
+            else [i for i in ir_list[ir_index].function_list if i != "main"]
+        )
+    ]
+    # one function per task, their cost differs by orders of magnitude;
+    # map keeps the task order so the report does not depend on scheduling
+    with ProcessPoolExecutor(jobs, initializer=init_worker, initargs=(ir_list,)) as pool:
+        report_list = []
+        for report, task_profile in pool.map(analyse_task, task_list):
+            report_list.append(report)
+            if task_profile is not None:
+                profile.merge(task_profile)
+    # a worker can not write to the sink, its findings come back with the report
+    for report in report_list:
+        collector = ResultCollector(report.file_path, sink, echo, keep=False)
+        for finding in report.finding_list:
+            collector.add(finding)
+        if sink is not None:
+            sink.write(report.to_dict())
+    return report_list
 
 
 if __name__ == "__main__":
-    parser = Parser("userDefinedException.c")
+    argument_parser = argparse.ArgumentParser(description="sign abstraction of C/.s files")
+    argument_parser.add_argument(
+        "file", nargs="*", help="C or .s files, - reads assembly from stdin, all .globl functions are analysed"
+    )
+    argument_parser.add_argument(
+        "--no-gcc", action="store_true", help="read the .s file next to each C file instead of running gcc"
+    )
+    argument_parser.add_argument(
+        "--lazy", action="store_true",
+        help="with --function, parse only the functions it reaches; the findings are the same as without it"
+    )
+    argument_parser.add_argument("--function", action="append", help="only analyse these functions")
+    argument_parser.add_argument("--dump-ir", help="debugging, write the operations of every parsed file here")
+    argument_parser.add_argument(
+        "--engine", choices=[i.name.lower() for i in EngineMode], default=ENGINE_MODE.name.lower()
+    )
+    argument_parser.add_argument(
+        "--abstract-mode",
+        choices=[i.name.lower() for i in [AbstractMode.SIGN, AbstractMode.SIGN_SET, *DOMAIN_DICT]],
+        default=ABSTRACT_MODE.name.lower(),
+        help="sign_set forks only at conditional jumps, interval and constant run a fixpoint in their domain"
+    )
+    argument_parser.add_argument("--json", action="store_true", help="one JSON object per function")
+    argument_parser.add_argument(
+        "--jsonl", help="stream every finding and function report as JSON lines to this file, - for stdout"
+    )
+    argument_parser.add_argument("--verbose", action="store_true", help="print every finding as it is found")
+    argument_parser.add_argument(
+        "--profile", help="write operation, fork, path and label time counters as JSON to this file, - for stdout"
+    )
+    argument_parser.add_argument(
+        "--profile-sample", type=float, help="with --profile, also sample the running operation every this many seconds"
+    )
+    argument_parser.add_argument(
+        "--path-check", action="store_true", help="drop errors and forks whose path condition z3 refutes"
+    )
+    argument_parser.add_argument("--query-cache", help="json file z3 results are loaded from and saved to")
+    argument_parser.add_argument(
+        "--step-budget", type=int, default=STEP_BUDGET, help="operations on one path before it is truncated"
+    )
+    argument_parser.add_argument("--jobs", type=int, default=1, help="worker processes, 0 uses every core")
+    argument_parser.add_argument(
+        "--branch-jobs", type=int, default=1, help="worker processes for the branches of one function"
+    )
+    argument_parser.add_argument(
+        "--fan-out-depth", type=int, default=1, help="split levels whose branches go to the branch workers"
+    )
+    arguments = argument_parser.parse_args()
+    getfiles.DUMP_PATH = arguments.dump_ir
+
+    if not arguments.file:
+        parser = Parser("userDefinedException.c")
 
-    executor = Abstractexecutor(parser)
-    start_time = time.time()
+        executor = Abstractexecutor(parser)
+        executor.collector = ResultCollector(echo=True)
+        start_time = time.time()
 
-    executor.testfirst("fib3")
-    end_time = time.time()
-    elapsed_time = end_time - start_time
-    print(f"time: {elapsed_time} s")
+        executor.testfirst("fib3")
+        end_time = time.time()
+        elapsed_time = end_time - start_time
+        print(f"time: {elapsed_time} s")
+    else:
+        if arguments.query_cache is not None:
+            QUERY_CACHE.load(arguments.query_cache)
+        sink = None if arguments.jsonl is None else JsonlSink.open(arguments.jsonl)
+        profile = None
+        if arguments.profile is not None:
+            hook_list = [] if arguments.profile_sample is None else [SampleHook(arguments.profile_sample)]
+            profile = ExecutionProfile(hook_list + [JsonHook(arguments.profile)])
+        start_time = time.time()
+        report_list = analyse_files(
+            arguments.file, arguments.function, EngineMode[arguments.engine.upper()], arguments.jobs,
+            arguments.branch_jobs, arguments.fan_out_depth, arguments.step_budget,
+            AbstractMode[arguments.abstract_mode.upper()], arguments.path_check, sink, arguments.verbose, profile,
+            not arguments.no_gcc, arguments.lazy
+        )
+        if profile is not None:
+            profile.finish()
+        if sink is not None:
+            sink.close()
+        for report in report_list:
+            print(json.dumps(report.to_dict()) if arguments.json else report)
+        if not arguments.json:
+            error_count = sum(1 for i in report_list if i.status() != "finished")
+            print(f"{len(report_list)} functions, {error_count} not finished, time: {time.time() - start_time} s")
+            if arguments.path_check:
+                # only this process, the workers of --jobs keep caches of their own
+                print(f"z3 {QUERY_CACHE}")
+        QUERY_CACHE.save()
@@ -0,0 +1,238 @@
+from __future__ import annotations
+import argparse
+import importlib.util
+import json
+import os
+import sys
+import tempfile
+import time
+import timeit
+import tracemalloc
+from typing import List, Dict, Tuple
+
+# "Sign abstraction.py" is not a valid module name, load it from its path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+spec = importlib.util.spec_from_file_location(
+    "sign_abstraction", os.path.join(os.path.dirname(os.path.abspath(__file__)), "Sign abstraction.py")
+)
+sign_abstraction = importlib.util.module_from_spec(spec)
+sys.modules["sign_abstraction"] = sign_abstraction
+spec.loader.exec_module(sign_abstraction)
+
+AbstractType = sign_abstraction.AbstractType
+Sign_abstraction = sign_abstraction.Sign_abstraction
+Abstractexecutor = sign_abstraction.Abstractexecutor
+Parser = sign_abstraction.Parser
+ExecutionProfile = sign_abstraction.ExecutionProfile
+
+import workload
+
+WORKLOAD_LIST = ["div.s", "array.s", "foo.s", "userDefinedException.s"]
+# (shape, scales) of the synthetic workloads the suite generates next to the bundled ones
+SCALED_LIST = [
+    ("nested", [4, 8, 16]), ("loop", [1, 2, 3]), ("params", [4, 8, 12]), ("branches", [4, 8, 16]), ("calls", [2, 4, 8])
+]
+# knob of workload.workload_file -> its default scales in a sweep
+SWEEP_DICT = {
+    "branch_count": [1, 2, 4, 6, 8],
+    "loop_depth": [1, 2, 3, 4],
+    "call_depth": [1, 2, 4, 8, 16],
+    "array_count": [1, 2, 4, 8],
+    "division_count": [1, 2, 4, 8],
+}
+# a measure this many times its baseline is a regression, timings are noisier than memory
+TIME_TOLERANCE = 1.25
+MEMORY_TOLERANCE = 1.10
+TIME_FLOOR = 0.002  # seconds a time may grow by regardless, sub millisecond timings are mostly noise
+
+
+def sign_benchmark(number: int = 20_000) -> None:
+    # one arithmetic instruction, Sign_abstraction objects against the lookup tables
+    value_list = [
+        AbstractType.POSITIVE_INT, AbstractType.NEGATIVE_INT, AbstractType.ZERO, AbstractType.ANY_INT
+    ]
+    operation_list: List[Tuple[str, object, Tuple[AbstractType, ...]]] = [
+        ("add", Sign_abstraction.__add__, sign_abstraction.ADD_TABLE),
+        ("sub", Sign_abstraction.__sub__, sign_abstraction.SUB_TABLE),
+        ("imul", Sign_abstraction.__imul__, sign_abstraction.IMUL_TABLE),
+        ("idiv", Sign_abstraction.__idiv__, sign_abstraction.IDIV_TABLE),
+    ]
+    sign_operation = sign_abstraction.sign_operation
+    for name, function, table in operation_list:
+        pair_list = [(x, y) for x in value_list for y in value_list]
+
+        def run_class() -> None:
+            for x, y in pair_list:
+                result = function(Sign_abstraction(x), Sign_abstraction(y))
+                if result is not None:
+                    result.type
+
+        def run_table() -> None:
+            for x, y in pair_list:
+                sign_operation(table, x, y)
+
+        class_time = min(timeit.repeat(run_class, number=number, repeat=3)) / (number * len(pair_list))
+        table_time = min(timeit.repeat(run_table, number=number, repeat=3)) / (number * len(pair_list))
+        print(
+            f"{name:5} class: {class_time * 1e9:7.1f} ns  table: {table_time * 1e9:7.1f} ns"
+            f"  speedup: {class_time / table_time:5.1f}x"
+        )
+
+
+def profile_overhead_benchmark(repeat: int = 3) -> None:
+    # what a profile costs: every function of the bundled workloads, plain against profiled runs of the same closures
+    directory = os.path.dirname(os.path.abspath(__file__))
+    for file_name in WORKLOAD_LIST:
+        parser = Parser(os.path.join(directory, file_name))
+        label_list = [i for i in parser.function_list if i != "main"]
+        plain_time = min(timeit.repeat(lambda: analyse_all(parser, label_list), number=1, repeat=repeat))
+        profile_time = min(
+            timeit.repeat(lambda: analyse_all(parser, label_list, ExecutionProfile()), number=1, repeat=repeat)
+        )
+        print(
+            f"{file_name:24} plain: {plain_time * 1e3:8.2f} ms  profiled: {profile_time * 1e3:8.2f} ms"
+            f"  overhead: {profile_time / plain_time:5.1f}x"
+        )
+
+
+def analyse_all(parser: Parser, label_list: List[str], profile: ExecutionProfile | None = None) -> None:
+    for label_name in label_list:
+        executor = Abstractexecutor(parser)
+        executor.profile = profile
+        executor.testfirst(label_name)
+
+
+def measure_file(file_path: str, repeat: int) -> Dict[str, float | int]:
+    # best of repeat for the times, the paths and peak memory of one more run
+    parse_time = min(timeit.repeat(lambda: Parser(file_path, use_cache=False), number=1, repeat=repeat))
+    parser = Parser(file_path, use_cache=False)
+    label_list = [i for i in parser.function_list if i != "main"]
+    analysis_time = min(timeit.repeat(lambda: analyse_all(parser, label_list), number=1, repeat=repeat))
+    profile = ExecutionProfile()
+    analyse_all(parser, label_list, profile)
+    fork_count = sum(profile.fork_count_dict.values())
+    # tracemalloc slows every allocation, the peak gets a run of its own; the ir caches are per parser,
+    # so the fresh one is parsed and compiled inside the measured run
+    tracemalloc.start()
+    analyse_all(Parser(file_path, use_cache=False), label_list)
+    peak_memory = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return {
+        "parse": parse_time,
+        "analysis": analysis_time,
+        "paths": sum(profile.path_count_dict.values()),
+        "forks": fork_count,
+        "peak": peak_memory,
+    }
+
+
+def suite(repeat: int = 3) -> Dict[str, Dict[str, float | int]]:
+    # the bundled programs and the scaled synthetic ones; the .s files are used since gcc -S only gives the
+    # mingw layout the parser reads on windows
+    directory = os.path.dirname(os.path.abspath(__file__))
+    path_dict = {i: os.path.join(directory, i) for i in WORKLOAD_LIST}
+    with tempfile.TemporaryDirectory() as temp_directory:
+        for shape, scale_list in SCALED_LIST:
+            for scale in scale_list:
+                file_path = os.path.join(temp_directory, f"{shape}{scale}.s")
+                workload.scaled_file(file_path, shape, scale)
+                path_dict[f"{shape}{scale}"] = file_path
+        result_dict = {name: measure_file(file_path, repeat) for name, file_path in path_dict.items()}
+    return result_dict
+
+
+def sweep(
+        knob: str, scale_list: List[int], repeat: int = 3, knob_dict: Dict[str, int] | None = None
+) -> List[Tuple[int, Dict[str, float | int]]]:
+    # one generated workload per scale of the knob, the other knobs fixed by knob_dict;
+    # forks counts the branches the forks on ANY_INT started, paths grow with them
+    result_list = []
+    with tempfile.TemporaryDirectory() as temp_directory:
+        for scale in scale_list:
+            file_path = os.path.join(temp_directory, f"{knob}{scale}.s")
+            workload.workload_file(file_path, **{**({} if knob_dict is None else knob_dict), knob: scale})
+            result_list.append((scale, measure_file(file_path, repeat)))
+    return result_list
+
+
+def compare(result_dict: Dict[str, Dict], baseline_dict: Dict[str, Dict]) -> List[str]:
+    # every measure worse than the baseline allows; a changed path count means the analysis itself changed
+    regression_list = []
+    for name, result in result_dict.items():
+        baseline = baseline_dict.get(name)
+        if baseline is None:
+            continue
+        for key in ["parse", "analysis"]:
+            if result[key] > max(baseline[key] * TIME_TOLERANCE, baseline[key] + TIME_FLOOR):
+                regression_list.append(f"{name} {key}: {baseline[key] * 1e3:.2f} ms -> {result[key] * 1e3:.2f} ms")
+        if result["peak"] > baseline["peak"] * MEMORY_TOLERANCE:
+            regression_list.append(f"{name} peak: {baseline['peak'] / 1024:.0f} KiB -> {result['peak'] / 1024:.0f} KiB")
+        if result["paths"] != baseline["paths"]:
+            regression_list.append(f"{name} paths: {baseline['paths']} -> {result['paths']}")
+    return regression_list
+
+
+def print_suite(result_dict: Dict[str, Dict], baseline_dict: Dict[str, Dict] | None) -> None:
+    for name, result in result_dict.items():
+        line = (
+            f"{name:24} parse: {result['parse'] * 1e3:8.2f} ms  analysis: {result['analysis'] * 1e3:9.2f} ms"
+            f"  paths: {result['paths']:7}  forks: {result.get('forks', 0):7}  peak: {result['peak'] / 1024:8.0f} KiB"
+        )
+        baseline = None if baseline_dict is None else baseline_dict.get(name)
+        if baseline is not None:
+            line += f"  analysis vs baseline: {result['analysis'] / baseline['analysis']:5.2f}x"
+        print(line)
+
+
+if __name__ == "__main__":
+    argument_parser = argparse.ArgumentParser(description="benchmarks of the sign abstraction")
+    argument_parser.add_argument(
+        "--suite", action="store_true", help="parse and analyse every workload instead of the micro benchmarks"
+    )
+    argument_parser.add_argument("--repeat", type=int, default=3, help="runs a time is the best of")
+    argument_parser.add_argument("--save", help="write the suite results to this baseline file")
+    argument_parser.add_argument("--compare", help="baseline file, a regression against it exits with status 1")
+    argument_parser.add_argument(
+        "--sweep", choices=list(SWEEP_DICT), help="scale one knob of the generated workload, csv to stdout"
+    )
+    argument_parser.add_argument("--scales", type=int, nargs="+", help="scales of the sweep")
+    argument_parser.add_argument(
+        "--knob", action="append", default=[], metavar="NAME=VALUE", help="fix another knob of the sweep"
+    )
+    arguments = argument_parser.parse_args()
+
+    if arguments.sweep is not None:
+        knob_dict = {}
+        for knob in arguments.knob:
+            name, value = knob.split("=")
+            if name not in SWEEP_DICT and name != "parameter_count":
+                raise Exception(f"unknown knob {name}")
+            knob_dict[name] = int(value)
+        scale_list = SWEEP_DICT[arguments.sweep] if arguments.scales is None else arguments.scales
+        print(f"{arguments.sweep},forks,paths,parse,analysis,peak")
+        for scale, result in sweep(arguments.sweep, scale_list, arguments.repeat, knob_dict):
+            print(
+                f"{scale},{result['forks']},{result['paths']},{result['parse']:.6f},{result['analysis']:.6f},"
+                f"{result['peak']}"
+            )
+    elif not arguments.suite:
+        sign_benchmark()
+        profile_overhead_benchmark(arguments.repeat)
+    else:
+        baseline_dict = None
+        if arguments.compare is not None:
+            with open(arguments.compare) as f:
+                baseline_dict = json.load(f)["workloads"]
+        start_time = time.time()
+        result_dict = suite(arguments.repeat)
+        print_suite(result_dict, baseline_dict)
+        print(f"{len(result_dict)} workloads, time: {time.time() - start_time:.1f} s")
+        if arguments.save is not None:
+            with open(arguments.save, "w") as f:
+                json.dump({"python": sys.version.split()[0], "workloads": result_dict}, f, indent=1)
+        if baseline_dict is not None:
+            regression_list = compare(result_dict, baseline_dict)
+            for regression in regression_list:
+                print(f"REGRESSION {regression}")
+            if len(regression_list) > 0:
+                sys.exit(1)
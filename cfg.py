@@ -0,0 +1,174 @@
+from __future__ import annotations
+from getfiles import Parser, CompactIR, OpType
+from typing import List, Dict, Set
+from weakref import WeakKeyDictionary
+import bisect
+
+JUMP_TYPE_SET = {
+    OpType.JGE, OpType.JG, OpType.JS, OpType.JMP, OpType.JLE, OpType.JL, OpType.JNS, OpType.JNE
+}
+
+
+class BasicBlock:
+    def __init__(self, start_index: int, end_index: int) -> None:
+        self.start_index = start_index
+        self.end_index = end_index  # one past the last operation
+        self.successor_list: List[int] = []  # start index of every successor block
+        self.predecessor_list: List[int] = []
+        self.callee: str | None = None  # the block ends with a call of this label
+
+    def __str__(self) -> str:
+        return f"[{self.start_index}, {self.end_index}) -> {self.successor_list}"
+
+
+class FunctionCFG:
+    # basic blocks reachable from one function label, keyed by their first operation index
+    def __init__(self, parser: Parser | CompactIR, label_name: str) -> None:
+        self.label_name = label_name
+        self.entry_index = parser.label_dict[label_name]
+        self.block_dict: Dict[int, BasicBlock] = {}
+        # every label starts a block, so every jump target is a block start
+        leader_set = set(parser.label_dict.values())
+        operation_count = len(parser.operation_list)
+
+        worklist = [self.entry_index]
+        while len(worklist) > 0:
+            start_index = worklist.pop()
+            if start_index in self.block_dict or start_index >= operation_count:
+                continue
+            end_index = start_index
+            successor_list: List[int] = []
+            callee = None
+            while True:
+                operation = parser.operation_list[end_index].operation
+                end_index = end_index + 1
+                if operation.type in JUMP_TYPE_SET:
+                    successor_list.append(parser.label_dict[operation.operand_list[0]])
+                    if operation.type != OpType.JMP:
+                        successor_list.append(end_index)
+                    break
+                if operation.type == OpType.RET:
+                    break
+                if operation.type == OpType.CALL:
+                    callee = operation.operand_list[0]
+                    successor_list.append(end_index)
+                    break
+                if end_index >= operation_count:
+                    break
+                if end_index in leader_set:
+                    successor_list.append(end_index)
+                    break
+            block = BasicBlock(start_index, end_index)
+            block.successor_list = [i for i in successor_list if i < operation_count]
+            block.callee = callee
+            self.block_dict[start_index] = block
+            worklist += block.successor_list
+
+        for block in self.block_dict.values():
+            for successor_index in block.successor_list:
+                self.block_dict[successor_index].predecessor_list.append(block.start_index)
+
+        self.order_list = self.reverse_postorder()
+        self.dominator_dict = self.dominators()
+        # a back edge goes to a block that dominates its source
+        self.loop_head_set: Set[int] = {
+            successor_index
+            for block in self.block_dict.values()
+            for successor_index in block.successor_list
+            if successor_index in self.dominator_dict[block.start_index]
+        }
+        # blocks some path from which reaches a loop head, the heads themselves included
+        self.loop_reach_set: Set[int] = set()
+        worklist = list(self.loop_head_set)
+        while len(worklist) > 0:
+            block_index = worklist.pop()
+            if block_index not in self.loop_reach_set:
+                self.loop_reach_set.add(block_index)
+                worklist += self.block_dict[block_index].predecessor_list
+        self.start_list = sorted(self.block_dict)
+
+    def reverse_postorder(self) -> List[int]:
+        order_list: List[int] = []
+        visited_set = {self.entry_index}
+        stack = [(self.entry_index, iter(self.block_dict[self.entry_index].successor_list))]
+        while len(stack) > 0:
+            block_index, successor_iter = stack[-1]
+            for successor_index in successor_iter:
+                if successor_index not in visited_set:
+                    visited_set.add(successor_index)
+                    stack.append((successor_index, iter(self.block_dict[successor_index].successor_list)))
+                    break
+            else:
+                stack.pop()
+                order_list.append(block_index)
+        order_list.reverse()
+        return order_list
+
+    def dominators(self) -> Dict[int, Set[int]]:
+        # iterative data flow, a block is dominated by itself and by what dominates all its predecessors
+        all_set = set(self.block_dict)
+        dominator_dict = {i: all_set for i in self.block_dict}
+        dominator_dict[self.entry_index] = {self.entry_index}
+        changed = True
+        while changed:
+            changed = False
+            for block_index in self.order_list[1:]:
+                predecessor_list = self.block_dict[block_index].predecessor_list
+                dominator_set = set.intersection(*[dominator_dict[i] for i in predecessor_list])
+                dominator_set = dominator_set | {block_index}
+                if dominator_set != dominator_dict[block_index]:
+                    dominator_dict[block_index] = dominator_set
+                    changed = True
+        return dominator_dict
+
+    def dominates(self, a: int, b: int) -> bool:
+        # every path from the entry to block b goes through block a
+        return a in self.dominator_dict[b]
+
+    def reaches_loop(self, operation_index: int) -> bool:
+        # whether a path on from this operation can get to a loop head
+        block_index = self.start_list[bisect.bisect_right(self.start_list, operation_index) - 1]
+        return block_index in self.loop_reach_set
+
+    def print(self) -> None:
+        print(f"---{self.label_name}---")
+        for block_index in self.order_list:
+            block = self.block_dict[block_index]
+            loop_str = " loop head" if block_index in self.loop_head_set else ""
+            print(f"{block}{loop_str}")
+
+
+# cfg of every function already built, per parsed file
+CFG_CACHE: WeakKeyDictionary = WeakKeyDictionary()
+
+
+def function_cfg(parser: Parser | CompactIR, label_name: str) -> FunctionCFG:
+    cfg_dict: Dict[str, FunctionCFG] = CFG_CACHE.setdefault(parser, {})
+    if label_name not in cfg_dict:
+        cfg_dict[label_name] = FunctionCFG(parser, label_name)
+    return cfg_dict[label_name]
+
+
+# (sorted label indexes, their labels) per parsed file
+LABEL_INDEX_CACHE: WeakKeyDictionary = WeakKeyDictionary()
+
+
+def source_label(parser: Parser | CompactIR, operation_index: int | None) -> str | None:
+    # the last label at or before an operation
+    if operation_index is None:
+        return None
+    if parser not in LABEL_INDEX_CACHE:
+        pair_list = sorted((index, name) for name, index in parser.label_dict.items())
+        LABEL_INDEX_CACHE[parser] = ([i[0] for i in pair_list], [i[1] for i in pair_list])
+    index_list, name_list = LABEL_INDEX_CACHE[parser]
+    position = bisect.bisect_right(index_list, operation_index) - 1
+    if position < 0:
+        return None
+    return name_list[position]
+
+
+# test code
+if __name__ == "__main__":
+    parser = Parser("foo.c")
+    for label_name in parser.function_list:
+        function_cfg(parser, label_name).print()
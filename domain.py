@@ -0,0 +1,351 @@
+from __future__ import annotations
+from getfiles import Address
+from typing import List, Dict, Tuple
+import math
+
+INDEX_LIMIT = 64  # array indexes enumerated before an index range counts as unbounded
+
+
+class Interval:
+    # integers lo..hi, an infinite bound is math.inf or -math.inf
+    __slots__ = ("lo", "hi")
+
+    def __init__(self, lo: int | float, hi: int | float) -> None:
+        self.lo = lo
+        self.hi = hi
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, Interval) and self.lo == other.lo and self.hi == other.hi
+
+    def __hash__(self) -> int:
+        return hash((self.lo, self.hi))
+
+    def __str__(self) -> str:
+        return f"[{self.lo}, {self.hi}]"
+
+    __repr__ = __str__
+
+
+class Constant:
+    # one known integer, None when it is not known
+    __slots__ = ("value",)
+
+    def __init__(self, value: int | None) -> None:
+        self.value = value
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, Constant) and self.value == other.value
+
+    def __hash__(self) -> int:
+        return hash(self.value)
+
+    def __str__(self) -> str:
+        return "Any Int" if self.value is None else str(self.value)
+
+    __repr__ = __str__
+
+
+def trunc_div(x: int | float, y: int | float) -> int | float:
+    # c division rounds towards zero, an infinite divisor gives zero
+    if math.isinf(y):
+        return 0
+    if math.isinf(x):
+        return x if y > 0 else -x
+    quotient = abs(x) // abs(y)
+    return quotient if (x < 0) == (y < 0) else -quotient
+
+
+def mul_bound(x: int | float, y: int | float) -> int | float:
+    # zero times an infinite bound is zero
+    if x == 0 or y == 0:
+        return 0
+    return x * y
+
+
+class Domain:
+    # the lattice and transfer functions a value analysis needs, a sign mask has 1 negative, 2 zero, 4 positive
+    name = "Domain"
+
+    def top(self):
+        raise Exception(f"{self.name} has no top")
+
+    def constant(self, n: int):
+        raise Exception(f"{self.name} has no constants")
+
+    def join(self, x, y):
+        raise Exception(f"{self.name} has no join")
+
+    def widen(self, x, y):
+        # a domain without infinite ascending chains can just join
+        return self.join(x, y)
+
+    def add(self, x, y):
+        raise Exception(f"{self.name} has no add")
+
+    def sub(self, x, y):
+        raise Exception(f"{self.name} has no sub")
+
+    def mul(self, x, y):
+        raise Exception(f"{self.name} has no mul")
+
+    def div(self, x, y) -> Tuple[object | None, bool]:
+        # the quotient, None when the divisor is always zero, and whether it can be zero
+        raise Exception(f"{self.name} has no div")
+
+    def sign_mask(self, x) -> int:
+        raise Exception(f"{self.name} has no sign mask")
+
+    def refine_sign(self, x, y, sign_bit: int) -> Tuple[object, object] | None:
+        # x and y where the sign of x - y is sign_bit, None when they never are
+        raise Exception(f"{self.name} has no refine")
+
+    def index_list(self, x) -> List[int] | None:
+        # every value x can take, None when there are too many
+        raise Exception(f"{self.name} has no index list")
+
+    def compare(self, x, y) -> int:
+        # the sign mask of x - y
+        return self.sign_mask(self.sub(x, y))
+
+    def refine(self, x, y, compare_mask: int) -> Tuple[object, object] | None:
+        result = None
+        for sign_bit in [1, 2, 4]:
+            if not compare_mask & sign_bit:
+                continue
+            refined = self.refine_sign(x, y, sign_bit)
+            if refined is None:
+                continue
+            if result is None:
+                result = refined
+            else:
+                result = (self.join(result[0], refined[0]), self.join(result[1], refined[1]))
+        return result
+
+
+class IntervalDomain(Domain):
+    name = "Interval"
+
+    def top(self) -> Interval:
+        return Interval(-math.inf, math.inf)
+
+    def constant(self, n: int) -> Interval:
+        return Interval(n, n)
+
+    def join(self, x: Interval, y: Interval) -> Interval:
+        return Interval(min(x.lo, y.lo), max(x.hi, y.hi))
+
+    def widen(self, x: Interval, y: Interval) -> Interval:
+        # a bound that still moves jumps to infinity
+        return Interval(x.lo if y.lo >= x.lo else -math.inf, x.hi if y.hi <= x.hi else math.inf)
+
+    def meet(self, x: Interval, y: Interval) -> Interval | None:
+        lo = max(x.lo, y.lo)
+        hi = min(x.hi, y.hi)
+        if lo > hi:
+            return None
+        return Interval(lo, hi)
+
+    def add(self, x: Interval, y: Interval) -> Interval:
+        return Interval(x.lo + y.lo, x.hi + y.hi)
+
+    def sub(self, x: Interval, y: Interval) -> Interval:
+        return Interval(x.lo - y.hi, x.hi - y.lo)
+
+    def mul(self, x: Interval, y: Interval) -> Interval:
+        bound_list = [mul_bound(a, b) for a in [x.lo, x.hi] for b in [y.lo, y.hi]]
+        return Interval(min(bound_list), max(bound_list))
+
+    def div(self, x: Interval, y: Interval) -> Tuple[Interval | None, bool]:
+        # divide by the negative and the positive part of the divisor, zero itself is reported
+        result = None
+        for part in [self.meet(y, Interval(-math.inf, -1)), self.meet(y, Interval(1, math.inf))]:
+            if part is None:
+                continue
+            bound_list = [trunc_div(a, b) for a in [x.lo, x.hi] for b in [part.lo, part.hi]]
+            quotient = Interval(min(bound_list), max(bound_list))
+            result = quotient if result is None else self.join(result, quotient)
+        return result, y.lo <= 0 <= y.hi
+
+    def sign_mask(self, x: Interval) -> int:
+        mask = 0
+        if x.lo < 0:
+            mask |= 1
+        if x.lo <= 0 <= x.hi:
+            mask |= 2
+        if x.hi > 0:
+            mask |= 4
+        return mask
+
+    def refine_sign(self, x: Interval, y: Interval, sign_bit: int) -> Tuple[Interval, Interval] | None:
+        match sign_bit:
+            case 1:
+                x_refined = self.meet(x, Interval(-math.inf, y.hi - 1))
+                y_refined = self.meet(y, Interval(x.lo + 1, math.inf))
+            case 2:
+                x_refined = self.meet(x, y)
+                y_refined = x_refined
+            case 4:
+                x_refined = self.meet(x, Interval(y.lo + 1, math.inf))
+                y_refined = self.meet(y, Interval(-math.inf, x.hi - 1))
+            case _:
+                raise Exception(sign_bit)
+        if x_refined is None or y_refined is None:
+            return None
+        return x_refined, y_refined
+
+    def index_list(self, x: Interval) -> List[int] | None:
+        if math.isinf(x.lo) or math.isinf(x.hi) or x.hi - x.lo >= INDEX_LIMIT:
+            return None
+        return list(range(x.lo, x.hi + 1))
+
+
+class ConstantDomain(Domain):
+    name = "Constant"
+
+    def top(self) -> Constant:
+        return Constant(None)
+
+    def constant(self, n: int) -> Constant:
+        return Constant(n)
+
+    def join(self, x: Constant, y: Constant) -> Constant:
+        return x if x == y else Constant(None)
+
+    def add(self, x: Constant, y: Constant) -> Constant:
+        if x.value is None or y.value is None:
+            return Constant(None)
+        return Constant(x.value + y.value)
+
+    def sub(self, x: Constant, y: Constant) -> Constant:
+        if x.value is None or y.value is None:
+            return Constant(None)
+        return Constant(x.value - y.value)
+
+    def mul(self, x: Constant, y: Constant) -> Constant:
+        if x.value == 0 or y.value == 0:
+            return Constant(0)
+        if x.value is None or y.value is None:
+            return Constant(None)
+        return Constant(x.value * y.value)
+
+    def div(self, x: Constant, y: Constant) -> Tuple[Constant | None, bool]:
+        if y.value == 0:
+            return None, True
+        if y.value is None:
+            return Constant(0 if x.value == 0 else None), True
+        if x.value is None:
+            return Constant(None), False
+        return Constant(trunc_div(x.value, y.value)), False
+
+    def sign_mask(self, x: Constant) -> int:
+        if x.value is None:
+            return 7
+        if x.value < 0:
+            return 1
+        if x.value == 0:
+            return 2
+        return 4
+
+    def refine_sign(self, x: Constant, y: Constant, sign_bit: int) -> Tuple[Constant, Constant] | None:
+        if x.value is None or y.value is None:
+            # only equality carries a known constant over to the other side
+            if sign_bit == 2:
+                known = x if x.value is not None else y
+                return known, known
+            return x, y
+        if self.sign_mask(Constant(x.value - y.value)) != sign_bit:
+            return None
+        return x, y
+
+    def index_list(self, x: Constant) -> List[int] | None:
+        if x.value is None:
+            return None
+        return [x.value]
+
+
+class DomainState:
+    # registers, written memory slots and the last compare of a domain analysis, ints are stack addresses
+    def __init__(
+            self, domain: Domain, register_dict: Dict[str, object], memory_dict: Dict[int, object],
+            compare: Tuple | None = None
+    ) -> None:
+        self.domain = domain
+        self.register_dict = register_dict
+        self.memory_dict = memory_dict
+        # (operation index, first operand, second operand, first value, second value) of the last cmp
+        self.compare = compare
+
+    def __eq__(self, other: DomainState) -> bool:
+        return (
+                self.register_dict == other.register_dict
+                and self.memory_dict == other.memory_dict
+                and self.compare == other.compare
+        )
+
+    def copy(self) -> DomainState:
+        return DomainState(self.domain, self.register_dict.copy(), self.memory_dict.copy(), self.compare)
+
+    def load(self, address: int) -> object:
+        # slots nobody wrote, the stack arguments among them, can hold anything
+        if address in self.memory_dict:
+            return self.memory_dict[address]
+        return self.domain.top()
+
+    def get_value(self, x: str | Address | int) -> object:
+        if isinstance(x, str):
+            if x in self.register_dict:
+                return self.register_dict[x]
+            return self.domain.top()
+        elif isinstance(x, Address):
+            base = self.get_value(x.operand)
+            if isinstance(base, int):
+                return self.load(base + x.offset)
+            return self.domain.top()
+        elif isinstance(x, int):
+            return self.domain.constant(x)
+        else:
+            raise Exception(x)
+
+    def get_number(self, x: str | Address | int) -> object:
+        # an operand of arithmetic, an address there is not tracked
+        value = self.get_value(x)
+        if isinstance(value, int):
+            return self.domain.top()
+        return value
+
+    def assign_value(self, destination: str | Address, value: object) -> None:
+        if isinstance(destination, str):
+            self.register_dict[destination] = value
+        elif isinstance(destination, Address):
+            base = self.get_value(destination.operand)
+            if isinstance(base, int):
+                self.memory_dict[base + destination.offset] = value
+        else:
+            raise Exception(destination)
+
+    def combine(self, other: DomainState, combine_value) -> DomainState:
+        def combine_one(x: object, y: object) -> object:
+            if x == y:
+                return x
+            if isinstance(x, int) or isinstance(y, int):
+                return self.domain.top()
+            return combine_value(x, y)
+
+        top = self.domain.top()
+        register_dict = {
+            key: combine_one(self.register_dict.get(key, top), other.register_dict.get(key, top))
+            for key in self.register_dict.keys() | other.register_dict.keys()
+        }
+        memory_dict = {
+            key: combine_one(self.load(key), other.load(key))
+            for key in self.memory_dict.keys() | other.memory_dict.keys()
+        }
+        compare = self.compare if self.compare == other.compare else None
+        return DomainState(self.domain, register_dict, memory_dict, compare)
+
+    def join(self, other: DomainState) -> DomainState:
+        return self.combine(other, self.domain.join)
+
+    def widen(self, other: DomainState) -> DomainState:
+        # self is the state already at the loop head
+        return self.combine(other, self.domain.widen)
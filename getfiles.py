@@ -1,8 +1,14 @@
 from __future__ import annotations
+import hashlib
+import io
+import mmap
 import os
+import pickle
 import re
+import sys
+import zlib
 from enum import Enum
-from typing import List, Dict
+from typing import BinaryIO, Callable, Iterator, List, Dict, Set, TextIO, Tuple
 
 
 class CodeType(Enum):
@@ -33,244 +39,151 @@ class OpType(Enum):
     JLE = 19
     JS = 20
     JGE = 21
-    JL = 21
+    JL = 22
 
 
+# precompiled operand grammars
+ADDRESS_RE = re.compile(r"(-?\d*)\[([^\]]+)\]")  # -12[rbp]
+ARRAY_ADDRESS_RE = re.compile(r"(-?\d*)\[(\w+)\+(\w+)\*4\]")  # -12[rbp+rax*4]
+
+def parse_offset(offset_str: str) -> int:
+    if offset_str == "" or offset_str == "-":
+        return 0
+    return int(offset_str)
+
+
+# every register an operand can name, a register file keeps them in this slot order
+REGISTER_LIST: List[str] = [
+    "ret", "rip",
+    "rax", "rbx", "rcx", "rdx", "rsi", "rdi", "rbp", "rsp",
+    "r8", "r9", "r10", "r11", "r12", "r13", "r14", "r15",
+    "eax", "ebx", "ecx", "edx", "esi", "edi", "ebp", "esp",
+    "r8d", "r9d", "r10d", "r11d", "r12d", "r13d", "r14d", "r15d",
+]
+REGISTER_SLOT_DICT: Dict[str, int] = {register: slot for slot, register in enumerate(REGISTER_LIST)}
+
 
 class Address:
+    __slots__ = ("offset", "operand")
+
     def __init__(self, raw_str: str) -> None:
-        result = re.search(r"[\-]{0,1}[\d]*\[.+\]", raw_str)
-        address_str = result.group(0)
-        offset_result = re.search(r"-{0,1}\d+", address_str)
-        if offset_result != None:
-            self.offset = int(offset_result.group(0))
-        else:
-            self.offset = 0
-        operand_result = re.search(r"\[(.+)\]", address_str)
-        self.operand = operand_result.group(1)
+        result = ADDRESS_RE.search(raw_str)
+        if result is None:
+            raise Exception(raw_str)
+        self.offset = parse_offset(result.group(1))
+        self.operand = result.group(2)
 
     def __str__(self) -> str:
         return f"offset: {self.offset}, operand: {self.operand}"
 
 
 class ArrayAddress:
+    __slots__ = ("offset", "operand1", "operand2")
+
     def __init__(self, raw_str: str) -> None:
-        result = re.search(r"[\-]{0,1}[\d]*\[.+\]", raw_str)
-        address_str = result.group(0)
-        offset_result = re.search(r"-{0,1}\d+", address_str)
-        if offset_result != None:
-            self.offset = int(offset_result.group(0))
-        else:
-            self.offset = 0
-        operand_result = re.search(r"\[(\w+)\+(\w+)\*4\]", address_str)
-        self.operand1 = operand_result.group(1)
-        self.operand2 = operand_result.group(2)
+        result = ARRAY_ADDRESS_RE.search(raw_str)
+        if result is None:
+            raise Exception(raw_str)
+        self.offset = parse_offset(result.group(1))
+        self.operand1 = result.group(2)
+        self.operand2 = result.group(3)
 
     def __str__(self) -> str:
         return f"offset: {self.offset}, operand: {self.operand1, self.operand2}"
 
 
-class Operation:
-    def __init__(self, raw_str: str) -> None:
-        self.operand_list: List[str | int | Address] = []
-
-        if "push" in raw_str:
-            if "[" in raw_str:
-                raise Exception(raw_str)
-            self.type = OpType.PUSH
-            result = re.search(r"(\bpush\b)\s+(\b\w+)", raw_str)
-            self.operand_list = [result.group(2)]
-
-        elif "call" in raw_str:
-            if "[" in raw_str:
-                raise Exception(raw_str)
-            self.type = OpType.CALL
-            result = re.search(r"\bcall\b\s+(\b\w+)", raw_str)
-            self.operand_list = [result.group(1)]
-
-        elif "jge" in raw_str:
-            if "[" in raw_str:
-                raise Exception(raw_str)
-            self.type = OpType.JGE
-            result = re.search(r"\bjge\b\s+([\w\.]+)", raw_str)
-            self.operand_list = [result.group(1)]
-
-        elif "jg" in raw_str:
-            if "[" in raw_str:
-                raise Exception(raw_str)
-            self.type = OpType.JG
-            result = re.search(r"\bjg\b\s+([\w\.]+)", raw_str)
-            self.operand_list = [result.group(1)]
-
-        elif "jmp" in raw_str:
-            if "[" in raw_str:
-                raise Exception(raw_str)
-            self.type = OpType.JMP
-            result = re.search(r"\bjmp\b\s+([\w\.]+)", raw_str)
-            self.operand_list = [result.group(1)]
-
-        elif "jne" in raw_str:
-            if "[" in raw_str:
-                raise Exception(raw_str)
-            self.type = OpType.JNE
-            result = re.search(r"\bjne\b\s+([\w\.]+)", raw_str)
-            self.operand_list = [result.group(1)]
-
-        elif "jns" in raw_str:
-            if "[" in raw_str:
-                raise Exception(raw_str)
-            self.type = OpType.JNS
-            result = re.search(r"\bjns\b\s+([\w\.]+)", raw_str)
-            self.operand_list = [result.group(1)]
-
-        elif "jle" in raw_str:
-            if "[" in raw_str:
-                raise Exception(raw_str)
-            self.type = OpType.JLE
-            result = re.search(r"\bjle\b\s+([\w\.]+)", raw_str)
-            self.operand_list = [result.group(1)]
-
-        elif "jl" in raw_str:
-            if "[" in raw_str:
-                raise Exception(raw_str)
-            self.type = OpType.JL
-            result = re.search(r"\bjl\b\s+([\w\.]+)", raw_str)
-            self.operand_list = [result.group(1)]
-
-        elif "js" in raw_str:
-            if "[" in raw_str:
-                raise Exception(raw_str)
-            self.type = OpType.JS
-            result = re.search(r"\bjs\b\s+([\w\.]+)", raw_str)
-            self.operand_list = [result.group(1)]
-
-        elif "mov" in raw_str:
-            self.type = OpType.MOV
-            raw_str = raw_str.replace("rax", "eax")
-            result = re.search(r"(\bmov\b)\s+(\b.+),\s+(\b.+)", raw_str)
-            for i in range(2, 4):
-                operand_str = result.group(i)
-                if "[" in operand_str:
-                    if "*" not in operand_str:
-                        self.operand_list.append(Address(operand_str))
-                    else:
-                        self.operand_list.append(ArrayAddress(operand_str))
-                elif operand_str.lstrip("-").isdigit():
-                    self.operand_list.append(int(operand_str))
-                else:
-                    self.operand_list.append(operand_str)
-
-        elif "idiv" in raw_str:
-            self.type = OpType.IDIV
-            result = re.search(r"idiv\s+(\b.+)", raw_str)
-            operand_str = result.group(1)
-            if "[" in operand_str:
-                self.operand_list.append(Address(operand_str))
-            elif operand_str.lstrip("-").isdigit():
-                raise Exception
-                self.operand_list.append(int(operand_str))
-            else:
-                self.operand_list.append(operand_str)
-
-        elif "imul" in raw_str:
-            self.type = OpType.IMUL
-            result = re.search(r"\bimul\b\s+(\b.+),\s+(\b.+),\s+(\b.+)", raw_str)
-            para_num = 3
-            if result == None:
-                result = re.search(r"\bimul\b\s+(\b.+),\s+(\b.+)", raw_str)
-                para_num = 2
-            for i in range(1, 1 + para_num):
-                operand_str = result.group(i)
-                if "[" in operand_str:
-                    self.operand_list.append(Address(operand_str))
-                elif operand_str.lstrip("-").isdigit():
-                    self.operand_list.append(int(operand_str))
-                else:
-                    self.operand_list.append(operand_str)
-
-        elif "sub" in raw_str:
-            self.type = OpType.SUB
-            result = re.search(r"\bsub\b\s+(\b.+),\s+(\b.+)", raw_str)
-            for i in range(1, 3):
-                operand_str = result.group(i)
-                if "[" in operand_str:
-                    self.operand_list.append(Address(operand_str))
-                elif operand_str.isdigit():
-                    self.operand_list.append(int(operand_str))
-                else:
-                    self.operand_list.append(operand_str)
-
-        elif "add" in raw_str:
-            self.type = OpType.ADD
-            result = re.search(r"\badd\b\s+(\b.+),\s+(\b.+)", raw_str)
-            for i in range(1, 3):
-                operand_str = result.group(i)
-                if "[" in operand_str:
-                    self.operand_list.append(Address(operand_str))
-                elif operand_str.isdigit():
-                    self.operand_list.append(int(operand_str))
-                else:
-                    self.operand_list.append(operand_str)
-
-        elif "sal" in raw_str:
-            if "[" in raw_str:
-                raise Exception(raw_str)
-            self.type = OpType.SAL
-            result = re.search(r"sal\s+(\w+),\s+([\w]+)", raw_str)
-            for i in range(1, 3):
-                operand_str = result.group(i)
-                if operand_str.isdigit():
-                    self.operand_list.append(int(operand_str))
-                else:
-                    self.operand_list.append(operand_str)
-
-        elif "lea" in raw_str:
-            self.type = OpType.LEA
-            result = re.search(r"\blea\b\s+(.+),\s+(.+)", raw_str)
-            for i in range(1, 3):
-                operand_str = result.group(i)
-                operand_str = operand_str.replace("rdx", "edx")
-                operand_str = operand_str.replace("rax", "eax")
-                if "[" in operand_str:
-                    self.operand_list.append(Address(operand_str))
-                elif operand_str.isdigit():
-                    raise Exception(operand_str)
-                else:
-                    self.operand_list.append(operand_str)
-
-        elif "cmp" in raw_str:
-            self.type = OpType.CMP
-            result = re.search(r"\bcmp\b\s+(\b.+),\s+(\b.+)", raw_str)
-            for i in range(1, 3):
-                operand_str = result.group(i)
-                if "[" in operand_str:
-                    self.operand_list.append(Address(operand_str))
-                elif operand_str.isdigit():
-                    self.operand_list.append(int(operand_str))
-                else:
-                    self.operand_list.append(operand_str)
+def parse_operand(operand_str: str) -> str | int | Address | ArrayAddress:
+    if "[" in operand_str:
+        if "*" in operand_str:
+            return ArrayAddress(operand_str)
+        return Address(operand_str)
+    if operand_str.lstrip("-").isdigit():
+        return int(operand_str)
+    return operand_str
 
-        elif "pop" in raw_str:
-            if "[" in raw_str:
-                raise Exception(raw_str)
-            self.type = OpType.POP
-            result = re.search(r"pop\s+(\w+)", raw_str)
-            self.operand_list.append(result.group(1))
 
-        elif "ret" in raw_str:
-            self.type = OpType.RET
+def name_grammar(raw_str: str, operand_str_list: List[str]) -> List[str | int | Address | ArrayAddress]:
+    # a register or a label
+    if "[" in operand_str_list[0]:
+        raise Exception(raw_str)
+    return operand_str_list
 
-        elif "cdq" in raw_str:
-            self.type = OpType.CDQ
 
-        elif "nop" in raw_str:
-            self.type = OpType.NOP
+def value_grammar(raw_str: str, operand_str_list: List[str]) -> List[str | int | Address | ArrayAddress]:
+    return [parse_operand(i) for i in operand_str_list]
 
-        else:
+
+def mov_grammar(raw_str: str, operand_str_list: List[str]) -> List[str | int | Address | ArrayAddress]:
+    return [parse_operand(i.replace("rax", "eax")) for i in operand_str_list]
+
+
+def lea_grammar(raw_str: str, operand_str_list: List[str]) -> List[str | int | Address | ArrayAddress]:
+    operand_list = [parse_operand(i.replace("rdx", "edx").replace("rax", "eax")) for i in operand_str_list]
+    if isinstance(operand_list[1], int):
+        raise Exception(raw_str)
+    return operand_list
+
+
+def idiv_grammar(raw_str: str, operand_str_list: List[str]) -> List[str | int | Address | ArrayAddress]:
+    operand_list = [parse_operand(operand_str_list[0])]
+    if isinstance(operand_list[0], int):
+        raise Exception(raw_str)
+    return operand_list
+
+
+def sal_grammar(raw_str: str, operand_str_list: List[str]) -> List[str | int | Address | ArrayAddress]:
+    if "[" in operand_str_list[0]:
+        raise Exception(raw_str)
+    return [parse_operand(i) for i in operand_str_list]
+
+
+# mnemonic -> operation type, allowed operand counts, operand grammar
+MNEMONIC_DICT: Dict[str, Tuple[OpType, Tuple[int, ...], Callable]] = {
+    "push": (OpType.PUSH, (1,), name_grammar),
+    "mov": (OpType.MOV, (2,), mov_grammar),
+    "sub": (OpType.SUB, (2,), value_grammar),
+    "add": (OpType.ADD, (2,), value_grammar),
+    "pop": (OpType.POP, (1,), name_grammar),
+    "ret": (OpType.RET, (0,), value_grammar),
+    "sal": (OpType.SAL, (2,), sal_grammar),
+    "cdq": (OpType.CDQ, (0,), value_grammar),
+    "cdqe": (OpType.CDQ, (0,), value_grammar),
+    "idiv": (OpType.IDIV, (1,), idiv_grammar),
+    "imul": (OpType.IMUL, (2, 3), value_grammar),
+    "call": (OpType.CALL, (1,), name_grammar),
+    "lea": (OpType.LEA, (2,), lea_grammar),
+    "cmp": (OpType.CMP, (2,), value_grammar),
+    "jg": (OpType.JG, (1,), name_grammar),
+    "jmp": (OpType.JMP, (1,), name_grammar),
+    "jne": (OpType.JNE, (1,), name_grammar),
+    "jns": (OpType.JNS, (1,), name_grammar),
+    "nop": (OpType.NOP, (0,), value_grammar),
+    "jle": (OpType.JLE, (1,), name_grammar),
+    "js": (OpType.JS, (1,), name_grammar),
+    "jge": (OpType.JGE, (1,), name_grammar),
+    "jl": (OpType.JL, (1,), name_grammar),
+}
+
+
+class Operation:
+    # one per operation of a file, slots keep large files small
+    __slots__ = ("type", "operand_list")
+
+    def __init__(self, raw_str: str) -> None:
+        # one split finds the mnemonic, which picks the operand grammar
+        token_list = raw_str.split(None, 1)
+        if len(token_list) == 0 or token_list[0] not in MNEMONIC_DICT:
             raise Exception(raw_str)
+        self.type, operand_count_tuple, grammar = MNEMONIC_DICT[token_list[0]]
+        operand_str_list = [] if len(token_list) == 1 else [i.strip() for i in token_list[1].split(",")]
+        if len(operand_str_list) not in operand_count_tuple:
+            raise Exception(raw_str)
+        self.operand_list: List[str | int | Address | ArrayAddress] = grammar(raw_str, operand_str_list)
 
 
 class Code:
+    __slots__ = ("raw_str", "type", "label_str", "operation")
+
     def __init__(self, raw_str: str) -> None:
         self.raw_str = raw_str
         if ":" in raw_str and '"' not in raw_str:
@@ -319,6 +232,9 @@ class Code:
                     case OpType.JS:
                         print(" ", self.operation.operand_list)
 
+                    case OpType.JL:
+                        print(" ", self.operation.operand_list)
+
                     case OpType.MOV:
                         print(
                             " ",
@@ -406,64 +322,253 @@ class Code:
                 raise Exception
 
 
+CACHE_DIR = ".parser_cache"  # next to the c file
+CACHE_VERSION = 4  # bump when Code or Operation change shape
+GCC_COMMAND = "gcc -S -fverbose-asm -masm=intel -O0 {c_file_path} -o {assembly_path}"
+DUMP_PATH: str | None = None  # for debugging, every parsed file writes its operations here, one per line
+# matched at the start of a line
+GLOBL_RE = re.compile(rb"[ \t]*\.globl[ \t]+(\S+)")
+FUNCTION_LABEL_RE = re.compile(rb"([A-Za-z_][\w$@]*):")  # a label that is not a local .L one
+# a line code_stream makes an operation: no directive and no colon before a comment
+OPERATION_LINE_RE = re.compile(rb"(?:\A|\n)[ \t]*[^.#\s][^:#\n]*(?=#|\n|\Z)")
+
+
+def source_hash(c_file_path: str) -> str:
+    # hash of the c file, every local header it includes and the gcc command
+    digest = hashlib.sha256(f"{CACHE_VERSION} {GCC_COMMAND}".encode())
+    visited_set: Set[str] = set()
+    path_list = [os.path.abspath(c_file_path)]
+    while len(path_list) > 0:
+        path = path_list.pop()
+        if path in visited_set or not os.path.isfile(path):
+            continue
+        visited_set.add(path)
+        with open(path, "rb") as file:
+            content = file.read()
+        digest.update(content + b"\0")
+        for include in re.findall(rb'#\s*include\s*"([^"]+)"', content):
+            path_list.append(os.path.join(os.path.dirname(path), include.decode()))
+    return digest.hexdigest()
+
+
+def assembly_file(c_file_path: str, use_gcc: bool = True) -> str:
+    # the .s file of a c file, gcc writes it unless use_gcc is off; a .s file is its own
+    dot_loc = c_file_path.rfind(".")
+    assembly_path = c_file_path[:dot_loc] + ".s"
+    if use_gcc and c_file_path[dot_loc:] != ".s":
+        os.system(GCC_COMMAND.format(c_file_path=c_file_path, assembly_path=assembly_path))
+    return assembly_path
+
+
+def assembly_lines(source: str | bytes | bytearray | memoryview | TextIO | BinaryIO) -> Iterator[str]:
+    # lines of a path, a bytes buffer or an open text or binary stream, one at a time
+    if isinstance(source, str):
+        with open(source, "r") as file:
+            yield from file
+        return
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        source = io.BytesIO(source)
+    for line in source:
+        yield line.decode() if isinstance(line, bytes) else line
+
+
+def strip_lines(line_iter: Iterator[str]) -> Iterator[str]:
+    # without comments, spaces around and empty lines, rbx is read as ebx
+    for line in line_iter:
+        line = line.split("#", 1)[0].strip()
+        if line != "":
+            yield line.replace("rbx", "ebx")
+
+
+def code_stream(line_iter: Iterator[str], function_list: List[str]) -> Iterator[Code]:
+    # labels and operations; a directive is skipped before a Code is built for it,
+    # the functions exported with .globl are appended to function_list in file order
+    for line in line_iter:
+        # what Code would make a MISC
+        if line[0] == "." and (":" not in line or '"' in line):
+            if line.startswith(".globl"):
+                function_list.append(line.split()[1])
+            continue
+        yield Code(line)
+
+
+class CompactIR:
+    # the part of a Parser the executors read, small enough to send to worker processes
+    def __init__(
+            self, label_dict: Dict[str, int], operation_list: List[Code], function_list: List[str],
+            index_list: List[int] | None = None
+    ) -> None:
+        self.label_dict = label_dict
+        self.operation_list = operation_list
+        self.function_list = function_list
+        # operation index -> its index in a full parse of the file, None when this is one
+        self.index_list = index_list
+
+
+def file_index(parser: Parser | CompactIR, operation_index: int | None) -> int | None:
+    # the index a full parse gives an operation, the one reported whether the ir is lazy or not
+    index_list = parser.index_list if isinstance(parser, CompactIR) else None
+    if index_list is None or operation_index is None:
+        return operation_index
+    return index_list[operation_index]
+
+
+def line_start_matches(line_re: re.Pattern, buffer: mmap.mmap | bytes) -> List[Tuple[int, str]]:
+    # (offset, first group) of every line starting with a match of line_re; a search for a newline followed by
+    # it is several times faster than ^ in multiline mode, which tries every offset
+    search_re = re.compile(rb"\n" + line_re.pattern)
+    match_list = [(i.start() + 1, i.group(1).decode()) for i in search_re.finditer(buffer)]
+    first_match = line_re.match(buffer)
+    if first_match is not None:
+        match_list.insert(0, (0, first_match.group(1).decode()))
+    return match_list
+
+
+class SymbolIndex:
+    # byte extents of the functions of a .s file from one scan of its mmap, a function is parsed only when
+    # an ir reaching it is asked for
+    def __init__(self, assembly_path: str) -> None:
+        self.assembly_path = assembly_path
+        with open(assembly_path, "rb") as file:
+            # an empty file can not be mapped
+            if os.fstat(file.fileno()).st_size == 0:
+                self.buffer: mmap.mmap | bytes = b""
+            else:
+                self.buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        # functions exported with .globl, in file order
+        self.function_list: List[str] = [i[1] for i in line_start_matches(GLOBL_RE, self.buffer)]
+        # label -> (offset of its line, offset of the next function label or the end of the file)
+        start_list = line_start_matches(FUNCTION_LABEL_RE, self.buffer)
+        self.extent_dict: Dict[str, Tuple[int, int]] = {}
+        for position, (start, label_name) in enumerate(start_list):
+            end = start_list[position + 1][0] if position + 1 < len(start_list) else len(self.buffer)
+            self.extent_dict[label_name] = (start, end)
+        self.code_dict: Dict[str, List[Code]] = {}  # labels and operations of the functions parsed so far
+
+    def function_code(self, label_name: str) -> List[Code]:
+        code_list = self.code_dict.get(label_name)
+        if code_list is None:
+            start, end = self.extent_dict[label_name]
+            line_list = self.buffer[start:end].decode().splitlines()
+            code_list = list(code_stream(strip_lines(iter(line_list)), []))
+            self.code_dict[label_name] = code_list
+        return code_list
+
+    def compact_ir(self, label_list: List[str]) -> CompactIR:
+        # the functions of label_list and every one their calls reach, in file order;
+        # a label without a body here, like a library function, is left out as a full parse would
+        reached_set: Set[str] = set()
+        worklist = list(label_list)
+        while len(worklist) > 0:
+            label_name = worklist.pop()
+            if label_name in reached_set or label_name not in self.extent_dict:
+                continue
+            reached_set.add(label_name)
+            for code in self.function_code(label_name):
+                if code.type == CodeType.OP and code.operation.type == OpType.CALL:
+                    worklist.append(code.operation.operand_list[0])
+
+        label_dict: Dict[str, int] = {}
+        operation_list: List[Code] = []
+        index_list: List[int] = []
+        # the operations of the functions left out are counted, not parsed
+        position = 0
+        skipped_count = 0
+        for label_name in sorted(reached_set, key=lambda i: self.extent_dict[i][0]):
+            start, end = self.extent_dict[label_name]
+            skipped_count += len(OPERATION_LINE_RE.findall(self.buffer, position, start))
+            position = end
+            for code in self.function_code(label_name):
+                if code.type == CodeType.LABEL:
+                    label_dict[code.label_str] = len(operation_list)
+                else:
+                    index_list.append(len(operation_list) + skipped_count)
+                    operation_list.append(code)
+        return CompactIR(
+            label_dict, operation_list, [i for i in self.function_list if i in reached_set], index_list
+        )
+
+    def close(self) -> None:
+        if isinstance(self.buffer, mmap.mmap):
+            self.buffer.close()
+
+
 class Parser:
-    def __init__(self, c_file_path: str) -> None:
+    def __init__(self, c_file_path: str, use_cache: bool = True, use_gcc: bool = True) -> None:
+        self.cache_path = None
+        if c_file_path == "-":
+            # assembly piped to stdin, there is nothing to key a cache by
+            self.parse_lines(assembly_lines(sys.stdin))
+            return
+
+        if use_cache:
+            # keyed by the file given, or without use_gcc by the .s file assembly_file reads instead
+            source_path = c_file_path if use_gcc else assembly_file(c_file_path, use_gcc=False)
+            cache_dir = os.path.join(os.path.dirname(os.path.abspath(source_path)), CACHE_DIR)
+            self.cache_path = os.path.join(cache_dir, source_hash(source_path) + ".ir")
+            if os.path.isfile(self.cache_path):
+                # warm run, the ir is loaded on first use
+                return
+
         # convert c code into assembly
-        dot_loc = c_file_path.rfind(".")
-        assembly_path = c_file_path[:dot_loc] + ".s"
-        command = (
-            f"gcc -S -fverbose-asm -masm=intel -O0 {c_file_path} -o {assembly_path}"
-        )
-        os.system(command)
-
-        # load assembly code
-        with open(assembly_path, "r") as file:
-            # ignore comment
-            self.assembly_str_list = re.sub("#.*\n", "\n", file.read()).split("\n")
-            # remove spaces
-            self.assembly_str_list = [i.strip() for i in self.assembly_str_list]
-            # remove empty str
-            self.assembly_str_list = list(
-                filter(lambda a: a != "", self.assembly_str_list)
+        self.parse(assembly_file(c_file_path, use_gcc))
+        if self.cache_path is not None:
+            self.save_cache()
+
+    @classmethod
+    def from_assembly(cls, source: str | bytes | bytearray | memoryview | TextIO | BinaryIO) -> Parser:
+        # assembly generated elsewhere, a path, a bytes buffer or an open stream; it is not cached
+        parser = cls.__new__(cls)
+        parser.cache_path = None
+        parser.parse_lines(assembly_lines(source))
+        return parser
+
+    def __getattr__(self, name: str):
+        # only called for missing attributes, which on a warm run are the parsed ir
+        if name in ["label_dict", "operation_list", "function_list"]:
+            cache_path = self.__dict__.get("cache_path")
+            if cache_path is not None and os.path.isfile(cache_path):
+                self.load_cache()
+                return self.__dict__[name]
+        raise AttributeError(name)
+
+    def compact_ir(self) -> CompactIR:
+        return CompactIR(self.label_dict, self.operation_list, self.function_list)
+
+    def save_cache(self) -> None:
+        os.makedirs(os.path.dirname(self.cache_path), exist_ok=True)
+        data = zlib.compress(
+            pickle.dumps(
+                (self.label_dict, self.operation_list, self.function_list),
+                protocol=pickle.HIGHEST_PROTOCOL,
             )
-            # replace rbx to ebx
-            self.assembly_str_list = [
-                i.replace("rbx", "ebx") for i in self.assembly_str_list
-            ]
-
-        self.code_list: List[Code] = []
-        for code_str in self.assembly_str_list:
-            tmp_code = Code(code_str)
-            if tmp_code.type != CodeType.MISC:
-                self.code_list.append(tmp_code)
-        '''
-        for code in self.code_list:
-            code.print()
-        '''
+        )
+        tmp_path = self.cache_path + f".{os.getpid()}.tmp"
+        with open(tmp_path, "wb") as file:
+            file.write(data)
+        os.replace(tmp_path, self.cache_path)
+
+    def load_cache(self) -> None:
+        with open(self.cache_path, "rb") as file:
+            self.label_dict, self.operation_list, self.function_list = pickle.loads(zlib.decompress(file.read()))
+
+    def parse(self, assembly_path: str) -> None:
+        self.parse_lines(assembly_lines(assembly_path))
 
+    def parse_lines(self, line_iter: Iterator[str]) -> None:
+        # one pass over the lines, only the operations and labels are kept
+        self.function_list: List[str] = []
         self.label_dict: Dict[str, int] = {}
         self.operation_list: List[Code] = []
-        for code in self.code_list:
+        for code in code_stream(strip_lines(line_iter), self.function_list):
             if code.type == CodeType.LABEL:
                 self.label_dict[code.label_str] = len(self.operation_list)
             else:
                 self.operation_list.append(code)
-        '''
-        # record the location of the label
-        print("----complete code----")
-        print()
-        for i in range(len(self.operation_list)):
-            if i in self.label_dict.values():
-                for label in self.label_dict.keys():
-                    if self.label_dict[label] == i:
-                        print(f"---{label}---")
-            self.operation_list[i].print()
-        '''
-
-        # save operation
-        with open("./tmp.s", "w") as f:
-            for operation in self.operation_list:
-                f.write(operation.raw_str + "\n")
+        if DUMP_PATH is not None:
+            with open(DUMP_PATH, "w") as file:
+                for operation in self.operation_list:
+                    file.write(operation.raw_str + "\n")
 
 
 # test code
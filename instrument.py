@@ -0,0 +1,158 @@
+from __future__ import annotations
+from enum import Enum
+from typing import List, Dict, Tuple
+import json
+import sys
+import time
+
+SAMPLE_INTERVAL = 0.001  # seconds between two samples of a SampleHook
+
+
+class Hook:
+    # receives the events of an ExecutionProfile, every method may be left out
+    def operation(self, profile: ExecutionProfile, label: str | None, operation_index: int, op_type: Enum) -> None:
+        pass
+
+    def fork(self, profile: ExecutionProfile, operation_index: int, branch_count: int) -> None:
+        pass
+
+    def finish(self, profile: ExecutionProfile) -> None:
+        pass
+
+    def export(self, record: Dict) -> None:
+        # add what the hook gathered to the json of the profile
+        pass
+
+
+class SampleHook(Hook):
+    # the operation running every interval seconds, a sampling profiler without signals or threads
+    def __init__(self, interval: float = SAMPLE_INTERVAL) -> None:
+        self.interval = interval
+        self.next_time = 0.0
+        self.sample_dict: Dict[Tuple[str | None, int], int] = {}  # (label, operation index) -> samples
+
+    def operation(self, profile: ExecutionProfile, label: str | None, operation_index: int, op_type: Enum) -> None:
+        if profile.last_time < self.next_time:
+            return
+        self.next_time = profile.last_time + self.interval
+        key = (label, operation_index)
+        self.sample_dict[key] = self.sample_dict.get(key, 0) + 1
+
+    def export(self, record: Dict) -> None:
+        record["samples"] = [
+            {"label": label, "index": operation_index, "count": count}
+            for (label, operation_index), count in sorted(self.sample_dict.items(), key=lambda i: -i[1])
+        ]
+
+
+class JsonHook(Hook):
+    # writes the counters when the profile finishes, - for stdout
+    def __init__(self, file_path: str) -> None:
+        self.file_path = file_path
+
+    def finish(self, profile: ExecutionProfile) -> None:
+        if self.file_path == "-":
+            json.dump(profile.to_dict(), sys.stdout)
+            sys.stdout.write("\n")
+            return
+        with open(self.file_path, "w") as f:
+            json.dump(profile.to_dict(), f)
+
+
+class ExecutionProfile:
+    # counters an executor fills when one is attached to it; an executor without a profile runs the plain
+    # closures, so switching it off costs one check per explored path
+    def __init__(self, hook_list: List[Hook] | None = None) -> None:
+        self.hook_list: List[Hook] = [] if hook_list is None else hook_list
+        self.file_path: str | None = None  # file of the operations counted now, set by the batch run
+        self.op_count_dict: Dict[Enum, int] = {}  # executed operations per OpType
+        # (file, operation index, assembly line) -> branches its forks started, with the OpType of the line
+        self.fork_count_dict: Dict[Tuple[str | None, int, str], int] = {}
+        self.fork_type_dict: Dict[Tuple[str | None, int, str], Enum] = {}
+        self.path_count_dict: Dict[str, int] = {}  # paths started per function, one plus the extra fork branches
+        self.label_time_dict: Dict[str | None, float] = {}  # seconds per label, each operation to the next one
+        self.depth = 0  # nested explorations and fixpoints right now
+        self.max_depth = 0
+        self.label: str | None = None  # label of the operation running since last_time
+        self.last_time = time.perf_counter()
+
+    def step(self, op_type: Enum, label: str | None, operation_index: int) -> None:
+        now = time.perf_counter()
+        self.label_time_dict[self.label] = self.label_time_dict.get(self.label, 0.0) + now - self.last_time
+        self.label = label
+        self.last_time = now
+        self.op_count_dict[op_type] = self.op_count_dict.get(op_type, 0) + 1
+        for hook in self.hook_list:
+            hook.operation(self, label, operation_index, op_type)
+
+    def fork(self, op_type: Enum, operation_index: int, line: str, branch_count: int) -> None:
+        key = (self.file_path, operation_index, line)
+        self.fork_count_dict[key] = self.fork_count_dict.get(key, 0) + branch_count
+        self.fork_type_dict[key] = op_type
+        for hook in self.hook_list:
+            hook.fork(self, operation_index, branch_count)
+
+    def add_path(self, label_name: str, count: int = 1) -> None:
+        self.path_count_dict[label_name] = self.path_count_dict.get(label_name, 0) + count
+
+    def enter(self) -> None:
+        self.depth += 1
+        if self.depth > self.max_depth:
+            self.max_depth = self.depth
+
+    def leave(self) -> None:
+        self.depth -= 1
+
+    def merge(self, other: ExecutionProfile) -> None:
+        # counters of a worker process, its hooks ran there
+        for key, value in other.op_count_dict.items():
+            self.op_count_dict[key] = self.op_count_dict.get(key, 0) + value
+        for key, value in other.fork_count_dict.items():
+            self.fork_count_dict[key] = self.fork_count_dict.get(key, 0) + value
+        self.fork_type_dict.update(other.fork_type_dict)
+        for key, value in other.path_count_dict.items():
+            self.path_count_dict[key] = self.path_count_dict.get(key, 0) + value
+        for key, value in other.label_time_dict.items():
+            self.label_time_dict[key] = self.label_time_dict.get(key, 0.0) + value
+        self.max_depth = max(self.max_depth, other.max_depth)
+
+    def finish(self) -> None:
+        # the operation running last gets the time up to now
+        now = time.perf_counter()
+        self.label_time_dict[self.label] = self.label_time_dict.get(self.label, 0.0) + now - self.last_time
+        self.label = None
+        self.last_time = now
+        for hook in self.hook_list:
+            hook.finish(self)
+
+    def __getstate__(self) -> Dict:
+        # hooks hold files and stay in the process that attached them
+        state = self.__dict__.copy()
+        state["hook_list"] = []
+        return state
+
+    def to_dict(self) -> Dict:
+        fork_type_count_dict: Dict[str, int] = {}
+        for key, count in self.fork_count_dict.items():
+            name = self.fork_type_dict[key].name
+            fork_type_count_dict[name] = fork_type_count_dict.get(name, 0) + count
+        record = {
+            "operations": {key.name: value for key, value in sorted(self.op_count_dict.items(), key=lambda i: -i[1])},
+            "forks": fork_type_count_dict,
+            "fork_lines": [
+                {"file": file_path, "index": operation_index, "line": line, "branches": count}
+                for (file_path, operation_index, line), count in sorted(
+                    self.fork_count_dict.items(), key=lambda i: -i[1]
+                )
+            ],
+            "paths": self.path_count_dict,
+            "max_depth": self.max_depth,
+            # the time before the first operation has no label
+            "label_time": {
+                str(key): value for key, value in sorted(self.label_time_dict.items(), key=lambda i: -i[1])
+                if key is not None
+            },
+        }
+        for hook in self.hook_list:
+            hook.export(record)
+        return record
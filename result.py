@@ -0,0 +1,117 @@
+from __future__ import annotations
+from enum import Enum
+from typing import Dict, List, Set, TextIO, Tuple
+import json
+import sys
+
+RESULT_KIND = "result"  # kind of the finding a path that returns leaves
+WIDENED_KIND = "widened"  # kind of the finding a path stopped at a converged loop head leaves, a partial result
+
+
+def value_text(x: object) -> object:
+    # a register or memory value as json, addresses stay ints and abstract values become their names
+    if x is None or isinstance(x, int):
+        return x
+    if isinstance(x, Enum):
+        return x.name
+    return str(x)
+
+
+class Finding:
+    # one outcome of an analysis: an error at an operation, or the value a path returns;
+    # the registers and written memory are copies of the state at that operation
+    __slots__ = ("kind", "label_name", "source_label", "operation_index", "register_dict", "memory_dict", "value")
+
+    def __init__(
+            self, kind: str, label_name: str, source_label: str | None, operation_index: int | None,
+            register_dict: Dict[str, object], memory_dict: Dict[int, object], value: object = None
+    ) -> None:
+        self.kind = kind  # RESULT_KIND, WIDENED_KIND or the report kind of an exception
+        self.label_name = label_name  # the analysed function
+        self.source_label = source_label  # the label the operation is under
+        self.operation_index = operation_index  # None when the finding is about the whole function
+        self.register_dict = register_dict
+        self.memory_dict = memory_dict
+        self.value = value  # eax of a result
+
+    def key(self) -> Tuple:
+        return (
+            self.kind, self.label_name, self.operation_index, frozenset(self.register_dict.items()),
+            frozenset(self.memory_dict.items()), self.value
+        )
+
+    def to_dict(self) -> Dict:
+        return {
+            "type": "path",
+            "kind": self.kind,
+            "function": self.label_name,
+            "label": self.source_label,
+            "index": self.operation_index,
+            "value": value_text(self.value),
+            "registers": {key: value_text(value) for key, value in self.register_dict.items()},
+            "memory": {str(key): value_text(value) for key, value in sorted(self.memory_dict.items())},
+        }
+
+    def __str__(self) -> str:
+        if self.kind == RESULT_KIND:
+            return f"result: {value_text(self.value)}"
+        if self.kind == WIDENED_KIND:
+            return f"widened at {self.operation_index} ({self.source_label})"
+        return f"ERROR {self.kind} at {self.operation_index} ({self.source_label})"
+
+
+class JsonlSink:
+    # one json object per line, written as the findings come in
+    def __init__(self, file: TextIO) -> None:
+        self.file = file
+
+    @classmethod
+    def open(cls, file_path: str) -> JsonlSink:
+        # "-" streams to stdout
+        if file_path == "-":
+            return cls(sys.stdout)
+        return cls(open(file_path, "w"))
+
+    def write(self, record: Dict) -> None:
+        self.file.write(json.dumps(record))
+        self.file.write("\n")
+
+    def flush(self) -> None:
+        self.file.flush()
+
+    def close(self) -> None:
+        if self.file is sys.stdout:
+            self.file.flush()
+        else:
+            self.file.close()
+
+
+class ResultCollector:
+    # the distinct findings of one function, kept for its report, streamed to a sink and printed only when asked;
+    # paths that meet again report the same finding, how often depends on which of them the memo skipped
+    def __init__(
+            self, file_path: str | None = None, sink: JsonlSink | None = None, echo: bool = False, keep: bool = True
+    ) -> None:
+        self.file_path = file_path  # written with every streamed finding
+        self.sink = sink
+        self.echo = echo
+        self.keep = keep
+        self.finding_list: List[Finding] = []
+        self.key_set: Set[Tuple] = set()
+
+    def add(self, finding: Finding) -> None:
+        if not self.keep and self.sink is None and not self.echo:
+            return
+        key = finding.key()
+        if key in self.key_set:
+            return
+        self.key_set.add(key)
+        if self.keep:
+            self.finding_list.append(finding)
+        if self.sink is not None:
+            self.sink.write({"file": self.file_path, **finding.to_dict()})
+        if self.echo:
+            print(finding)
+
+    def error_count(self) -> int:
+        return sum(1 for i in self.finding_list if i.kind != RESULT_KIND and i.kind != WIDENED_KIND)
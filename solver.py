@@ -0,0 +1,217 @@
+from __future__ import annotations
+from collections import OrderedDict
+from typing import Callable, List, Dict, Tuple, FrozenSet
+from z3 import BoolRef, ModelRef, Solver, is_true, sat, unsat
+import json
+import os
+import re
+
+CACHE_SIZE = 1 << 16  # cluster results kept before the least recently used is evicted
+MODEL_LIMIT = 4  # recent models tried on a cluster before the solver is called
+# clusters models are tried on before they have to answer one in MODEL_PAYOFF of them to be kept fetching
+MODEL_WARMUP = 256
+MODEL_PAYOFF = 10
+
+TOKEN_RE = re.compile(r"[A-Za-z_]\w*")  # an identifier in an s-expression
+# identifiers of the smt-lib operators z3 prints for integer conditions, every other identifier is a variable
+KEYWORD_SET = {"and", "or", "not", "xor", "ite", "distinct", "div", "mod", "rem", "abs", "true", "false", "let"}
+
+
+class QueryCache:
+    # satisfiability of path conditions, every condition list is split into clusters that share no variable;
+    # a cluster is keyed by its text with the variables renamed in order of appearance,
+    # so the same constraint over other symbols is answered from the cache
+    def __init__(self, file_path: str | None = None, cache_size: int = CACHE_SIZE) -> None:
+        self.file_path = file_path  # json file the results are loaded from and saved to
+        self.cache_size = cache_size
+        self.result_dict: OrderedDict[str, bool] = OrderedDict()  # cluster key -> satisfiable, least recent first
+        # id of a condition object -> (condition, its text, its variables), the condition is kept so its id
+        # is not reused; the python id is used because asking z3 for the ast id costs a foreign call
+        self.condition_dict: Dict[int, Tuple[BoolRef, str, FrozenSet[str]]] = {}
+        self.key_dict: Dict[Tuple[int, ...], str] = {}  # ids of the conditions of a cluster -> its key
+        # models of the latest satisfiable checks, the variables they assign and the ids of the conditions
+        # they were solved with, newest first
+        self.model_list: List[Tuple[ModelRef, FrozenSet[str], FrozenSet[int]]] = []
+        self.solver = Solver()
+        self.query_count = 0  # condition lists checked
+        self.hit_count = 0  # clusters answered by result_dict
+        self.model_try_count = 0  # clusters recent models were evaluated on
+        self.model_hit_count = 0  # clusters a recent model satisfied
+        self.solver_count = 0  # checks the solver had to decide
+        if file_path is not None:
+            self.load(file_path)
+
+    def describe(self, condition: BoolRef) -> Tuple[str, FrozenSet[str]]:
+        # the text and variable names of one condition, computed once
+        entry = self.condition_dict.get(id(condition))
+        if entry is not None:
+            return entry[1], entry[2]
+        if len(self.condition_dict) >= self.cache_size:
+            self.condition_dict.clear()
+            self.key_dict.clear()
+        text = condition.sexpr()
+        variable_set = frozenset(i for i in TOKEN_RE.findall(text) if i not in KEYWORD_SET)
+        self.condition_dict[id(condition)] = (condition, text, variable_set)
+        return text, variable_set
+
+    def slice(self, condition_list: List[BoolRef], checked_count: int = 0) -> List[List[BoolRef]]:
+        # union find over the variables, a condition without variables is a cluster of its own;
+        # only the clusters holding one of the conditions after the first checked_count are returned
+        parent_dict: Dict[str, str] = {}
+
+        def find(name: str) -> str:
+            while parent_dict[name] != name:
+                parent_dict[name] = parent_dict[parent_dict[name]]
+                name = parent_dict[name]
+            return name
+
+        variable_list = []
+        for condition in condition_list:
+            variable_set = self.describe(condition)[1]
+            variable_list.append(variable_set)
+            root = None
+            for name in variable_set:
+                parent_dict.setdefault(name, name)
+                if root is None:
+                    root = find(name)
+                else:
+                    parent_dict[find(name)] = root
+        cluster_dict: Dict[str | int, List[BoolRef]] = {}
+        new_root_set = set()
+        for index, (condition, variable_set) in enumerate(zip(condition_list, variable_list)):
+            root = find(next(iter(variable_set))) if variable_set else index
+            cluster_dict.setdefault(root, []).append(condition)
+            if index >= checked_count:
+                new_root_set.add(root)
+        return [cluster_dict[i] for i in new_root_set]
+
+    def cluster_key(self, cluster: List[BoolRef]) -> str:
+        # a cluster of a path is met again by every later check of the path
+        id_tuple = tuple(id(i) for i in cluster)
+        key = self.key_dict.get(id_tuple)
+        if key is not None:
+            return key
+        name_dict: Dict[str, str] = {}
+        text_list = []
+        for condition in cluster:
+            text, variable_set = self.describe(condition)
+
+            def rename(match: re.Match) -> str:
+                name = match.group(0)
+                if name not in variable_set:
+                    return name
+                return name_dict.setdefault(name, f"v{len(name_dict)}")
+
+            text_list.append(TOKEN_RE.sub(rename, text))
+        key = "\n".join(text_list)
+        self.key_dict[id_tuple] = key
+        return key
+
+    def lookup(self, cluster: List[BoolRef], key: str) -> bool | None:
+        # the cached result of a cluster, or True when a recent model satisfies it
+        result = self.result_dict.get(key)
+        if result is not None:
+            self.result_dict.move_to_end(key)
+            self.hit_count += 1
+            return result
+        if not self.reuse_models():
+            self.model_list.clear()
+        if len(self.model_list) == 0:
+            return None
+        self.model_try_count += 1
+        variable_set = frozenset().union(*[self.describe(i)[1] for i in cluster])
+        for model, model_variable_set, solved_set in self.model_list:
+            # a completed model assigns every variable, only one of the same variables is worth evaluating
+            if not variable_set <= model_variable_set:
+                continue
+            # the conditions it was solved with hold already, a path extended by one branch costs one eval
+            if all(is_true(model.eval(i, model_completion=True)) for i in cluster if id(i) not in solved_set):
+                self.model_hit_count += 1
+                self.store(key, True)
+                return True
+        return None
+
+    def store(self, key: str, result: bool) -> None:
+        self.result_dict[key] = result
+        if len(self.result_dict) > self.cache_size:
+            self.result_dict.popitem(last=False)
+
+    def reuse_models(self) -> bool:
+        # fetching and evaluating a model costs about as much as a solver call, stop once they rarely answer
+        return self.model_try_count < MODEL_WARMUP or self.model_hit_count * MODEL_PAYOFF >= self.model_try_count
+
+    def remember_model(self, model: ModelRef, condition_list: List[BoolRef]) -> None:
+        # a model satisfying condition_list, the variables come from the cached descriptions
+        variable_set = frozenset().union(*[self.describe(i)[1] for i in condition_list])
+        self.model_list.insert(0, (model, variable_set, frozenset(id(i) for i in condition_list)))
+        del self.model_list[MODEL_LIMIT:]
+
+    def solve(self, cluster: List[BoolRef]) -> bool:
+        self.solver.push()
+        self.solver.add(*cluster)
+        answer = self.solver.check()
+        if answer == sat and self.reuse_models():
+            self.remember_model(self.solver.model(), cluster)
+        self.solver.pop()
+        # an unknown answer counts as satisfiable, nothing is pruned on it
+        return answer != unsat
+
+    def check(
+            self, condition_list: List[BoolRef], checked_count: int = 0, solve_all: Callable[[], bool] | None = None
+    ) -> bool:
+        # whether some assignment satisfies every condition, the first checked_count are known to be satisfiable;
+        # solve_all decides the whole list at once, an incremental solver of the caller can do that cheaper
+        # than a fresh solver per cluster
+        self.query_count += 1
+        missing_list: List[Tuple[List[BoolRef], str]] = []
+        for cluster in self.slice(condition_list, checked_count):
+            key = self.cluster_key(cluster)
+            result = self.lookup(cluster, key)
+            if result is False:
+                return False
+            if result is None:
+                missing_list.append((cluster, key))
+        if len(missing_list) == 0:
+            return True
+        self.solver_count += 1
+        if solve_all is None:
+            for cluster, key in missing_list:
+                result = self.solve(cluster)
+                self.store(key, result)
+                if not result:
+                    return False
+            return True
+        result = solve_all()
+        # a satisfiable list satisfies each of its clusters, an unsatisfiable one only blames a lone new cluster
+        if result or len(missing_list) == 1:
+            for cluster, key in missing_list:
+                self.store(key, result)
+        return result
+
+    def hit_rate(self) -> float:
+        total_count = self.hit_count + self.model_hit_count + self.solver_count
+        if total_count == 0:
+            return 0.0
+        return (self.hit_count + self.model_hit_count) / total_count
+
+    def load(self, file_path: str) -> None:
+        self.file_path = file_path
+        if os.path.exists(file_path):
+            with open(file_path) as f:
+                self.result_dict.update(json.load(f))
+
+    def save(self) -> None:
+        if self.file_path is None:
+            return
+        with open(self.file_path, "w") as f:
+            json.dump(self.result_dict, f)
+
+    def __str__(self) -> str:
+        return (
+            f"queries: {self.query_count} cache hits: {self.hit_count} model hits: {self.model_hit_count}"
+            f" solver calls: {self.solver_count} hit rate: {self.hit_rate():.1%}"
+        )
+
+
+# shared by every executor of a process, repeated clusters across forks and functions are answered once
+QUERY_CACHE = QueryCache()
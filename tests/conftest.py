@@ -0,0 +1,12 @@
+from __future__ import annotations
+import importlib.util
+import os
+import sys
+
+# the tests import the repo modules; "Sign abstraction.py" is not a valid module name, load it from its path
+DIRECTORY = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, DIRECTORY)
+spec = importlib.util.spec_from_file_location("sign_abstraction", os.path.join(DIRECTORY, "Sign abstraction.py"))
+sign_abstraction = importlib.util.module_from_spec(spec)
+sys.modules["sign_abstraction"] = sign_abstraction
+spec.loader.exec_module(sign_abstraction)
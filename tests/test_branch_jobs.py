@@ -0,0 +1,27 @@
+from __future__ import annotations
+import json
+import os
+
+import pytest
+
+import sign_abstraction
+from getfiles import Parser
+
+DIRECTORY = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+FILE_LIST = ["div.s", "array.s", "foo.s", "userDefinedException.s"]
+
+
+def report_findings(report: sign_abstraction.FunctionReport) -> list[str]:
+    # the order findings arrive in depends on which process explored them
+    return sorted(json.dumps(i.to_dict(), sort_keys=True) for i in report.finding_list)
+
+
+@pytest.mark.parametrize("fan_out_depth", [1, 2, 3])
+def test_branch_jobs_match_serial(fan_out_depth: int) -> None:
+    for file_name in FILE_LIST:
+        parser = Parser(os.path.join(DIRECTORY, file_name))
+        serial_list = sign_abstraction.analyse_parser(parser, file_name)
+        branch_list = sign_abstraction.analyse_parser(parser, file_name, branch_jobs=2, fan_out_depth=fan_out_depth)
+        for serial_report, branch_report in zip(serial_list, branch_list):
+            assert branch_report.status() == serial_report.status()
+            assert report_findings(branch_report) == report_findings(serial_report)
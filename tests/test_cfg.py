@@ -0,0 +1,41 @@
+from __future__ import annotations
+from getfiles import Parser
+from cfg import function_cfg
+
+# a counting loop: the jmp enters at the compare, .L3 jumps back to it
+LOOP_ASSEMBLY = b"""
+	.globl	count
+count:
+	push	rbp
+	mov	rbp, rsp
+	mov	DWORD PTR -4[rbp], 0
+	jmp	.L2
+.L3:
+	add	DWORD PTR -4[rbp], 1
+.L2:
+	cmp	DWORD PTR -4[rbp], 9
+	jle	.L3
+	mov	eax, DWORD PTR -4[rbp]
+	pop	rbp
+	ret
+"""
+
+
+def test_cfg_dominators_and_loop_head() -> None:
+    parser = Parser.from_assembly(LOOP_ASSEMBLY)
+    cfg = function_cfg(parser, "count")
+    entry_index = parser.label_dict["count"]
+    body_index = parser.label_dict[".L3"]
+    head_index = parser.label_dict[".L2"]
+    exit_index = head_index + 2
+    assert sorted(cfg.block_dict) == [entry_index, body_index, head_index, exit_index]
+    assert cfg.block_dict[head_index].successor_list == [body_index, exit_index]
+    assert cfg.dominator_dict[body_index] == {entry_index, head_index, body_index}
+    assert cfg.dominator_dict[exit_index] == {entry_index, head_index, exit_index}
+    assert cfg.dominates(head_index, body_index)
+    assert not cfg.dominates(body_index, head_index)
+    # only the edge from .L3 back to the compare is a back edge
+    assert cfg.loop_head_set == {head_index}
+    # the exit leaves the loop for good, every block before it can still get to the head
+    assert cfg.reaches_loop(entry_index) and cfg.reaches_loop(body_index) and cfg.reaches_loop(head_index + 1)
+    assert not cfg.reaches_loop(exit_index + 1)
@@ -0,0 +1,31 @@
+from __future__ import annotations
+import itertools
+
+import pytest
+
+import sign_abstraction
+
+AbstractType = sign_abstraction.AbstractType
+compare_value = sign_abstraction.compare_value
+int_sign = sign_abstraction.int_sign
+
+# values of each sign, wide enough that a literal in LITERAL_LIST can fall on either side of them
+SAMPLE_DICT = {
+    AbstractType.POSITIVE_INT: [1, 2, 3, 5],
+    AbstractType.NEGATIVE_INT: [-1, -2, -3, -5],
+    AbstractType.ZERO: [0],
+}
+SAMPLE_DICT[AbstractType.ANY_INT] = [i for sample_list in SAMPLE_DICT.values() for i in sample_list]
+LITERAL_LIST = [-2, -1, 0, 1, 2]
+
+
+def expected_compare(x_list: list[int], y_list: list[int]) -> AbstractType:
+    # the sign of x - y over every sample, ANY_INT when it is not one sign
+    sign_set = {int_sign(x - y) for x in x_list for y in y_list}
+    return sign_set.pop() if len(sign_set) == 1 else AbstractType.ANY_INT
+
+
+@pytest.mark.parametrize("literal, sign", list(itertools.product(LITERAL_LIST, SAMPLE_DICT)))
+def test_compare_literal_sign(literal: int, sign: AbstractType) -> None:
+    assert compare_value(literal, sign, None) == expected_compare([literal], SAMPLE_DICT[sign])
+    assert compare_value(sign, literal, None) == expected_compare(SAMPLE_DICT[sign], [literal])
@@ -0,0 +1,23 @@
+from __future__ import annotations
+import os
+
+import sign_abstraction
+from getfiles import Parser, SymbolIndex
+
+DIRECTORY = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def test_lazy_findings_match_full_parse() -> None:
+    # a lazy ir holds fewer operations, its findings still carry the indexes of a full parse
+    file_path = os.path.join(DIRECTORY, "userDefinedException.s")
+    full_parser = Parser.from_assembly(file_path)
+    symbol_index = SymbolIndex(file_path)
+    for label_name in ["fib3", "user2"]:
+        lazy_ir = symbol_index.compact_ir([label_name])
+        assert len(lazy_ir.operation_list) < len(full_parser.operation_list)
+        finding_list = []
+        for parser in [full_parser, lazy_ir]:
+            report = sign_abstraction.analyse_parser(parser, "userDefinedException.s", [label_name])[0]
+            finding_list.append([(i.kind, i.source_label, i.operation_index) for i in report.finding_list])
+        assert finding_list[0] == finding_list[1]
+    symbol_index.close()
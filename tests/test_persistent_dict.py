@@ -0,0 +1,37 @@
+from __future__ import annotations
+import pytest
+
+import sign_abstraction
+
+PersistentDict = sign_abstraction.PersistentDict
+FLATTEN_DEPTH = sign_abstraction.FLATTEN_DEPTH
+
+
+def test_persistent_dict_fork() -> None:
+    base = {1: "a"}
+    parent = PersistentDict(base)
+    parent[2] = "b"
+    child = parent.fork()
+    child[2] = "c"
+    child[3] = "d"
+    assert parent[2] == "b"
+    assert child[1] == "a" and child[2] == "c"
+    assert child.written() == {2: "c", 3: "d"}
+    assert parent.written() == {2: "b"}
+    assert base == {1: "a"}
+    with pytest.raises(Exception):
+        parent[4] = "e"
+
+
+def test_persistent_dict_flatten() -> None:
+    memory = PersistentDict({})
+    for i in range(FLATTEN_DEPTH + 1):
+        memory[i] = i
+        memory = memory.fork()
+    # the fork past FLATTEN_DEPTH collapsed the chain into one layer
+    assert memory.depth == 1
+    assert memory.parent.parent is None
+    assert memory.written() == {i: i for i in range(FLATTEN_DEPTH + 1)}
+    sibling = memory.parent.fork()
+    sibling[0] = -1
+    assert memory[0] == 0 and sibling[0] == -1
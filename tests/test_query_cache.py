@@ -0,0 +1,34 @@
+from __future__ import annotations
+from z3 import Int, BoolVal
+
+from solver import QueryCache
+
+
+def test_query_cache_slice() -> None:
+    query_cache = QueryCache()
+    a, b, c = Int("a"), Int("b"), Int("c")
+    condition_list = [a > 0, c == 1, b > 0, a < b, BoolVal(True)]
+    cluster_list = sorted(query_cache.slice(condition_list), key=len)
+    assert [len(i) for i in cluster_list] == [1, 1, 3]
+    assert {str(i) for i in cluster_list[2]} == {"a > 0", "b > 0", "a < b"}
+    # the first three conditions are known, only the clusters of the last two are returned
+    cluster_list = query_cache.slice(condition_list, 3)
+    assert sorted(len(i) for i in cluster_list) == [1, 3]
+
+
+def test_query_cache_persistence(tmp_path) -> None:
+    file_path = str(tmp_path / "query_cache.json")
+    query_cache = QueryCache(file_path)
+    x = Int("x")
+    assert query_cache.check([x > 0, x < 0]) is False
+    assert query_cache.check([x > 5]) is True
+    query_cache.save()
+
+    loaded_cache = QueryCache(file_path)
+    assert loaded_cache.result_dict == query_cache.result_dict
+    # the same constraints over another symbol are answered without the solver
+    y = Int("y")
+    assert loaded_cache.check([y > 0, y < 0]) is False
+    assert loaded_cache.check([y > 5]) is True
+    assert loaded_cache.solver_count == 0
+    assert loaded_cache.hit_count == 2
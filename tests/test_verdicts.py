@@ -0,0 +1,73 @@
+from __future__ import annotations
+import os
+from typing import Dict, Tuple
+
+import pytest
+
+import sign_abstraction
+from getfiles import Parser
+
+EngineMode = sign_abstraction.EngineMode
+AbstractMode = sign_abstraction.AbstractMode
+
+DIRECTORY = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+FILE_LIST = ["div.s", "array.s", "foo.s", "userDefinedException.s"]
+
+# (engine, abstract mode, path check) -> status of every function that is not "finished"
+VERDICT_DICT: Dict[Tuple[EngineMode | None, AbstractMode | None, bool], Dict[str, str]] = {
+    (EngineMode.PATH, AbstractMode.SIGN, False): {
+        "div0": "ERROR", "div1": "ERROR", "div_a_b1": "ERROR", "div_a_b3": "ERROR", "div_a_b5": "ERROR",
+        "array1": "ERROR", "array3": "ERROR", "array5": "ERROR", "foo": "ERROR",
+        "fib2": "ERROR", "fib3": "ERROR", "user1": "ERROR", "user2": "ERROR",
+    },
+    (EngineMode.PATH, AbstractMode.SIGN, True): {
+        "div0": "ERROR", "div1": "ERROR", "div_a_b1": "ERROR", "div_a_b3": "ERROR",
+        "div_a_b5": "ERROR", "array1": "ERROR", "array3": "ERROR", "array5": "ERROR",
+        "fib2": "ERROR", "fib3": "ERROR", "user1": "ERROR", "user2": "ERROR",
+    },
+    (EngineMode.FIXPOINT, AbstractMode.SIGN, False): {
+        "div0": "ERROR", "div1": "ERROR", "div_a_b1": "ERROR", "div_a_b3": "ERROR", "div_a_b5": "ERROR", "array1": "ERROR", "array3": "ERROR", "array5": "ERROR", "foo": "ERROR",
+        "fib2": "ERROR", "fib3": "ERROR", "user1": "ERROR", "user2": "ERROR",
+    },
+    (EngineMode.PATH, AbstractMode.SIGN_SET, False): {
+        "div0": "ERROR", "div1": "ERROR", "div_a_b1": "ERROR", "div_a_b3": "ERROR", "div_a_b5": "ERROR",
+        "array1": "ERROR", "array3": "ERROR", "array5": "ERROR", "foo": "ERROR",
+        "fib2": "ERROR", "fib3": "ERROR", "user1": "ERROR", "user2": "ERROR",
+    },
+    (None, AbstractMode.INTERVAL, False): {
+        "div0": "ERROR", "div1": "ERROR", "div_a_b1": "ERROR", "div_a_b2": "ERROR", "div_a_b3": "ERROR",
+        "div_a_b5": "ERROR", "array1": "ERROR", "array3": "ERROR", "array5": "ERROR", "array6": "ERROR",
+        "fib2": "ERROR", "fib3": "ERROR", "user1": "ERROR", "user2": "ERROR",
+    },
+    (None, AbstractMode.CONSTANT, False): {
+        "div0": "ERROR", "div1": "ERROR", "div_a_b1": "ERROR", "div_a_b2": "ERROR", "div_a_b3": "ERROR",
+        "div_a_b4": "ERROR", "div_a_b5": "ERROR", "array1": "ERROR", "array2": "ERROR", "array3": "ERROR",
+        "array4": "ERROR", "array5": "ERROR", "array6": "ERROR",
+        "fib2": "ERROR", "fib3": "ERROR", "user1": "ERROR", "user2": "ERROR",
+    },
+}
+
+def bundled_status(mode: Tuple[EngineMode | None, AbstractMode | None, bool]) -> Dict[str, str]:
+    # function -> status over every bundled file
+    engine_mode, abstract_mode, path_check = mode
+    status_dict = {}
+    for file_name in FILE_LIST:
+        parser = Parser.from_assembly(os.path.join(DIRECTORY, file_name))
+        for report in sign_abstraction.analyse_parser(
+                parser, file_name, engine_mode=engine_mode, abstract_mode=abstract_mode, path_check=path_check
+        ):
+            status_dict[report.label_name] = report.status()
+    return status_dict
+
+
+@pytest.mark.parametrize("mode", list(VERDICT_DICT), ids=lambda i: "-".join(str(j) for j in i))
+def test_bundled_verdicts(mode: Tuple[EngineMode | None, AbstractMode | None, bool]) -> None:
+    status_dict = bundled_status(mode)
+    assert {key: value for key, value in status_dict.items() if value != "finished"} == VERDICT_DICT[mode]
+
+
+def test_fixpoint_matches_path() -> None:
+    # the worklist engine gives the per-label verdicts of testfirst
+    assert bundled_status((EngineMode.FIXPOINT, AbstractMode.SIGN, False)) == bundled_status(
+        (EngineMode.PATH, AbstractMode.SIGN, False)
+    )
@@ -0,0 +1,324 @@
+from __future__ import annotations
+from typing import List
+import argparse
+
+# the layout gcc -S -masm=intel -O0 gives for x86_64-w64-mingw32, the only one getfiles.Parser and the executor read;
+# a gcc for another target passes the arguments in other registers
+ARGUMENT_REGISTER_LIST = ["ecx", "edx", "r8d", "r9d"]
+SHADOW_SIZE = 32  # stack a caller reserves below its frame for the four register arguments
+ARRAY_SIZE = 4  # elements of the local array of a workload with array accesses
+
+
+class AssemblyWriter:
+    # one .s file of synthetic functions and the c they are written from, labels are numbered across the file
+    def __init__(self, file_name: str) -> None:
+        self.line_list = [f'\t.file\t"{file_name}"', "\t.intel_syntax noprefix", "\t.text"]
+        self.c_line_list: List[str] = []
+        self.prototype_list: List[str] = []  # declared before the functions, callees may come after a caller
+        self.label_count = 0
+
+    def label(self) -> str:
+        self.label_count += 1
+        return f".L{self.label_count}"
+
+    def function(self, name: str, parameter_count: int, local_count: int) -> FunctionWriter:
+        return FunctionWriter(self, name, parameter_count, local_count)
+
+    def text(self) -> str:
+        return "\n".join(self.line_list + ['\t.ident\t"GCC: synthetic"']) + "\n"
+
+    def c_text(self) -> str:
+        return "\n".join(self.prototype_list + [""] + self.c_line_list) + "\n"
+
+    def write(self, file_path: str, c_path: str | None = None) -> None:
+        with open(file_path, "w") as f:
+            f.write(self.text())
+        if c_path is not None:
+            with open(c_path, "w") as f:
+                f.write(self.c_text())
+
+
+class FunctionWriter:
+    # body of one int function of int parameters p0, p1, ... in assembly and in c;
+    # the prologue is written once the frame size is known
+    def __init__(self, writer: AssemblyWriter, name: str, parameter_count: int, local_count: int) -> None:
+        self.writer = writer
+        self.name = name
+        self.parameter_count = parameter_count
+        self.local_count = local_count
+        self.calls = False  # a caller reserves the shadow space of its callees
+        self.body_list: List[str] = []
+        self.c_body_list: List[str] = []
+        self.c_depth = 1  # indentation of the next c line
+
+    def parameter(self, index: int) -> str:
+        # the first four are spilled to the shadow space, the rest are already on the stack
+        return f"DWORD PTR {16 + 8 * index}[rbp]"
+
+    def local(self, index: int) -> str:
+        return f"DWORD PTR -{4 * (index + 1)}[rbp]"
+
+    def emit(self, line: str) -> None:
+        self.body_list.append(f"\t{line}")
+
+    def place(self, label: str) -> None:
+        self.body_list.append(f"{label}:")
+
+    def c(self, line: str) -> None:
+        # a line ending with { opens a block, one starting with } closes it
+        if line.startswith("}"):
+            self.c_depth -= 1
+        self.c_body_list.append("    " * self.c_depth + line)
+        if line.endswith("{"):
+            self.c_depth += 1
+
+    def call(self, callee: str, argument: str) -> None:
+        # eax = callee(argument)
+        self.calls = True
+        self.emit(f"mov\teax, {argument}")
+        self.emit("mov\tecx, eax")
+        self.emit(f"call\t{callee}")
+
+    def end(self, result: str, c_result: str) -> None:
+        # return result, then add the function to the file
+        self.emit(f"mov\teax, {result}")
+        self.c(f"return {c_result};")
+        frame_size = (4 * self.local_count + 15) // 16 * 16 + (SHADOW_SIZE if self.calls else 0)
+        line_list = [
+            f"\t.globl\t{self.name}",
+            f"\t.def\t{self.name};\t.scl\t2;\t.type\t32;\t.endef",
+            f"\t.seh_proc\t{self.name}",
+            f"{self.name}:",
+            "\tpush\trbp",
+            "\t.seh_pushreg\trbp",
+            "\tmov\trbp, rsp",
+            "\t.seh_setframe\trbp, 0",
+        ]
+        if frame_size > 0:
+            line_list += [f"\tsub\trsp, {frame_size}", f"\t.seh_stackalloc\t{frame_size}"]
+        line_list.append("\t.seh_endprologue")
+        for index, register in enumerate(ARGUMENT_REGISTER_LIST[:self.parameter_count]):
+            line_list.append(f"\tmov\t{self.parameter(index)}, {register}")
+        line_list += self.body_list
+        if frame_size > 0:
+            line_list.append(f"\tadd\trsp, {frame_size}")
+        line_list += ["\tpop\trbp", "\tret", "\t.seh_endproc"]
+        self.writer.line_list += line_list
+        parameter_str = ", ".join(f"int p{i}" for i in range(self.parameter_count))
+        self.writer.prototype_list.append(f"int {self.name}({parameter_str});")
+        self.writer.c_line_list += [f"int {self.name}({parameter_str})", "{", *self.c_body_list, "}", ""]
+
+
+def nested_function(writer: AssemblyWriter, name: str, depth: int) -> None:
+    # int f(int p0, ...) { int r = 0; if (p0 > 0) { r += 1; if (p1 > 0) { r += 2; ... } } return r; }
+    parameter_count = min(depth, len(ARGUMENT_REGISTER_LIST))
+    function = writer.function(name, parameter_count, 1)
+    end_label = writer.label()
+    function.emit(f"mov\t{function.local(0)}, 0")
+    function.c("int r = 0;")
+    for level in range(depth):
+        function.emit(f"cmp\t{function.parameter(level % parameter_count)}, 0")
+        function.emit(f"jle\t{end_label}")
+        function.emit(f"add\t{function.local(0)}, {level + 1}")
+        function.c(f"if (p{level % parameter_count} > 0) {{")
+        function.c(f"r += {level + 1};")
+    for _ in range(depth):
+        function.c("}")
+    function.place(end_label)
+    function.end(function.local(0), "r")
+
+
+def loop_function(writer: AssemblyWriter, name: str, depth: int) -> None:
+    # int f(int p0) { int r = 0, i1 = p0; while (i1 > 0) { int i2 = p0; while (i2 > 0) { r += i2; i2 -= 1; } ... } }
+    function = writer.function(name, 1, depth + 1)
+    function.emit(f"mov\t{function.local(0)}, 0")
+    function.c("int r = 0;")
+    write_loops(writer, function, 1, depth, function.parameter(0), "p0")
+    function.end(function.local(0), "r")
+
+
+def parameter_function(writer: AssemblyWriter, name: str, parameter_count: int) -> None:
+    # int f(int p0, ..., int pn) { return p0 + ... + pn; }
+    function = writer.function(name, parameter_count, 0)
+    function.emit(f"mov\tedx, {function.parameter(0)}")
+    for index in range(1, parameter_count):
+        function.emit(f"mov\teax, {function.parameter(index)}")
+        function.emit("add\tedx, eax")
+    function.end("edx", " + ".join(f"p{i}" for i in range(parameter_count)))
+
+
+def write_loops(
+        writer: AssemblyWriter, function: FunctionWriter, first_local: int, depth: int, bound: str, c_bound: str
+) -> None:
+    # depth nested counting loops from bound down to 1 on locals first_local.., the innermost adds its counter to
+    # local 0
+    label_list = []
+    for level in range(depth):
+        body_label = writer.label()
+        condition_label = writer.label()
+        label_list.append((body_label, condition_label))
+        counter = function.local(first_local + level)
+        function.emit(f"mov\teax, {bound}")
+        function.emit(f"mov\t{counter}, eax")
+        function.emit(f"jmp\t{condition_label}")
+        function.place(body_label)
+        function.c(f"int i{level + 1} = {c_bound};")
+        function.c(f"while (i{level + 1} > 0) {{")
+    if depth > 0:
+        function.emit(f"mov\teax, {function.local(first_local + depth - 1)}")
+        function.emit(f"add\t{function.local(0)}, eax")
+        function.c(f"r += i{depth};")
+    for level in reversed(range(depth)):
+        body_label, condition_label = label_list[level]
+        counter = function.local(first_local + level)
+        function.emit(f"sub\t{counter}, 1")
+        function.place(condition_label)
+        function.emit(f"cmp\t{counter}, 0")
+        function.emit(f"jg\t{body_label}")
+        function.c(f"i{level + 1} -= 1;")
+        function.c("}")
+
+
+def workload_function(
+        writer: AssemblyWriter, name: str, branch_count: int = 0, loop_depth: int = 0, call_depth: int = 0,
+        array_count: int = 0, division_count: int = 0, parameter_count: int = len(ARGUMENT_REGISTER_LIST)
+) -> None:
+    # int f(int p0, ...) with every knob, in this order:
+    # branch_count if/else on the sign of an unknown parameter, each one forks every path on ANY_INT;
+    # array_count guarded reads a[p], division_count r / p that can divide by zero,
+    # loop_depth nested loops, then a chain of call_depth functions that each branch once
+    parameter_count = max(1, parameter_count)
+    array_local = 1  # a[0] is the lowest slot of the array, the locals after it hold the loop counters
+    loop_local = array_local + (ARRAY_SIZE if array_count > 0 else 0)
+    function = writer.function(name, parameter_count, loop_local + loop_depth)
+    result = function.local(0)
+    function.emit(f"mov\t{result}, 0")
+    function.c("int r = 0;")
+    if array_count > 0:
+        # gcc puts a[0] lowest, at the slot of the last element of the block of locals
+        base_offset = -4 * (array_local + ARRAY_SIZE)
+        for index in range(ARRAY_SIZE):
+            function.emit(f"mov\tDWORD PTR {base_offset + 4 * index}[rbp], {index + 1}")
+        function.c(f"int a[{ARRAY_SIZE}] = {{{', '.join(str(i + 1) for i in range(ARRAY_SIZE))}}};")
+
+    for index in range(branch_count):
+        parameter = function.parameter(index % parameter_count)
+        else_label = writer.label()
+        end_label = writer.label()
+        function.emit(f"cmp\t{parameter}, 0")
+        function.emit(f"jle\t{else_label}")
+        function.emit(f"mov\teax, {parameter}")
+        function.emit(f"add\t{result}, eax")
+        function.emit(f"jmp\t{end_label}")
+        function.place(else_label)
+        function.emit(f"sub\t{result}, 1")
+        function.place(end_label)
+        function.c(f"if (p{index % parameter_count} > 0) {{")
+        function.c(f"r += p{index % parameter_count};")
+        function.c("} else {")
+        function.c("r -= 1;")
+        function.c("}")
+
+    for index in range(array_count):
+        # like array2 of array.s, the index is checked against both bounds first
+        parameter = function.parameter(index % parameter_count)
+        skip_label = writer.label()
+        function.emit(f"cmp\t{parameter}, {ARRAY_SIZE - 1}")
+        function.emit(f"jg\t{skip_label}")
+        function.emit(f"cmp\t{parameter}, 0")
+        function.emit(f"js\t{skip_label}")
+        function.emit(f"mov\teax, {parameter}")
+        function.emit("cdqe")
+        function.emit(f"mov\teax, DWORD PTR {-4 * (array_local + ARRAY_SIZE)}[rbp+rax*4]")
+        function.emit(f"add\t{result}, eax")
+        function.place(skip_label)
+        function.c(f"if (p{index % parameter_count} <= {ARRAY_SIZE - 1} && p{index % parameter_count} >= 0) {{")
+        function.c(f"r += a[p{index % parameter_count}];")
+        function.c("}")
+
+    for index in range(division_count):
+        function.emit(f"mov\teax, {result}")
+        function.emit("cdq")
+        function.emit(f"idiv\t{function.parameter(index % parameter_count)}")
+        function.emit(f"mov\t{result}, eax")
+        function.c(f"r = r / p{index % parameter_count};")
+
+    write_loops(writer, function, loop_local, loop_depth, function.parameter(0), "p0")
+
+    if call_depth > 0:
+        function.call(f"{name}_call1", result)
+        function.emit(f"mov\t{result}, eax")
+        function.c(f"r = {name}_call1(r);")
+    function.end(result, "r")
+
+    for depth in range(1, call_depth + 1):
+        # int f_callk(int p0) { if (p0 > 0) p0 -= 1; else p0 += 1; return f_callk+1(p0); }
+        callee = writer.function(f"{name}_call{depth}", 1, 0)
+        parameter = callee.parameter(0)
+        else_label = writer.label()
+        end_label = writer.label()
+        callee.emit(f"cmp\t{parameter}, 0")
+        callee.emit(f"jle\t{else_label}")
+        callee.emit(f"sub\t{parameter}, 1")
+        callee.emit(f"jmp\t{end_label}")
+        callee.place(else_label)
+        callee.emit(f"add\t{parameter}, 1")
+        callee.place(end_label)
+        callee.c("if (p0 > 0) {")
+        callee.c("p0 -= 1;")
+        callee.c("} else {")
+        callee.c("p0 += 1;")
+        callee.c("}")
+        if depth < call_depth:
+            callee.call(f"{name}_call{depth + 1}", parameter)
+            callee.end("eax", f"{name}_call{depth + 1}(p0)")
+        else:
+            callee.end(parameter, "p0")
+
+
+# shape -> function writing one function of that shape at a scale
+SHAPE_DICT = {
+    "nested": nested_function,
+    "loop": loop_function,
+    "params": parameter_function,
+    "branches": lambda writer, name, scale: workload_function(writer, name, branch_count=scale),
+    "calls": lambda writer, name, scale: workload_function(writer, name, call_depth=scale),
+    "arrays": lambda writer, name, scale: workload_function(writer, name, array_count=scale),
+    "divisions": lambda writer, name, scale: workload_function(writer, name, division_count=scale),
+}
+
+
+def scaled_file(file_path: str, shape: str, scale: int, c_path: str | None = None) -> None:
+    # a .s file with one function of the shape, named after it, and its callees
+    writer = AssemblyWriter(file_path)
+    SHAPE_DICT[shape](writer, f"{shape}{scale}", scale)
+    writer.write(file_path, c_path)
+
+
+def workload_file(
+        file_path: str, branch_count: int = 0, loop_depth: int = 0, call_depth: int = 0, array_count: int = 0,
+        division_count: int = 0, parameter_count: int = len(ARGUMENT_REGISTER_LIST), c_path: str | None = None
+) -> None:
+    # a .s file with one function "workload" of every knob, and the c it stands for when c_path is given
+    writer = AssemblyWriter(file_path)
+    workload_function(
+        writer, "workload", branch_count, loop_depth, call_depth, array_count, division_count, parameter_count
+    )
+    writer.write(file_path, c_path)
+
+
+if __name__ == "__main__":
+    argument_parser = argparse.ArgumentParser(description="synthetic mingw x64 assembly for the sign abstraction")
+    argument_parser.add_argument("file", help=".s file to write")
+    argument_parser.add_argument("--c", help="also write the c the assembly stands for")
+    argument_parser.add_argument("--branches", type=int, default=0, help="if/else on the sign of a parameter")
+    argument_parser.add_argument("--loops", type=int, default=0, help="depth of the nested loops")
+    argument_parser.add_argument("--calls", type=int, default=0, help="depth of the call chain")
+    argument_parser.add_argument("--arrays", type=int, default=0, help="bounds checked array reads")
+    argument_parser.add_argument("--divisions", type=int, default=0, help="divisions by a parameter")
+    argument_parser.add_argument("--parameters", type=int, default=len(ARGUMENT_REGISTER_LIST))
+    arguments = argument_parser.parse_args()
+    workload_file(
+        arguments.file, arguments.branches, arguments.loops, arguments.calls, arguments.arrays, arguments.divisions,
+        arguments.parameters, arguments.c
+    )